@@ -59,7 +59,9 @@ class BatchHandler:
         await self._process_individually(event, urls)
     
     async def _handle_existing_profile(self, event, urls: list[str]):
-        entities = getattr(self.config, 'ENTITIES', {})
+        # Loaded here (not by SocialFlowService) so edits to entities.json show up
+        self.config.load_entities()
+        entities = self.config.ENTITIES
         
         if not entities:
             await event.edit("No profiles configured. Processing individually...")
@@ -31,6 +31,7 @@ def show(
                 'TELEGRAM_SESSION_FILE': str(config.TELEGRAM_SESSION_FILE),
                 'BOT_SESSION_FILE': str(config.BOT_SESSION_FILE),
                 'MAX_PARALLEL_DOWNLOADS': config.MAX_PARALLEL_DOWNLOADS,
+                'MAX_PARALLEL_UPLOADS': config.MAX_PARALLEL_UPLOADS,
             }
             console.print(json.dumps(config_dict, indent=2))
         else:
@@ -48,6 +49,7 @@ def show(
                 ("TELEGRAM_SESSION_FILE", config.TELEGRAM_SESSION_FILE, "✓" if config.TELEGRAM_SESSION_FILE.exists() else "✗"),
                 ("BOT_SESSION_FILE", config.BOT_SESSION_FILE, "✓" if config.BOT_SESSION_FILE.exists() else "✗"),
                 ("MAX_PARALLEL_DOWNLOADS", str(config.MAX_PARALLEL_DOWNLOADS), ""),
+                ("MAX_PARALLEL_UPLOADS", str(config.MAX_PARALLEL_UPLOADS), ""),
             ]
             
             for name, value, info in settings:
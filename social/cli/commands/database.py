@@ -157,7 +157,7 @@ async def _check(url: str, platform: Optional[str], session_file: Optional[str])
     
     try:
         # Extract ID from URL
-        video_id = URLIDExtractor.extract_id(url)
+        detected_platform, video_id = URLIDExtractor.extract(url)
         
         if not video_id:
             console.print(f"[red]Error:[/red] Could not extract video ID from URL")
@@ -165,7 +165,7 @@ async def _check(url: str, platform: Optional[str], session_file: Optional[str])
         
         # Detect platform if not provided
         if not platform:
-            platform = URLIDExtractor.detect_platform(url)
+            platform = detected_platform
             if not platform:
                 console.print(f"[red]Error:[/red] Could not detect platform from URL")
                 raise typer.Exit(1)
@@ -109,7 +109,7 @@ def download(
                 
                 # Apply custom cookies if specified
                 if cookies:
-                    platform_obj.cookies = Path(cookies)
+                    platform_obj.set_cookies(Path(cookies))
                 
                 # Apply extra options
                 if metadata or thumbnail:
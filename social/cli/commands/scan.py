@@ -85,60 +85,69 @@ async def _run_scan(group_id: int, limit: int, skip_duplicates: bool):
         skipped = 0
         failed = 0
         
-        for msg in messages:
-            for url in msg['urls']:
-                video_id = URLIDExtractor.extract_id(url)
+        # One SocialFlowService per platform for the whole scan, so its
+        # download threads and their YoutubeDL instances are reused
+        social_flows = {
+            platform_name: SocialFlowService(
+                config,
+                telegram_client=telegram_client,
+                db_service=db_services.get(platform_name)
+            )
+            for platform_name in entities
+        }
+        
+        try:
+            for msg in messages:
+                for url in msg['urls']:
+                    platform, video_id = URLIDExtractor.extract(url)
                 
-                if not video_id:
-                    console.print(f"Skip: no ID - {url}")
-                    continue
+                    if not video_id:
+                        console.print(f"Skip: no ID - {url}")
+                        continue
                 
-                platform = URLIDExtractor.detect_platform(url)
-                if not platform:
-                    console.print(f"Skip: unknown platform - {url}")
-                    continue
+                    if not platform:
+                        console.print(f"Skip: unknown platform - {url}")
+                        continue
                 
-                platform_config = entities.get(platform.lower(), {})
-                entity_id = platform_config.get('group_id')
-                topic_id = platform_config.get('topic_id')
+                    platform_config = entities.get(platform.lower(), {})
+                    entity_id = platform_config.get('group_id')
+                    topic_id = platform_config.get('topic_id')
                 
-                if not entity_id:
-                    console.print(f"Skip: no config for {platform} - {video_id}")
-                    continue
+                    if not entity_id:
+                        console.print(f"Skip: no config for {platform} - {video_id}")
+                        continue
                 
-                # Get db_service for this platform
-                db_service = db_services.get(platform.lower())
+                    # Get db_service for this platform
+                    db_service = db_services.get(platform.lower())
                 
-                # Create SocialFlowService with db_service for duplicate checking
-                social_flow = SocialFlowService(
-                    config, 
-                    telegram_client=telegram_client,
-                    db_service=db_service
-                )
+                    social_flow = social_flows[platform.lower()]
                 
-                console.print(f"Processing: {url}")
-                try:
-                    result = await social_flow.process_video(
-                        url,
-                        telegram_client=telegram_client,
-                        bot_client=bot_client,
-                        entity_id=entity_id,
-                        topic_id=topic_id
-                    )
-                    if result.get('success'):
-                        processed += 1
-                        console.print(f"OK: {video_id}")
-                        if db_service:
-                            db_service.add_id(video_id)
-                    elif result.get('duplicate'):
-                        skipped += 1
-                        console.print(f"Skip: duplicate - {video_id}")
-                    else:
+                    console.print(f"Processing: {url}")
+                    try:
+                        result = await social_flow.process_video(
+                            url,
+                            telegram_client=telegram_client,
+                            bot_client=bot_client,
+                            entity_id=entity_id,
+                            topic_id=topic_id
+                        )
+                        if result.get('success'):
+                            processed += 1
+                            console.print(f"OK: {video_id}")
+                            if db_service:
+                                db_service.add_id(video_id)
+                        elif result.get('duplicate'):
+                            skipped += 1
+                            console.print(f"Skip: duplicate - {video_id}")
+                        else:
+                            failed += 1
+                            console.print(f"FAIL: {video_id}")
+                    except Exception as e:
                         failed += 1
-                        console.print(f"FAIL: {video_id}")
-                except Exception as e:
-                    failed += 1
-                    console.print(f"ERROR: {e}")
+                        console.print(f"ERROR: {e}")
+        finally:
+            for social_flow in social_flows.values():
+                social_flow.close()
         
         for platform, db_service in db_services.items():
             if processed > 0:
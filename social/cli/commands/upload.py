@@ -162,6 +162,7 @@ async def _run_upload(
     # Create clients using centralized config
     telegram_client = TelegramClient(str(session_file), config.TELEGRAM_API_ID, config.TELEGRAM_API_HASH)
     bot_client = TelegramClient(str(bot_session_file), config.TELEGRAM_API_ID, config.TELEGRAM_API_HASH)
+    service = None
     
     try:
         # Connect clients
@@ -215,6 +216,8 @@ async def _run_upload(
             raise typer.Exit(1)
     
     finally:
+        if service is not None:
+            service.close()
         # Disconnect clients
         await telegram_client.disconnect()
         await bot_client.disconnect()
@@ -8,18 +8,32 @@ from social.logger import get_logger
 logger = get_logger(__name__)
 
 def get_env(key: str):
-    return os.getenv(key)
+    return os.environ.get(key)
+
+
+def _env_int(key: str, default: int) -> int:
+    value = os.environ.get(key)
+    return int(value) if value else default
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "social"
+
+
+def default_state_dir() -> Path:
+    """Directorio de estado persistente: STATE_DIR o ~/.cache/social/state."""
+    state_dir_env = os.environ.get("STATE_DIR")
+    return Path(state_dir_env) if state_dir_env else DEFAULT_CACHE_DIR / "state"
 
 class Config:
     def __init__(self, env_file = None):
+        env = os.environ.get
         
         DEFAULT_CONFIG_DIR = Path.home() / ".config" / "social"
-        DEFAULT_CACHE_DIR = Path.home() / ".cache" / "social"
         
         if not env_file:
             env_file = DEFAULT_CONFIG_DIR / ".env"
         load_dotenv(env_file)
-        config_dir_env = os.getenv("CONFIG_DIR")
+        config_dir_env = env("CONFIG_DIR")
         if config_dir_env:
             self.CONFIG_DIR = Path(config_dir_env)
         else:
@@ -32,14 +46,14 @@ class Config:
                 logger.warning(f"CONFIG_DIR not set, using default config directory: {DEFAULT_CONFIG_DIR}")
                 self.CONFIG_DIR = DEFAULT_CONFIG_DIR
 
-        cookies_dir_env = os.getenv("COOKIES_DIR")
+        cookies_dir_env = env("COOKIES_DIR")
         if cookies_dir_env:
             self.COOKIES_DIR = Path(cookies_dir_env)
         else:
             logger.warning(f"COOKIES_DIR not set, using default cookies directory: {self.CONFIG_DIR / "cookies"}")
             self.COOKIES_DIR = self.CONFIG_DIR / "cookies"
             
-        entities_file_env = os.getenv("entities")
+        entities_file_env = env("entities")
         if entities_file_env:
             self.ENTITIES_FILE = Path(entities_file_env)
         else:
@@ -52,44 +66,51 @@ class Config:
                 logger.warning(f"ENTITIES_FILE not set, using default entities file: {self.CONFIG_DIR / "entities.json"}")
                 self.ENTITIES_FILE = self.CONFIG_DIR / "entities.json"
         
-        platforms_file_env = os.getenv("PLATFORMS_FILE")
+        platforms_file_env = env("PLATFORMS_FILE")
         if platforms_file_env:
             self.PLATFORMS_FILE = Path(platforms_file_env)
         else:
             self.PLATFORMS_FILE = self.CONFIG_DIR / "platforms.json"
             
-        downloads_dir_env = os.getenv("DOWNLOADS_DIR")
+        downloads_dir_env = env("DOWNLOADS_DIR")
         if downloads_dir_env:
             self.DOWNLOADS_DIR = Path(downloads_dir_env)
         else:
             logger.warning(f"DOWNLOADS_DIR not set, using default downloads directory: {self.CONFIG_DIR / "downloads"}")
             self.DOWNLOADS_DIR = DEFAULT_CACHE_DIR / "downloads"
         
+        # Estado persistente entre ejecuciones (ej: auto-ajuste de concurrencia)
+        self.STATE_DIR = default_state_dir()
+        
         # Telegram credentials
-        self.TELEGRAM_API_ID = int(os.getenv('TELEGRAM_API_ID', 0))
-        self.TELEGRAM_API_HASH = os.getenv('TELEGRAM_API_HASH', '')
-        self.BOT_TOKEN = os.getenv('BOT_TOKEN', '')
-        self.YOUTUBE_API_KEY = os.getenv('YOUTUBE_API_KEY', '')
+        self.TELEGRAM_API_ID = _env_int('TELEGRAM_API_ID', 0)
+        self.TELEGRAM_API_HASH = env('TELEGRAM_API_HASH', '')
+        self.BOT_TOKEN = env('BOT_TOKEN', '')
+        self.YOUTUBE_API_KEY = env('YOUTUBE_API_KEY', '')
+        # Unidades diarias de la YouTube Data API (10000 por defecto en Google)
+        self.YOUTUBE_DAILY_QUOTA = _env_int('YOUTUBE_DAILY_QUOTA', 10000)
         
         # Telegram sessions directory
         self.SESSIONS_DIR = self.CONFIG_DIR / "sessions"
         
         # Session files - check env vars first, then use centralized defaults
-        telegram_session_env = os.getenv("TELEGRAM_SESSION_FILE")
+        telegram_session_env = env("TELEGRAM_SESSION_FILE")
         if telegram_session_env:
             self.TELEGRAM_SESSION_FILE = Path(telegram_session_env)
         else:
             self.TELEGRAM_SESSION_FILE = self.SESSIONS_DIR / "uploader.session"
         
-        bot_session_env = os.getenv("BOT_SESSION_FILE")
+        bot_session_env = env("BOT_SESSION_FILE")
         if bot_session_env:
             self.BOT_SESSION_FILE = Path(bot_session_env)
         else:
             self.BOT_SESSION_FILE = self.SESSIONS_DIR / "bot.session"
         
         # Parallel downloads configuration
-        self.MAX_PARALLEL_DOWNLOADS = int(os.getenv('MAX_PARALLEL_DOWNLOADS', 5))
+        self.MAX_PARALLEL_DOWNLOADS = _env_int('MAX_PARALLEL_DOWNLOADS', 5)
         logger.info(f"Max parallel downloads set to: {self.MAX_PARALLEL_DOWNLOADS}")
+        # Concurrent Telegram uploads in batch mode (1 = sequential)
+        self.MAX_PARALLEL_UPLOADS = _env_int('MAX_PARALLEL_UPLOADS', 1)
         
         # make all dirs
         self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
@@ -109,30 +130,34 @@ class Config:
         Returns:
             dict con configuración de plataformas o {} si el archivo no existe
         """
-        if self.PLATFORMS_FILE.exists():
-            try:
-                with open(self.PLATFORMS_FILE, "r", encoding="utf-8") as f:
-                    platforms_config = json.load(f)
-                logger.info(f"Platforms config file {self.PLATFORMS_FILE} loaded successfully with {len(platforms_config)} platforms.")
-                return platforms_config
-            except Exception as e:
-                logger.error(f"Error loading platforms config file {self.PLATFORMS_FILE}: {e}")
-                return {}
-        else:
+        try:
+            raw = self.PLATFORMS_FILE.read_bytes()
+        except FileNotFoundError:
             logger.debug(f"Platforms config file {self.PLATFORMS_FILE} not found, using default platform configurations.")
             return {}
+        except OSError as e:
+            logger.error(f"Error reading platforms config file {self.PLATFORMS_FILE}: {e}")
+            return {}
+        try:
+            platforms_config = json.loads(raw)
+            logger.info(f"Platforms config file {self.PLATFORMS_FILE} loaded successfully with {len(platforms_config)} platforms.")
+            return platforms_config
+        except Exception as e:
+            logger.error(f"Error loading platforms config file {self.PLATFORMS_FILE}: {e}")
+            return {}
     
     def load_entities(self):
         """ 
         Load entities telegram groups and topics
         """
-        if self.ENTITIES_FILE.exists():
-            with open(self.ENTITIES_FILE, "r") as f:
-                self.ENTITIES = json.load(f)
-            logger.info(f"Entities file {self.ENTITIES_FILE} loaded successfully with {len(self.ENTITIES)} entities.")
-        else:
+        try:
+            raw = self.ENTITIES_FILE.read_bytes()
+        except FileNotFoundError:
             logger.warning(f"Entities file {self.ENTITIES_FILE} not found, the app will not be able to use entities.")
             self.ENTITIES = {}
+            return
+        self.ENTITIES = json.loads(raw)
+        logger.info(f"Entities file {self.ENTITIES_FILE} loaded successfully with {len(self.ENTITIES)} entities.")
     
     def get_telegram_session_file(self, custom_session: str = None) -> Path:
         """
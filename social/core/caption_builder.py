@@ -1,10 +1,14 @@
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 
 class CaptionFormatter:
     """Base class with shared utilities for caption formatting."""
     
+    __slots__ = ()
+    
     @staticmethod
     def _format_number(num: int) -> str:
         """
@@ -68,17 +72,53 @@ class CaptionFormatter:
                 return formatted.replace('.0B', 'B')
 
 
+@lru_cache(maxsize=4096)
+def _render_video_caption(title: str, video_url: str, creation_date: datetime,
+                          channel_name: str, channel_url: str, likes: Optional[int],
+                          views: Optional[int]) -> str:
+    """Render a video caption; memoized since retries re-render the same video."""
+    # Build the caption
+    caption = f"[{title}]({video_url})\n"
+    
+    # Add date (and time if not midnight)
+    if creation_date.hour == 0 and creation_date.minute == 0:
+        # Only date, no time
+        date_str = creation_date.strftime("%d.%m.%Y")
+        caption += f"📅 {date_str}"
+    else:
+        # Date and time
+        date_time = creation_date.strftime("%d.%m.%Y %H:%M").replace(" 0", " ")
+        caption += f"📅 {date_time}"
+    
+    # Add views if provided (formatted)
+    if views is not None:
+        views_formatted = CaptionFormatter._format_number(views)
+        caption += f" | 👁️ {views_formatted}"
+    
+    # Add likes if provided (formatted)
+    if likes is not None:
+        likes_formatted = CaptionFormatter._format_number(likes)
+        caption += f" | ❤️ {likes_formatted}"
+    
+    caption += "\n"
+    
+    # Add channel info in markdown format
+    caption += f"👤 [{channel_name}]({channel_url})"
+    
+    return caption
+
+
+@dataclass(slots=True)
 class VideoCaptionBuilder(CaptionFormatter):
-    def __init__(self, title: str, video_url: str, creation_date: datetime, 
-                 channel_name: str, channel_url: str, likes: Optional[int] = None, 
-                 views: Optional[int] = None):
-        self.title = title
-        self.video_url = video_url
-        self.creation_date = creation_date
-        self.channel_name = channel_name
-        self.channel_url = channel_url
-        self.likes = likes
-        self.views = views
+    """Builder for video captions."""
+    
+    title: str
+    video_url: str
+    creation_date: datetime
+    channel_name: str
+    channel_url: str
+    likes: Optional[int] = None
+    views: Optional[int] = None
     
     def build_caption(self) -> str:
         """
@@ -93,72 +133,48 @@ class VideoCaptionBuilder(CaptionFormatter):
             👤 [Channel Name](https://youtube.com/@username)
         """
         
-        # Build the caption
-        caption = f"[{self.title}]({self.video_url})\n"
-        
-        # Add date (and time if not midnight)
-        if self.creation_date.hour == 0 and self.creation_date.minute == 0:
-            # Only date, no time
-            date_str = self.creation_date.strftime("%d.%m.%Y")
-            caption += f"📅 {date_str}"
-        else:
-            # Date and time
-            date_time = self.creation_date.strftime("%d.%m.%Y %H:%M").replace(" 0", " ")
-            caption += f"📅 {date_time}"
-        
-        # Add views if provided (formatted)
-        if self.views is not None:
-            views_formatted = self._format_number(self.views)
-            caption += f" | 👁️ {views_formatted}"
-        
-        # Add likes if provided (formatted)
-        if self.likes is not None:
-            likes_formatted = self._format_number(self.likes)
-            caption += f" | ❤️ {likes_formatted}"
-        
-        caption += "\n"
-        
-        # Add channel info in markdown format
-        caption += f"👤 [{self.channel_name}]({self.channel_url})"
-        
-        return caption
+        # Seconds never reach the caption, so drop them to share cache entries
+        return _render_video_caption(
+            self.title,
+            self.video_url,
+            self.creation_date.replace(second=0, microsecond=0),
+            self.channel_name,
+            self.channel_url,
+            self.likes,
+            self.views,
+        )
 
 
+@dataclass(slots=True)
 class ChannelCaptionBuilder(CaptionFormatter):
-    """Builder for channel information captions."""
+    """
+    Builder for channel information captions.
     
-    def __init__(self, channel_name: str, channel_url: str, username: Optional[str] = None,
-                 uploader_url: Optional[str] = None, channel_follower_count: Optional[int] = None,
-                 video_count: Optional[int] = None, view_count: Optional[int] = None,
-                 location: Optional[str] = None, channel_created: Optional[int] = None,
-                 description: Optional[str] = None, avatar: Optional[str] = None):
-        """
-        Initialize ChannelCaptionBuilder with channel information.
-        
-        Args:
-            channel_name: Name of the channel
-            channel_url: URL of the channel
-            username: Username/handle of the channel (e.g., @username)
-            uploader_url: URL for the uploader (used for username link)
-            channel_follower_count: Number of subscribers/followers
-            video_count: Total number of videos
-            view_count: Total view count of the channel
-            location: Country/location of the channel
-            channel_created: Unix timestamp of channel creation date
-            description: Channel description
-            avatar: Avatar/profile picture URL
-        """
-        self.channel_name = channel_name
-        self.channel_url = channel_url
-        self.username = username
-        self.uploader_url = uploader_url
-        self.channel_follower_count = channel_follower_count
-        self.video_count = video_count
-        self.view_count = view_count
-        self.location = location
-        self.channel_created = channel_created
-        self.description = description
-        self.avatar = avatar
+    Attributes:
+        channel_name: Name of the channel
+        channel_url: URL of the channel
+        username: Username/handle of the channel (e.g., @username)
+        uploader_url: URL for the uploader (used for username link)
+        channel_follower_count: Number of subscribers/followers
+        video_count: Total number of videos
+        view_count: Total view count of the channel
+        location: Country/location of the channel
+        channel_created: Unix timestamp of channel creation date
+        description: Channel description
+        avatar: Avatar/profile picture URL
+    """
+    
+    channel_name: str
+    channel_url: str
+    username: Optional[str] = None
+    uploader_url: Optional[str] = None
+    channel_follower_count: Optional[int] = None
+    video_count: Optional[int] = None
+    view_count: Optional[int] = None
+    location: Optional[str] = None
+    channel_created: Optional[int] = None
+    description: Optional[str] = None
+    avatar: Optional[str] = None
     
     def build_caption(self) -> str:
         """
@@ -0,0 +1,118 @@
+"""Auto-ajuste de concurrent_fragment_downloads según el throughput medido."""
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from social.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ConcurrencyTuner:
+    """
+    Controlador AIMD para el número de fragmentos descargados en paralelo.
+
+    Empieza con un valor bajo y lo incrementa mientras el throughput medido
+    (EWMA) siga creciendo; ante errores o stalls reduce a la mitad. El estado
+    por plataforma se persiste en un JSON para reutilizarlo entre ejecuciones.
+    """
+
+    MIN_CONCURRENCY = 2
+    MAX_CONCURRENCY = 32
+    START_CONCURRENCY = 4
+    STEP = 2
+    ALPHA = 0.3        # Peso de la última medida en la EWMA
+    TOLERANCE = 0.05   # Variación relativa considerada "sin cambios"
+
+    def __init__(self, state_file: Optional[Path] = None):
+        """
+        Args:
+            state_file: JSON donde persistir el estado (None = solo en memoria)
+        """
+        self.state_file = state_file
+        self._lock = threading.RLock()
+        self._state: Dict[str, Dict[str, float]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, float]]:
+        if self.state_file is None:
+            return {}
+        try:
+            return json.loads(self.state_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (ValueError, OSError) as e:
+            logger.warning(f"Could not read concurrency state from {self.state_file}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        if self.state_file is None:
+            return
+        # Se escribe a un temporal que se renombra, para que una descarga que
+        # termina en otro hilo nunca deje el JSON a medias
+        with self._lock:
+            data = json.dumps(self._state)
+            try:
+                self.state_file.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(
+                    dir=self.state_file.parent, prefix=self.state_file.name, suffix='.tmp'
+                )
+                try:
+                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                        f.write(data)
+                    os.replace(tmp, self.state_file)
+                except BaseException:
+                    os.unlink(tmp)
+                    raise
+            except OSError as e:
+                logger.warning(f"Could not persist concurrency state to {self.state_file}: {e}")
+
+    def suggest(
+        self,
+        platform_name: str,
+        last_throughput_mbps: Optional[float] = None,
+        last_errors: int = 0
+    ) -> int:
+        """
+        Sugiere la concurrencia para la próxima descarga.
+
+        Sin medida (last_throughput_mbps=None y sin errores) devuelve el valor
+        persistido o el inicial, sin modificar el estado.
+
+        Args:
+            platform_name: Nombre de la plataforma (clave del estado)
+            last_throughput_mbps: Throughput de la última descarga en Mbps
+            last_errors: Errores/timeouts en la última descarga
+
+        Returns:
+            Número de fragmentos concurrentes a usar
+        """
+        with self._lock:
+            entry = self._state.get(platform_name)
+            current = int(entry['concurrency']) if entry else self.START_CONCURRENCY
+
+            if last_throughput_mbps is None and not last_errors:
+                return current
+
+            ewma = entry.get('ewma') if entry else None
+
+            if last_errors:
+                current = max(self.MIN_CONCURRENCY, current // 2)
+            elif last_throughput_mbps is not None:
+                if ewma is None or last_throughput_mbps > ewma * (1 + self.TOLERANCE):
+                    current = min(self.MAX_CONCURRENCY, current + self.STEP)
+                elif last_throughput_mbps < ewma * (1 - self.TOLERANCE):
+                    current = max(self.MIN_CONCURRENCY, current - self.STEP)
+
+            if last_throughput_mbps is not None:
+                ewma = last_throughput_mbps if ewma is None else (
+                    self.ALPHA * last_throughput_mbps + (1 - self.ALPHA) * ewma
+                )
+
+            self._state[platform_name] = {'concurrency': current, 'ewma': ewma}
+            self._save()
+
+        logger.debug(f"Concurrency for {platform_name}: {current} (ewma={ewma})")
+        return current
@@ -4,22 +4,28 @@ This module provides a clean abstraction for resolving Telegram entity_id and to
 based on platform and content type, following SOLID principles.
 """
 from abc import ABC, abstractmethod
-from enum import Enum
+from enum import IntEnum
 from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
+from types import MappingProxyType
 import json
+import threading
 
 from social.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class ContentType(Enum):
-    """Content type classification."""
-    VIDEO = "video"
-    SHORT = "short"
-    CLIP = "clip"
+class ContentType(IntEnum):
+    """Content type classification.
     
+    Values are contiguous indexes so they can address EntityConfig's
+    precomputed topic table directly.
+    """
+    VIDEO = 0
+    SHORT = 1
+    CLIP = 2
+
 
 class EntityConfig:
     """Configuration for a platform's entity and topics."""
@@ -33,7 +39,16 @@ class EntityConfig:
             topics: Dictionary mapping content types to topic IDs
         """
         self.group_id = group_id
-        self.topics = topics
+        # Read-only view: topics are fixed once the config is loaded
+        self.topics = MappingProxyType(dict(topics))
+        # Topic IDs indexed by ContentType (clips go to shorts topic)
+        self._topic_ids = (
+            self.topics.get("videos"),
+            self.topics.get("shorts"),
+            self.topics.get("shorts"),
+        )
+        # Fallback topic when a content type has none configured
+        self.default_topic_id = self.topics.get("videos", 1)
     
     def get_topic_id(self, content_type: ContentType) -> Optional[int]:
         """
@@ -45,15 +60,7 @@ class EntityConfig:
         Returns:
             Topic ID or None if not configured
         """
-        # Map content type to topic key
-        type_mapping = {
-            ContentType.VIDEO: "videos",
-            ContentType.SHORT: "shorts",
-            ContentType.CLIP: "shorts",  # Clips go to shorts topic
-        }
-        
-        topic_key = type_mapping.get(content_type, "videos")
-        return self.topics.get(topic_key)
+        return self._topic_ids[content_type]
 
 
 class IEntityResolver(ABC):
@@ -103,17 +110,21 @@ class EntityResolver(IEntityResolver):
         topic_id = self.entity_config.get_topic_id(content_type)
         
         if topic_id is None:
-            logger.warning(f"No topic configured for content type: {content_type.value}")
-            # Fallback to default topic (1) or first available topic
-            topic_id = self.entity_config.topics.get("videos", 1)
+            logger.warning(f"No topic configured for content type: {content_type.name.lower()}")
+            # Fallback to videos topic or default topic (1)
+            topic_id = self.entity_config.default_topic_id
         
-        logger.debug(f"Resolved entity_id={entity_id}, topic_id={topic_id} for {content_type.value}")
+        logger.debug(f"Resolved entity_id={entity_id}, topic_id={topic_id} for {content_type.name.lower()}")
         return entity_id, topic_id
 
 
 class EntityResolverFactory:
     """Factory for creating entity resolvers per platform."""
     
+    # Factories shared by entities file (see shared())
+    _shared: Dict[Path, "EntityResolverFactory"] = {}
+    _shared_lock = threading.Lock()
+    
     def __init__(self, entities_file: Path):
         """
         Initialize factory with entities configuration file.
@@ -123,17 +134,63 @@ class EntityResolverFactory:
         """
         self.entities_file = entities_file
         self._configs: Dict[str, EntityConfig] = {}
+        # Resolvers already built, by lowercased platform name
+        self._resolvers: Dict[str, IEntityResolver] = {}
+        # mtime of the file when it was last loaded (None if it didn't exist)
+        self._loaded_mtime_ns: Optional[int] = None
         self._load_configs()
     
+    @classmethod
+    def shared(cls, entities_file: Path) -> "EntityResolverFactory":
+        """
+        Get the factory shared by every caller using this entities file.
+        
+        The file is parsed once; later calls only stat it and reload the
+        configuration if it changed on disk.
+        
+        Args:
+            entities_file: Path to entities.json configuration file
+            
+        Returns:
+            Shared factory for the file
+        """
+        key = Path(entities_file)
+        with cls._shared_lock:
+            factory = cls._shared.get(key)
+            if factory is None:
+                factory = cls._shared[key] = cls(key)
+            else:
+                factory.reload_if_changed()
+        return factory
+    
+    def _file_mtime_ns(self) -> Optional[int]:
+        try:
+            return self.entities_file.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def reload_if_changed(self) -> bool:
+        """Reload configurations if the entities file changed since it was loaded."""
+        if self._file_mtime_ns() == self._loaded_mtime_ns:
+            return False
+        logger.info(f"Entities file changed, reloading: {self.entities_file}")
+        self.reload()
+        return True
+    
     def _load_configs(self):
         """Load entity configurations from file."""
-        if not self.entities_file.exists():
+        self._loaded_mtime_ns = self._file_mtime_ns()
+        try:
+            raw = self.entities_file.read_bytes()
+        except FileNotFoundError:
             logger.warning(f"Entities file not found: {self.entities_file}")
             return
+        except OSError as e:
+            logger.error(f"Error reading entities file {self.entities_file}: {e}")
+            return
         
         try:
-            with open(self.entities_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = json.loads(raw)
             
             for platform_name, config_data in data.items():
                 group_id = config_data.get('group_id')
@@ -156,15 +213,22 @@ class EntityResolverFactory:
         Returns:
             Entity resolver for the platform
         """
-        entity_config = self._configs.get(platform_name.lower())
+        key = platform_name.lower()
+        resolver = self._resolvers.get(key)
+        if resolver is not None:
+            return resolver
+        
+        entity_config = self._configs.get(key)
         
         if not entity_config:
             logger.warning(f"No entity configuration found for platform: {platform_name}")
         
-        return EntityResolver(entity_config)
+        resolver = self._resolvers[key] = EntityResolver(entity_config)
+        return resolver
     
     def reload(self):
         """Reload configurations from file."""
         self._configs.clear()
+        self._resolvers.clear()
         self._load_configs()
 
@@ -0,0 +1,91 @@
+"""Limitador de peticiones y contador de cuota diaria para la YouTube Data API."""
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from social.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    _PACIFIC = ZoneInfo("America/Los_Angeles")
+except ZoneInfoNotFoundError:  # Sin base de datos tz (ej: Windows sin tzdata)
+    _PACIFIC = timezone(timedelta(hours=-8))
+
+
+def _next_pt_midnight(now: Optional[float] = None) -> float:
+    """Timestamp Unix de la próxima medianoche en hora del Pacífico (reset de cuota)."""
+    current = datetime.fromtimestamp(time.time() if now is None else now, _PACIFIC)
+    midnight = datetime.combine(current.date() + timedelta(days=1), datetime.min.time(), _PACIFIC)
+    return midnight.timestamp()
+
+
+class QuotaExceededError(RuntimeError):
+    """La cuota diaria de la API se ha agotado hasta el próximo reset."""
+
+
+class QuotaBucket:
+    """
+    Token bucket para ráfagas más contador de la cuota diaria de la API.
+
+    consume() espera lo necesario para no superar `rate` peticiones por segundo
+    (con ráfagas de hasta `burst`) y descuenta `cost` unidades de la cuota
+    diaria; si no quedan unidades lanza QuotaExceededError sin llegar a hacer
+    la petición. La cuota se reinicia a medianoche hora del Pacífico, igual
+    que la de Google.
+    """
+
+    DEFAULT_DAILY_QUOTA = 10000
+
+    def __init__(self, daily: int = DEFAULT_DAILY_QUOTA, rate: float = 5.0, burst: int = 10):
+        """
+        Args:
+            daily: Unidades de cuota disponibles por día
+            rate: Peticiones por segundo sostenidas
+            burst: Peticiones que pueden salir seguidas sin esperar
+        """
+        self.daily = daily
+        self.rate = rate
+        self.burst = burst
+        self.remaining = daily
+        self.reset_at = _next_pt_midnight()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, cost: int) -> float:
+        """Descuenta la cuota y reserva tokens; devuelve los segundos a esperar."""
+        with self._lock:
+            if time.time() >= self.reset_at:
+                self.remaining = self.daily
+                self.reset_at = _next_pt_midnight()
+            if self.remaining < cost:
+                raise QuotaExceededError(
+                    f"YouTube API daily quota exhausted ({self.daily} units), "
+                    f"resets at {datetime.fromtimestamp(self.reset_at, _PACIFIC).isoformat()}"
+                )
+            self.remaining -= cost
+
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= cost
+            # Con saldo negativo, esperar a que se repongan los tokens reservados
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def consume(self, cost: int = 1) -> None:
+        """Reserva `cost` unidades, durmiendo si hace falta respetar el ritmo."""
+        delay = self._reserve(cost)
+        if delay:
+            logger.debug(f"Rate limiting YouTube API call for {delay:.2f}s")
+            time.sleep(delay)
+
+    async def aconsume(self, cost: int = 1) -> None:
+        """Async variant of consume() that waits without blocking the event loop."""
+        delay = self._reserve(cost)
+        if delay:
+            logger.debug(f"Rate limiting YouTube API call for {delay:.2f}s")
+            await asyncio.sleep(delay)
@@ -0,0 +1,77 @@
+"""Instancias de YoutubeDL reutilizables, una por hilo."""
+import threading
+import weakref
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from yt_dlp import YoutubeDL
+
+
+class _ThreadYDLs:
+    """YoutubeDL de un hilo por clave; se cierran cuando el hilo termina."""
+
+    def __init__(self):
+        self.by_key: Dict[Hashable, Tuple[Dict[str, Any], YoutubeDL]] = {}
+
+    def close_all(self) -> None:
+        for _, ydl in list(self.by_key.values()):
+            ydl.close()
+        self.by_key.clear()
+
+    def __del__(self):
+        # threading.local suelta este objeto al terminar el hilo
+        self.close_all()
+
+
+class ThreadLocalYDL:
+    """
+    Reparte YoutubeDL por hilo (YoutubeDL no es thread-safe).
+
+    Cada hilo guarda sus instancias en un threading.local, de modo que un
+    hilo nuevo nunca hereda la de otro aunque reutilice su ident, y las de
+    un hilo que termina se cierran al liberarse. close() cierra las de
+    todos los hilos vivos.
+    """
+
+    def __init__(self, on_create: Optional[Callable[[YoutubeDL], bool]] = None):
+        """
+        Args:
+            on_create: Callback que prepara cada YoutubeDL nuevo; si devuelve
+                False la instancia se cierra y get() devuelve None
+        """
+        self._local = threading.local()
+        self._all: "weakref.WeakSet[_ThreadYDLs]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._on_create = on_create
+
+    def get(self, key: Hashable, ydl_opts: Dict[str, Any]) -> Optional[YoutubeDL]:
+        """
+        Devuelve el YoutubeDL del hilo actual para `key`.
+
+        Si las opciones cambiaron desde que se creó, se cierra y se crea otro.
+        """
+        ydls = getattr(self._local, 'ydls', None)
+        if ydls is None:
+            ydls = self._local.ydls = _ThreadYDLs()
+            with self._lock:
+                self._all.add(ydls)
+
+        cached = ydls.by_key.get(key)
+        if cached is not None:
+            if cached[0] == ydl_opts:
+                return cached[1]
+            cached[1].close()
+            del ydls.by_key[key]
+        # Copia: YoutubeDL conserva y modifica el dict de opciones que recibe
+        ydl = YoutubeDL(dict(ydl_opts))
+        if self._on_create is not None and not self._on_create(ydl):
+            ydl.close()
+            return None
+        ydls.by_key[key] = (ydl_opts, ydl)
+        return ydl
+
+    def close(self) -> None:
+        """Cierra los YoutubeDL de todos los hilos (guarda sus cookies)."""
+        with self._lock:
+            all_ydls = list(self._all)
+        for ydls in all_ydls:
+            ydls.close_all()
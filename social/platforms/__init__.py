@@ -5,6 +5,7 @@ from .tiktok import TikTokPlatform
 from .base import Platform
 from social.config import Config
 from social.logger import get_logger
+from typing import Dict
 
 logger = get_logger(__name__)
 
@@ -57,6 +58,28 @@ def load_platforms(config: Config) -> dict:
     return platforms
 
 
+
+def get_platforms(config: Config) -> Dict[str, Platform]:
+    """
+    Devuelve las plataformas de una Config, cargándolas solo la primera vez.
+    
+    Los servicios que comparten Config comparten así las mismas instancias
+    (y sus sesiones HTTP, cachés, etc.) en lugar de reconstruirlas. Se
+    guardan en la propia Config: el ciclo Config <-> Platform lo recoge el
+    recolector de basura cuando ya nadie usa la Config.
+    
+    Args:
+        config: Instancia de Config
+        
+    Returns:
+        dict con instancias de plataformas {extractor_name: Platform}
+    """
+    platforms = getattr(config, '_platforms', None)
+    if platforms is None:
+        platforms = config._platforms = load_platforms(config)
+    return platforms
+
+
 __all__ = [
     'Platform',
     'YouTubePlatform',
@@ -66,4 +89,5 @@ __all__ = [
     'EXTRACTOR_TO_PLATFORM',
     'DEFAULT_PLATFORM_CLASS',
     'load_platforms',
+    'get_platforms',
 ]
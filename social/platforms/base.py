@@ -1,12 +1,26 @@
+import asyncio
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
 from datetime import datetime
+from calendar import monthrange
 from social.config import Config
 from social.logger import get_logger
 from social.core.caption_builder import CaptionBuilder
 
 logger = get_logger(__name__)
 
+
+def _parse_yyyymmdd(value: Any) -> Optional[datetime]:
+    """Parses a fixed YYYYMMDD string without going through strptime."""
+    # isdigit() alone accepts non-ASCII digits such as '²' that int() rejects
+    if not isinstance(value, str) or len(value) != 8 or not (value.isascii() and value.isdigit()):
+        return None
+    year, month, day = int(value[0:4]), int(value[4:6]), int(value[6:8])
+    if not (year and 1 <= month <= 12 and 1 <= day <= monthrange(year, month)[1]):
+        return None
+    return datetime(year, month, day)
+
+
 class Platform:
     """Clase base para configuración de plataformas de video.
     
@@ -14,7 +28,16 @@ class Platform:
     por plataforma. yt-dlp ya maneja la detección y extracción de URLs automáticamente.
     """
     
+    # Sin __dict__ por instancia: las subclases declaran sus propios slots
+    __slots__ = (
+        'name', 'global_config', 'format', 'cookies', 'download_dir', 'extra_opts',
+        '_cookies_exists', '_outtmpl', '_cookies_str', '_dir_ready',
+    )
+    
     DEFAULT_FORMAT = "best"
+    
+    # Argumentos de aria2c para descargas progresivas: varias conexiones por rango
+    ARIA2C_ARGS = ['-x', '16', '-s', '16', '-k', '1M']
 
     def __init__(self, name: str, config: dict = None, global_config: Config = None):
         """
@@ -48,11 +71,18 @@ class Platform:
         else:
             self.download_dir = Path("downloads") / self.name
         
-        self.download_dir = Path(self.download_dir)
-        self.download_dir.mkdir(parents=True, exist_ok=True)
+        # El directorio se crea en el primer uso (ver _ensure_download_dir)
+        self._dir_ready = False
         
         # Opciones adicionales específicas de la plataforma
         self.extra_opts = config.get("extra_opts", {})
+        
+        # Existencia del archivo de cookies (se resuelve en el primer uso)
+        self._cookies_exists: Optional[bool] = None
+        
+        # Rutas inmutables precalculadas como str para get_ydl_opts
+        self._outtmpl = str(self.download_dir / '%(id)s.%(ext)s')
+        self._cookies_str = str(self.cookies)
 
     def get_ydl_opts(self) -> Dict[str, Any]:
         """
@@ -61,28 +91,84 @@ class Platform:
         Returns:
             Diccionario de opciones de yt-dlp
         """
-        opts = {
-            'format': self.format,
-            'outtmpl': str(self.download_dir / '%(id)s.%(ext)s'),
-            'merge_output_format': 'mp4',
-        }
+        self._ensure_download_dir()
         
         # Agregar cookies si el archivo existe
-        if self.cookies.exists():
-            opts['cookiefile'] = str(self.cookies)
+        has_cookies = self.has_cookies()
+        if has_cookies:
             logger.debug(f"Usando archivo de cookies: {self.cookies}")
         else:
             logger.debug(f"Archivo de cookies no encontrado: {self.cookies}")
         
-        # Combinar con opciones adicionales (extra_opts tienen prioridad)
-        opts.update(self.extra_opts)
+        # Un solo literal: extra_opts al final para que tengan prioridad
+        return {
+            'format': self.format,
+            'outtmpl': self._outtmpl,
+            'merge_output_format': 'mp4',
+            **({'cookiefile': self._cookies_str} if has_cookies else {}),
+            **self.extra_opts,
+        }
+    
+    def _enable_aria2c(self) -> None:
+        """
+        Delega la descarga en aria2c con varias conexiones por archivo.
+        
+        Útil en streams progresivos donde el servidor limita la velocidad por
+        conexión; extra_opts explícitas del usuario tienen prioridad.
+        """
+        self.extra_opts.setdefault('external_downloader', 'aria2c')
+        self.extra_opts.setdefault('external_downloader_args', {'aria2c': list(self.ARIA2C_ARGS)})
+    
+    def has_cookies(self) -> bool:
+        """
+        Indica si el archivo de cookies existe.
         
-        return opts
+        El resultado se cachea tras la primera comprobación para no repetir
+        el stat() en cada descarga; usar refresh_cookies() para invalidarlo.
+        """
+        if self._cookies_exists is None:
+            self._cookies_exists = self.cookies.exists()
+        return self._cookies_exists
+    
+    def refresh_cookies(self) -> None:
+        """Invalida la comprobación cacheada del archivo de cookies."""
+        self._cookies_exists = None
+    
+    def set_cookies(self, cookies: Path) -> None:
+        """Cambia el archivo de cookies de la plataforma."""
+        self.cookies = Path(cookies)
+        self._cookies_str = str(self.cookies)
+        self.refresh_cookies()
+    
+    def record_download(
+        self,
+        info: Optional[Dict[str, Any]],
+        elapsed: float,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """
+        Notifica el resultado de una descarga (hook para auto-ajuste).
+        
+        Args:
+            info: info_dict devuelto por yt-dlp (None si falló)
+            elapsed: Segundos que tardó la descarga
+            error: Excepción que lanzó la descarga, si falló
+        """
+    
+    def close(self) -> None:
+        """Libera los recursos que la plataforma mantenga abiertos."""
     
     def get_download_dir(self) -> Path:
         """Obtiene el directorio de descarga para esta plataforma."""
+        self._ensure_download_dir()
         return self.download_dir
     
+    def _ensure_download_dir(self) -> None:
+        """Crea el directorio de descarga la primera vez que se necesita."""
+        if not self._dir_ready:
+            self.download_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+    
     def get_cookies_path(self) -> Path:
         """Obtiene la ruta del archivo de cookies para esta plataforma."""
         return self.cookies
@@ -101,27 +187,42 @@ class Platform:
             CaptionBuilder instance with mapped fields
         """
         # Base implementation using common fields
-        title = info_dict.get('title') or ''
-        video_url = info_dict.get('webpage_url') or ''
+        return self._build_caption(info_dict)
+    
+    @staticmethod
+    def _default_channel_url(info_dict: Dict[str, Any]) -> str:
+        """Channel URL from the common yt-dlp fields (uploader_url, then channel_url)."""
+        return info_dict.get('uploader_url') or info_dict.get('channel_url') or ''
+    
+    def _build_caption(
+        self,
+        info_dict: Dict[str, Any],
+        channel_url_resolver: Optional[Callable[[Dict[str, Any]], str]] = None,
+        channel_name: Optional[str] = None
+    ) -> CaptionBuilder:
+        """
+        Builds a CaptionBuilder from the fields shared by every platform.
         
-        # Parse creation date
-        creation_date = self._parse_creation_date(info_dict)
+        Args:
+            info_dict: Dictionary with information extracted by yt-dlp
+            channel_url_resolver: Platform-specific callable returning the channel URL
+            channel_name: Overrides the default channel/uploader name lookup
+        """
+        get = info_dict.get
+        resolver = channel_url_resolver or self._default_channel_url
         
         # Try to get channel info (prefer channel over uploader)
-        channel_name = info_dict.get('channel') or info_dict.get('uploader') or ''
-        channel_url = info_dict.get('uploader_url') or info_dict.get('channel_url') or ''
-        
-        views = info_dict.get('view_count')
-        likes = info_dict.get('like_count')
+        if channel_name is None:
+            channel_name = get('channel') or get('uploader') or ''
         
         return CaptionBuilder(
-            title=title,
-            video_url=video_url,
-            creation_date=creation_date,
+            title=get('title') or '',
+            video_url=get('webpage_url') or '',
+            creation_date=self._parse_creation_date(info_dict),
             channel_name=channel_name,
-            channel_url=channel_url,
-            likes=likes,
-            views=views
+            channel_url=resolver(info_dict) or '',
+            likes=get('like_count'),
+            views=get('view_count')
         )
     
     def _parse_creation_date(self, info_dict: Dict[str, Any]) -> datetime:
@@ -130,29 +231,19 @@ class Platform:
         
         Tries to use timestamp, upload_date, or release_date.
         """
-        # Try timestamp first
+        # Try timestamp first (bool is an int subclass, but never a timestamp)
         timestamp = info_dict.get('timestamp')
-        if timestamp:
+        if isinstance(timestamp, (int, float)) and not isinstance(timestamp, bool) and timestamp > 0:
             try:
                 return datetime.fromtimestamp(timestamp)
-            except (ValueError, TypeError, OSError):
+            except (OverflowError, OSError, ValueError):
+                # Beyond what the platform's time functions can represent
                 pass
         
-        # Try upload_date (format YYYYMMDD)
-        upload_date = info_dict.get('upload_date')
-        if upload_date:
-            try:
-                return datetime.strptime(upload_date, '%Y%m%d')
-            except (ValueError, TypeError):
-                pass
-        
-        # Try release_date
-        release_date = info_dict.get('release_date')
-        if release_date:
-            try:
-                return datetime.strptime(release_date, '%Y%m%d')
-            except (ValueError, TypeError):
-                pass
+        # Try upload_date, then release_date (format YYYYMMDD)
+        parsed = _parse_yyyymmdd(info_dict.get('upload_date')) or _parse_yyyymmdd(info_dict.get('release_date'))
+        if parsed:
+            return parsed
         
         # If no date found, use current date
         logger.warning(f"Could not get creation date for {info_dict.get('id', 'unknown')}, using current date")
@@ -190,4 +281,27 @@ class Platform:
             NotImplementedError: If platform doesn't implement this method
         """
         raise NotImplementedError(f"Platform {self.name} must implement get_channel_info")
+    
+    async def aget_channel_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Async variant of get_channel_info().
+        
+        Runs get_channel_info() in a worker thread by default; platforms with
+        a native async implementation override it.
+        """
+        return await asyncio.to_thread(self.get_channel_info, url)
+    
+    async def aget_channels_info_bulk(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract channel info for several URLs.
+        
+        Runs aget_channel_info() concurrently for each URL by default;
+        platforms that can batch requests override it.
+        
+        Returns:
+            Dictionary {url: channel info}; URLs that could not be resolved
+            are omitted
+        """
+        results = await asyncio.gather(*(self.aget_channel_info(url) for url in urls))
+        return {url: info for url, info in zip(urls, results) if info}
 
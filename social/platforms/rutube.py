@@ -1,5 +1,47 @@
+from typing import Any, Dict, List, Optional
+
+from yt_dlp.networking.exceptions import TransportError
+from yt_dlp.utils import ExtractorError
+
 from social.platforms.base import Platform
-from social.core.caption_builder import CaptionBuilder
+from social.core.concurrency_tuner import ConcurrencyTuner
+
+
+def _downloaded_bytes(info: Dict[str, Any]) -> int:
+    """Bytes descargados según el info_dict de yt-dlp (0 si no se conocen)."""
+    downloads = info.get('requested_downloads') or [info]
+    return sum(d.get('filesize') or d.get('filesize_approx') or 0 for d in downloads)
+
+
+def _error_chain(error: BaseException) -> List[BaseException]:
+    """El error y sus causas (exc_info de yt-dlp, __cause__ y __context__)."""
+    chain: List[BaseException] = []
+    pending = [error]
+    while pending:
+        e = pending.pop()
+        if e is None or any(e is seen for seen in chain):
+            continue
+        chain.append(e)
+        exc_info = getattr(e, 'exc_info', None)
+        pending += [exc_info[1] if exc_info else None, e.__cause__, e.__context__]
+    return chain
+
+
+def _is_transfer_failure(error: BaseException) -> bool:
+    """
+    True si la descarga falló por la red al transferir (timeouts, fragmentos).
+    
+    Los errores del extractor (vídeo privado, eliminado, geo-bloqueado...)
+    no dicen nada de la concurrencia y devuelven False.
+    """
+    chain = _error_chain(error)
+    if any(isinstance(e, ExtractorError) for e in chain):
+        return False
+    if any(isinstance(e, (TimeoutError, TransportError)) for e in chain):
+        return True
+    # Los fallos de fragmentos llegan como DownloadError sin causa
+    return 'fragment' in str(error).lower()
+
 
 class RutubePlatform(Platform):
     """Configuración para Rutube.
@@ -8,27 +50,61 @@ class RutubePlatform(Platform):
     Soporta descarga paralela de fragmentos para mejor velocidad.
     """
     
+    __slots__ = ('_tuner',)
+    
     DEFAULT_CONCURRENT_FRAGMENTS = 20
     
     def __init__(self, name: str = "rutube", config: dict = None, global_config=None):
         super().__init__(name, config, global_config)
         
-        # Configurar descarga paralela de fragmentos
-        concurrent = config.get("concurrent_fragment_downloads", self.DEFAULT_CONCURRENT_FRAGMENTS) if config else self.DEFAULT_CONCURRENT_FRAGMENTS
+        # Configurar descarga paralela de fragmentos: un valor explícito en la
+        # configuración se respeta; si no, lo ajusta el tuner con el histórico
+        self._tuner: Optional[ConcurrencyTuner] = None
+        if config and "concurrent_fragment_downloads" in config:
+            concurrent = config["concurrent_fragment_downloads"]
+        elif global_config is not None:
+            self._tuner = ConcurrencyTuner(global_config.STATE_DIR / "concurrency.json")
+            concurrent = self._tuner.suggest(self.name)
+        else:
+            concurrent = self.DEFAULT_CONCURRENT_FRAGMENTS
         
         if not self.extra_opts:
             self.extra_opts = {}
         
         self.extra_opts['concurrent_fragment_downloads'] = concurrent
+        
+        # Descargas progresivas con aria2c (opt-in: requiere aria2c instalado)
+        if config and config.get("aria2c"):
+            self._enable_aria2c()
+    
+    def record_download(
+        self,
+        info: Optional[Dict[str, Any]],
+        elapsed: float,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """Alimenta el tuner con el throughput de la última descarga."""
+        if self._tuner is None:
+            return
+        # Solo los fallos de transferencia indican demasiada concurrencia
+        failed = error is not None and _is_transfer_failure(error)
+        if error is not None and not failed:
+            return
+        throughput = None
+        size = _downloaded_bytes(info) if info else 0
+        if size and elapsed > 0:
+            throughput = size * 8 / 1_000_000 / elapsed
+        self.extra_opts['concurrent_fragment_downloads'] = self._tuner.suggest(
+            self.name, throughput, 1 if failed else 0
+        )
     
     def create_caption(self, info_dict):
         """Create caption for Rutube videos, constructing channel URL from uploader_id."""
-        title = info_dict.get('title') or ''
-        video_url = info_dict.get('webpage_url') or ''
-        
-        creation_date = self._parse_creation_date(info_dict)
-        
-        channel_name = info_dict.get('channel') or info_dict.get('uploader') or ''
+        return self._build_caption(info_dict, self._rutube_channel_url)
+    
+    @staticmethod
+    def _rutube_channel_url(info_dict: Dict[str, Any]) -> str:
+        """Channel URL from yt-dlp fields, or built from uploader_id."""
         channel_url = info_dict.get('channel_url') or info_dict.get('uploader_url')
         
         # Construir URL del canal si no existe usando uploader_id
@@ -37,16 +113,5 @@ class RutubePlatform(Platform):
             if uploader_id:
                 channel_url = f"https://rutube.ru/channel/{uploader_id}/"
         
-        views = info_dict.get('view_count')
-        likes = info_dict.get('like_count')
-        
-        return CaptionBuilder(
-            title=title,
-            video_url=video_url,
-            creation_date=creation_date,
-            channel_name=channel_name,
-            channel_url=channel_url or '',
-            likes=likes,
-            views=views
-        )
+        return channel_url or ''
 
@@ -1,22 +1,190 @@
 from social.platforms.base import Platform
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from collections import OrderedDict
 from yt_dlp import YoutubeDL
+from http.cookiejar import LoadError, MozillaCookieJar
+import asyncio
+import httpx
 import json
 import re
-from pathlib import Path
+import threading
+from social.core.thread_ydl import ThreadLocalYDL
 from social.logger import get_logger
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
+_UNIVERSAL_DATA_ANCHOR = 'id="__UNIVERSAL_DATA_FOR_REHYDRATION__"'
+_UNIVERSAL_DATA_ANCHOR_BYTES = _UNIVERSAL_DATA_ANCHOR.encode()
+_UNIVERSAL_DATA_RE = re.compile(
+    r'<script[^>]*id="__UNIVERSAL_DATA_FOR_REHYDRATION__"[^>]*>(.+?)</script>', re.DOTALL
+)
+# Browser-like headers so TikTok serves the regular video page
+_HTTP_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36'
+    ),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+_HTTP_TIMEOUT = 15.0
+_ALT_PATTERNS = [
+    re.compile(p, re.DOTALL) for p in (
+        r'window\.__UNIVERSAL_DATA_FOR_REHYDRATION__\s*=\s*({.+?});',
+        r'<script[^>]*>(.*?__UNIVERSAL_DATA_FOR_REHYDRATION__.*?)</script>',
+    )
+]
+
+
+def _find_universal_data(content):
+    """
+    Slice the rehydration <script> body out with plain find() scans.
+    
+    Accepts str or bytes-like page content, and returns the same kind
+    of object (str or bytes) it was given.
+    """
+    if isinstance(content, str):
+        anchor, tag_end, script_end = _UNIVERSAL_DATA_ANCHOR, '>', '</script>'
+    else:
+        anchor, tag_end, script_end = _UNIVERSAL_DATA_ANCHOR_BYTES, b'>', b'</script>'
+    start = content.find(anchor)
+    if start < 0:
+        return None
+    start = content.find(tag_end, start) + 1
+    end = content.find(script_end, start)
+    if start <= 0 or end < 0:
+        return None
+    return content[start:end].strip() or None
+
+
+def _channel_key(url: str) -> Optional[str]:
+    """Return the @username segment of a TikTok URL, or None if it has none."""
+    parts = url.rsplit('/@', 1)
+    if len(parts) != 2:
+        return None
+    username = parts[1].split('/', 1)[0].split('?', 1)[0]
+    return username or None
+
+
+def _usable_page(response: httpx.Response) -> Optional[bytes]:
+    """Return the body of a successful response that carries rehydration data."""
+    if response.status_code != 200:
+        return None
+    content = response.content
+    if _UNIVERSAL_DATA_ANCHOR_BYTES not in content:
+        return None
+    return content
+
 
 class TikTokPlatform(Platform):
     """Platform configuration for TikTok."""
     
+    __slots__ = ('_ydls', '_local', '_channel_cache', '_channel_cache_lock', '_http')
+    
+    # Channels whose parsed info is kept in memory
+    CHANNEL_CACHE_SIZE = 256
+    
+    def __init__(self, name: str = "tiktok", config: dict = None, global_config=None):
+        super().__init__(name, config, global_config)
+        # YoutubeDL instances reused across calls, one per thread and options
+        # (YoutubeDL is not thread-safe); each gets the page capture hook
+        self._ydls = ThreadLocalYDL(on_create=self._capture_pages)
+        # Pages fetched by the TikTok extractor during the current call,
+        # kept per thread so concurrent calls never see each other's pages
+        self._local = threading.local()
+        # Bounded LRU of harmonized channel info, keyed by @username
+        self._channel_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # get_channel_info runs in asyncio.to_thread workers that share the LRU
+        self._channel_cache_lock = threading.Lock()
+        # HTTP client for direct page fetches (created on first use)
+        self._http: Optional[httpx.Client] = None
+    
+    def _get_ydl(self, ydl_opts: Dict[str, Any]) -> Optional[YoutubeDL]:
+        """
+        Return this thread's YoutubeDL for these options, building it on first use.
+        
+        Returns None if the page capture hook can't be installed.
+        """
+        return self._ydls.get(frozenset(ydl_opts.items()), ydl_opts)
+    
+    def _capture_pages(self, ydl: YoutubeDL) -> bool:
+        """
+        Hook yt-dlp's TikTok extractor so every page it reads is kept in memory.
+        
+        This replaces write_pages: the HTML never touches the disk.
+        
+        Returns:
+            False if this yt-dlp version has no hook point to wrap
+        """
+        ie = ydl.get_info_extractor('TikTok')
+        read_content = getattr(ie, '_webpage_read_content', None)
+        if read_content is None:
+            # Private yt-dlp API: fail loudly instead of silently capturing nothing
+            logger.error(
+                "yt-dlp's TikTok extractor has no _webpage_read_content, "
+                "cannot capture pages for channel info (unsupported yt-dlp version)"
+            )
+            return False
+        
+        def _read_and_capture(*args, **kwargs):
+            content = read_content(*args, **kwargs)
+            pages = getattr(self._local, 'pages', None)
+            if content and pages is not None:
+                pages.append(content)
+            return content
+        
+        ie._webpage_read_content = _read_and_capture
+        return True
+    
+    def _load_cookies(self) -> Optional[MozillaCookieJar]:
+        """Load the Netscape cookies file for HTTP clients, if there is one."""
+        if not self.has_cookies():
+            return None
+        jar = MozillaCookieJar(self._cookies_str)
+        try:
+            jar.load(ignore_discard=True, ignore_expires=True)
+        except (OSError, LoadError) as e:
+            logger.warning(f"Could not load cookies from {self.cookies}: {e}")
+            return None
+        return jar
+    
+    def _http_client(self) -> httpx.Client:
+        """Return the shared HTTP client, building it on first use."""
+        if self._http is None:
+            self._http = httpx.Client(
+                headers=_HTTP_HEADERS,
+                cookies=self._load_cookies(),
+                timeout=_HTTP_TIMEOUT,
+                follow_redirects=True,
+            )
+        return self._http
+    
+    def refresh_cookies(self) -> None:
+        """Invalidate the cookie check and drop the client holding old cookies."""
+        super().refresh_cookies()
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+    
+    def close(self) -> None:
+        """Close every cached YoutubeDL instance and the HTTP client."""
+        self._ydls.close()
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+    
     def get_channel_info(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Extract channel info from TikTok video URL by parsing HTML.
         
-        Uses yt-dlp with write_pages to get the HTML dump, then parses
+        Fetches the video page directly over HTTP (falling back to yt-dlp's
+        TikTok extractor with an in-memory page capture), then parses
         __UNIVERSAL_DATA_FOR_REHYDRATION__ to extract author information.
         
         Args:
@@ -25,71 +193,153 @@ class TikTokPlatform(Platform):
         Returns:
             Dictionary with harmonized channel information (snake_case)
         """
-        try:
-            # Use current directory for write_pages (yt-dlp saves there by default)
-            current_dir = Path.cwd()
-            logger.debug(f"Using current directory for pages: {current_dir}")
+        # Videos from the same creator share the author data: skip the IO
+        key = _channel_key(url)
+        cached = self._cached_channel_info(key)
+        if cached is not None:
+            return cached
+        
+        channel_info = self._fetch_channel_info(url)
+        self._store_channel_info(key, channel_info)
+        return channel_info
+    
+    async def aget_channels_info_bulk(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Extract channel info for several URLs with get_channel_info_many()."""
+        results = await self.get_channel_info_many(urls)
+        return {url: info for url, info in zip(urls, results) if info}
+    
+    async def get_channel_info_many(self, urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Extract channel info for several TikTok URLs concurrently.
+        
+        Pages are fetched with a shared httpx.AsyncClient; URLs whose page
+        can't be parsed fall back to yt-dlp in a worker thread.
+        
+        Args:
+            urls: URLs of TikTok videos
             
+        Returns:
+            Channel info (or None) for each URL, in the same order
+        """
+        async with httpx.AsyncClient(
+            headers=_HTTP_HEADERS,
+            cookies=self._load_cookies(),
+            timeout=_HTTP_TIMEOUT,
+            follow_redirects=True,
+        ) as client:
+            return await asyncio.gather(*(self._get_channel_info_async(client, url) for url in urls))
+    
+    async def _get_channel_info_async(self, client: httpx.AsyncClient, url: str) -> Optional[Dict[str, Any]]:
+        key = _channel_key(url)
+        cached = self._cached_channel_info(key)
+        if cached is not None:
+            return cached
+        
+        channel_info = None
+        try:
+            html = _usable_page(await client.get(url))
+            if html is not None:
+                channel_info = self._parse_channel_info_from_html(html)
+        except httpx.HTTPError as e:
+            logger.debug(f"Direct fetch failed for {url}: {e}")
+        
+        if channel_info is None:
+            channel_info = await asyncio.to_thread(self._extract_channel_info, url)
+        
+        self._store_channel_info(key, channel_info)
+        return channel_info
+    
+    def _cached_channel_info(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return cached channel info for an @username, refreshing its LRU slot."""
+        if key is None:
+            return None
+        with self._channel_cache_lock:
+            cached = self._channel_cache.get(key)
+            if cached is not None:
+                self._channel_cache.move_to_end(key)
+        if cached is not None:
+            logger.debug(f"Channel info for @{key} served from cache")
+        return cached
+    
+    def _store_channel_info(self, key: Optional[str], channel_info: Optional[Dict[str, Any]]) -> None:
+        """Cache successful channel info, evicting the least recently used entry."""
+        if key is None or channel_info is None:
+            return
+        with self._channel_cache_lock:
+            self._channel_cache[key] = channel_info
+            if len(self._channel_cache) > self.CHANNEL_CACHE_SIZE:
+                self._channel_cache.popitem(last=False)
+    
+    def _fetch_channel_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the video page with a plain HTTP GET and parse it.
+        
+        TikTok sometimes serves a page without rehydration data to non-browser
+        clients; in that case fall back to yt-dlp's extractor.
+        """
+        html = self._fetch_html(url)
+        if html is not None:
+            channel_info = self._parse_channel_info_from_html(html)
+            if channel_info is not None:
+                return channel_info
+        
+        logger.debug(f"Direct fetch unusable for {url}, falling back to yt-dlp")
+        return self._extract_channel_info(url)
+    
+    def _fetch_html(self, url: str) -> Optional[bytes]:
+        """GET the video page, returning its bytes only if it has rehydration data."""
+        try:
+            return _usable_page(self._http_client().get(url))
+        except httpx.HTTPError as e:
+            logger.debug(f"Direct fetch failed for {url}: {e}")
+            return None
+    
+    def _extract_channel_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """Run the extractor for url and parse the captured video page."""
+        try:
             ydl_opts = {
                 'quiet': True,
                 'skip_download': True,
-                'write_pages': True,
-                'pages_directory': str(current_dir),  # Use current directory
             }
             
             # Add cookies if available
-            if self.cookies.exists():
-                ydl_opts['cookiefile'] = str(self.cookies)
+            if self.has_cookies():
+                ydl_opts['cookiefile'] = self._cookies_str
                 logger.debug(f"Using cookies file: {self.cookies}")
             
             logger.debug(f"Extracting info from URL: {url}")
-            with YoutubeDL(ydl_opts) as ydl:
-                ydl.extract_info(url, download=False)
+            ydl = self._get_ydl(ydl_opts)
+            if ydl is None:
+                return None
             
-            # Find dump file in current directory
-            dump_files = list(current_dir.glob('*.dump'))
-            logger.debug(f"Found {len(dump_files)} dump file(s) in current dir: {[f.name for f in dump_files]}")
-            
-            # Also check for .html files
-            html_files = list(current_dir.glob('*.html'))
-            logger.debug(f"Found {len(html_files)} HTML file(s) in current dir: {[f.name for f in html_files]}")
-            
-            if not dump_files:
-                # Try HTML files as fallback
-                if html_files:
-                    logger.debug(f"Using HTML file as fallback: {html_files[0]}")
-                    with open(html_files[0], 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    return self._parse_channel_info_from_html(content)
-                else:
-                    logger.warning(f"No dump or HTML file found in {current_dir}")
-                    # List all files for debugging
-                    all_files = list(current_dir.glob('*'))
-                    logger.warning(f"Available files in current dir: {[f.name for f in all_files[:20]]}")
-                    return None
+            self._local.pages = pages = []
+            try:
+                ydl.extract_info(url, download=False)
+            finally:
+                self._local.pages = None
+            logger.debug(f"Captured {len(pages)} page(s) from extractor")
             
-            # Use the most recent dump file (in case there are multiple)
-            dump_file = max(dump_files, key=lambda p: p.stat().st_mtime)
-            logger.debug(f"Reading dump file: {dump_file}")
-            file_size = dump_file.stat().st_size
-            logger.debug(f"Dump file size: {file_size} bytes")
+            # The video page is the one carrying the rehydration data
+            for page in reversed(pages):
+                if _UNIVERSAL_DATA_ANCHOR in page:
+                    return self._parse_channel_info_from_html(page)
             
-            with open(dump_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            if pages:
+                return self._parse_channel_info_from_html(pages[-1])
             
-            logger.debug(f"Read {len(content)} characters from dump file")
-            return self._parse_channel_info_from_html(content)
+            logger.warning(f"No page captured while extracting {url}")
+            return None
                 
         except Exception as e:
             logger.error(f"Error extracting TikTok channel info: {e}", exc_info=True)
             return None
     
-    def _parse_channel_info_from_html(self, html_content: str) -> Optional[Dict[str, Any]]:
+    def _parse_channel_info_from_html(self, html_content) -> Optional[Dict[str, Any]]:
         """
         Parse HTML content to extract channel info from __UNIVERSAL_DATA_FOR_REHYDRATION__.
         
         Args:
-            html_content: HTML content from TikTok page
+            html_content: HTML content from TikTok page (str or bytes)
             
         Returns:
             Dictionary with harmonized channel information (snake_case)
@@ -98,28 +348,27 @@ class TikTokPlatform(Platform):
             logger.debug(f"Parsing HTML content ({len(html_content)} characters)")
             
             # Find the script tag with __UNIVERSAL_DATA_FOR_REHYDRATION__
-            pattern = r'<script[^>]*id="__UNIVERSAL_DATA_FOR_REHYDRATION__"[^>]*>(.+?)</script>'
-            match = re.search(pattern, html_content, re.DOTALL)
-            
-            if not match:
-                logger.warning("Could not find __UNIVERSAL_DATA_FOR_REHYDRATION__ in HTML")
-                # Try alternative patterns
-                alt_patterns = [
-                    r'window\.__UNIVERSAL_DATA_FOR_REHYDRATION__\s*=\s*({.+?});',
-                    r'<script[^>]*>(.*?__UNIVERSAL_DATA_FOR_REHYDRATION__.*?)</script>',
-                ]
-                for alt_pattern in alt_patterns:
-                    alt_match = re.search(alt_pattern, html_content, re.DOTALL)
-                    if alt_match:
-                        logger.debug(f"Found alternative pattern: {alt_pattern[:50]}...")
-                        break
-                if not any(re.search(p, html_content, re.DOTALL) for p in alt_patterns):
-                    logger.warning("HTML content preview (first 500 chars): " + html_content[:500])
-                return None
+            json_str = _find_universal_data(html_content)
+            
+            if json_str is None:
+                # Fall back to the regex for unusual markup
+                if not isinstance(html_content, str):
+                    html_content = html_content[:].decode('utf-8', errors='ignore')
+                match = _UNIVERSAL_DATA_RE.search(html_content)
+                if not match:
+                    logger.warning("Could not find __UNIVERSAL_DATA_FOR_REHYDRATION__ in HTML")
+                    # Try alternative patterns
+                    for alt_pattern in _ALT_PATTERNS:
+                        if alt_pattern.search(html_content):
+                            logger.debug(f"Found alternative pattern: {alt_pattern.pattern[:50]}...")
+                            break
+                    else:
+                        logger.warning("HTML content preview (first 500 chars): " + html_content[:500])
+                    return None
+                json_str = match.group(1).strip()
             
-            json_str = match.group(1).strip()
             logger.debug(f"Extracted JSON string length: {len(json_str)}")
-            data = json.loads(json_str)
+            data = _json_loads(json_str)
             logger.debug(f"Successfully parsed JSON, keys: {list(data.keys())[:5]}")
             
             # Navigate to itemStruct
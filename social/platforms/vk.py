@@ -1,17 +1,39 @@
+import sys
+from functools import lru_cache
 from social.platforms.base import Platform
 from typing import Dict, Any
 from social.core.caption_builder import CaptionBuilder
 
+
+@lru_cache(maxsize=4096)
+def _vk_channel_url(uploader_id: str) -> str:
+    """
+    Builds the (interned) channel URL for a VK uploader_id.
+    
+    Negative IDs are clubs (groups/communities), positive IDs are users.
+    """
+    # A leading '-' marks a club; otherwise it's a user
+    if uploader_id[:1] == '-':
+        return sys.intern(f"https://vk.com/club{uploader_id[1:]}")
+    return sys.intern(f"https://vk.com/id{uploader_id}")
+
+
 class VKPlatform(Platform):
     """Configuración para VK (VKontakte).
     
     yt-dlp detecta automáticamente URLs de VK usando el extractor 'vk'.
     Esta clase solo proporciona configuración específica para VK.
     """
+    __slots__ = ()
+    
     DEFAULT_CONCURRENT_FRAGMENTS = 10
     
     def __init__(self, name: str = "vk", config: dict = None, global_config=None):
         super().__init__(name, config, global_config)
+        
+        # Descargas progresivas con aria2c (opt-in: requiere aria2c instalado)
+        if config and config.get("aria2c"):
+            self._enable_aria2c()
     
     def create_caption(self, info_dict: Dict[str, Any]) -> CaptionBuilder:
         """
@@ -23,48 +45,29 @@ class VKPlatform(Platform):
         - uploader_id to construct channel URL (negative = club, positive = user)
         - uploader for the channel name
         """
-        title = info_dict.get('title') or ''
-        video_url = info_dict.get('webpage_url') or ''
-        creation_date = self._parse_creation_date(info_dict)
-        
         # VK: use uploader for channel name
-        channel_name = info_dict.get('uploader') or ''
+        return self._build_caption(
+            info_dict, self._vk_channel_url_from_info, channel_name=info_dict.get('uploader') or ''
+        )
+    
+    @staticmethod
+    def _vk_channel_url_from_info(info_dict: Dict[str, Any]) -> str:
+        """
+        Constructs the channel URL from uploader_id or extracts it from the video id.
         
-        # VK: construct channel URL from uploader_id or extract from video id
-        # If uploader_id is negative, it's a club (group/community)
-        # If positive, it's a user ID
-        # Format: "-232630765_456239063" -> first part is channel ID
-        channel_url = ''
+        If uploader_id is negative, it's a club (group/community); if positive,
+        it's a user ID. Format: "-232630765_456239063" -> first part is channel ID.
+        """
         uploader_id = info_dict.get('uploader_id')
         
         # If uploader_id is not available, try to extract from video id
         if not uploader_id:
             video_id = info_dict.get('id') or info_dict.get('display_id') or ''
-            if '_' in str(video_id):
+            video_id = str(video_id)
+            if '_' in video_id:
                 # Extract first part before underscore
-                uploader_id = str(video_id).split('_')[0]
+                uploader_id = video_id.partition('_')[0]
         
         if uploader_id:
-            # Remove negative sign if present
-            id_str = str(uploader_id).lstrip('-')
-            if str(uploader_id).startswith('-'):
-                # It's a club
-                channel_url = f"https://vk.com/club{id_str}"
-            else:
-                # It's a user
-                channel_url = f"https://vk.com/id{id_str}"
-        
-        # Statistics
-        views = info_dict.get('view_count')
-        likes = info_dict.get('like_count')
-        
-        return CaptionBuilder(
-            title=title,
-            video_url=video_url,
-            creation_date=creation_date,
-            channel_name=channel_name,
-            channel_url=channel_url,
-            likes=likes,
-            views=views
-        )
-
+            return _vk_channel_url(str(uploader_id))
+        return ''
@@ -1,13 +1,82 @@
 from social.platforms.base import Platform
-from typing import Dict, Any, Optional
+import calendar
+import random
+import re
+import time
+from typing import Dict, Any, Iterator, List, Optional
+from datetime import datetime
+from social.config import default_state_dir
 from social.core.caption_builder import CaptionBuilder
+from social.core.quota_bucket import QuotaBucket, QuotaExceededError
+from social.core.thread_ydl import ThreadLocalYDL
 from yt_dlp import YoutubeDL
 from social.logger import get_logger
 from social.services.url_id_extractor import URLIDExtractor
+import asyncio
+import httpx
 import requests
+from diskcache import Cache
+from requests.adapters import HTTPAdapter
 
 logger = get_logger(__name__)
 
+# Channel URL shapes: /channel/UC... (ID), /@handle, /c/custom, /user/legacy
+_CHANNEL_URL_RE = re.compile(
+    r'youtube\.com/(?:channel/(UC[\w-]{22})|@([\w.-]+)|c/[\w.-]+|user/([\w.-]+))'
+)
+
+
+def _chunks(items: List[str], size: int) -> Iterator[List[str]]:
+    """Split items into consecutive lists of at most size elements."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _collect_video_channels(data: Dict[str, Any], video_channels: Dict[str, str]) -> None:
+    """Add the video ID -> channel ID pairs of a /videos response."""
+    for item in data.get('items', []):
+        channel_id = item.get('snippet', {}).get('channelId')
+        if channel_id:
+            video_channels[item['id']] = channel_id
+
+
+def _parse_published_at(value: str) -> int:
+    """
+    Convert an API publishedAt (YYYY-MM-DDTHH:MM:SS[.fff]Z) to a Unix timestamp.
+    
+    The UTC form the API returns is sliced directly; anything else goes
+    through datetime.fromisoformat. Raises ValueError if it cannot be parsed.
+    """
+    if len(value) >= 20 and value[-1] == 'Z' and value[4] == '-' and value[10] == 'T':
+        return calendar.timegm((
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]), 0, 0, 0
+        ))
+    return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+
+
+def _channel_url_lookup(url: str) -> Optional[Dict[str, str]]:
+    """
+    Classify a channel URL without any request.
+    
+    Returns None for non-channel URLs (videos), {'id': ...} when the URL
+    already carries the channel ID, the /channels filter (forHandle or
+    forUsername) that resolves it otherwise, or {} for /c/ custom URLs,
+    which only yt-dlp can resolve.
+    """
+    match = _CHANNEL_URL_RE.search(url)
+    if match is None:
+        return None
+    channel_id, handle, username = match.groups()
+    if channel_id:
+        return {'id': channel_id}
+    if handle:
+        return {'forHandle': f"@{handle}"}
+    if username:
+        return {'forUsername': username}
+    return {}
+
+
 class YouTubePlatform(Platform):
     """Configuración para YouTube.
     
@@ -15,9 +84,30 @@ class YouTubePlatform(Platform):
     Esta clase solo proporciona configuración específica para YouTube.
     """
     
+    __slots__ = ('_session', '_cache', '_flat_ydls', '_quota')
+    
     # Formato con fallback: intenta el mejor primero, si falla con cookies usa 'best'
     DEFAULT_FORMAT = "bestvideo+bestaudio[acodec^=mp4a]/bestvideo*+bestaudio/best"
     
+    # Timeouts (connect, read) para la YouTube Data API
+    API_TIMEOUT = (3, 10)
+    # Máximo de IDs por petición que acepta la YouTube Data API
+    API_BATCH_SIZE = 50
+    # Reintentos ante 429 Too Many Requests (backoff exponencial con jitter)
+    API_MAX_RETRIES = 3
+    API_BACKOFF_BASE = 1.0
+    
+    # TTL (segundos) de la caché local: info de canal y mapeo URL -> canal
+    CHANNEL_CACHE_TTL = 86400
+    VIDEO_CHANNEL_CACHE_TTL = 3600
+    # Tiempo que se conserva una entrada caducada para revalidarla con su ETag
+    CHANNEL_ETAG_TTL = 30 * 86400
+    
+    CHANNEL_PARTS = 'snippet,statistics,contentDetails,brandingSettings'
+    
+    # Opciones de yt-dlp para resolver URLs de canal sin descargar nada
+    FLAT_YDL_OPTS = {'quiet': True, 'extract_flat': True, 'skip_download': True}
+    
     def __init__(self, name: str = "youtube", config: dict = None, global_config=None):
         # Sobrescribir formato por defecto para YouTube
         if config is None:
@@ -26,12 +116,77 @@ class YouTubePlatform(Platform):
             config['format'] = self.DEFAULT_FORMAT
         
         super().__init__(name, config, global_config)
+        # Sesión HTTP con keep-alive para la YouTube Data API (se crea en el primer uso)
+        self._session: Optional[requests.Session] = None
+        # Caché en disco de respuestas de la API (se abre en el primer uso)
+        self._cache: Optional[Cache] = None
+        # YoutubeDL en modo extract_flat para resolver URLs de canal, uno por hilo
+        # (YoutubeDL no es thread-safe y se usa desde asyncio.to_thread)
+        self._flat_ydls = ThreadLocalYDL()
+        # Ritmo de peticiones y cuota diaria (1 unidad por llamada a /videos o /channels)
+        self._quota = QuotaBucket(
+            getattr(global_config, 'YOUTUBE_DAILY_QUOTA', QuotaBucket.DEFAULT_DAILY_QUOTA)
+        )
+    
+    def _api_session(self) -> requests.Session:
+        """Obtiene la sesión HTTP compartida, reutilizando conexiones TLS a googleapis.com."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=3)
+            session.mount('https://', adapter)
+            self._session = session
+        return self._session
+    
+    def _api_cache(self) -> Cache:
+        """Obtiene la caché en disco de canales y mapeos URL -> canal."""
+        if self._cache is None:
+            # Sin Config, el mismo directorio de estado que usaría uno por defecto
+            state_dir = self.global_config.STATE_DIR if self.global_config is not None else default_state_dir()
+            cache_dir = state_dir / "yt_channel"
+            self._cache = Cache(str(cache_dir))
+        return self._cache
+    
+    def invalidate(self, url: str) -> None:
+        """Elimina de la caché el mapeo de la URL y la info de su canal."""
+        cache = self._api_cache()
+        channel_id = cache.pop(('vid2chan', url), None)
+        if channel_id:
+            cache.delete(('channel', channel_id))
+    
+    def _get_flat_ydl(self) -> YoutubeDL:
+        """Obtiene el YoutubeDL (extract_flat) del hilo actual, creándolo en el primer uso."""
+        ydl_opts = {**self.FLAT_YDL_OPTS, 'cookiefile': self._cookies_str} \
+            if self.has_cookies() else self.FLAT_YDL_OPTS
+        return self._flat_ydls.get('flat', ydl_opts)
+    
+    def _close_flat_ydl(self) -> None:
+        self._flat_ydls.close()
+    
+    def refresh_cookies(self) -> None:
+        """Invalida la comprobación de cookies y los YoutubeDL creados con las anteriores."""
+        super().refresh_cookies()
+        self._close_flat_ydl()
+    
+    def close(self) -> None:
+        """Cierra la sesión HTTP de la YouTube Data API, la caché en disco y los YoutubeDL."""
+        self._close_flat_ydl()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
     
     def get_ydl_opts(self):
         """Obtiene opciones específicas de YouTube para yt-dlp."""
         opts = super().get_ydl_opts()
         return opts
     
+    @staticmethod
+    def _is_short_url(url: str) -> bool:
+        """Check if a URL points to a YouTube Short (/shorts/ path)."""
+        return '/shorts/' in url
+    
     def _is_short(self, info_dict: Dict[str, Any]) -> bool:
         """
         Check if the video is a YouTube Short.
@@ -42,13 +197,8 @@ class YouTubePlatform(Platform):
         Returns:
             True if the video is a Short, False otherwise
         """
-        # Check URL for /shorts/ pattern
-        original_url = info_dict.get('original_url', '')
-        
-        if '/shorts/' in original_url:
-            return True
-        
-        return False
+        # Check URL for /shorts/ pattern (webpage_url if original_url is missing)
+        return self._is_short_url(info_dict.get('original_url') or info_dict.get('webpage_url') or '')
     
     def create_caption(self, info_dict: Dict[str, Any]) -> CaptionBuilder:
         """
@@ -64,9 +214,9 @@ class YouTubePlatform(Platform):
         title = info_dict.get('fulltitle') or info_dict.get('title') or ''
         
         # YouTube: use original_url for shorts, webpage_url for regular videos
-        is_short = self._is_short(info_dict)
-        if is_short:
-            video_url = info_dict.get('original_url') or info_dict.get('webpage_url') or ''
+        original_url = info_dict.get('original_url') or info_dict.get('webpage_url') or ''
+        if self._is_short_url(original_url):
+            video_url = original_url
         else:
             video_url = info_dict.get('webpage_url') or ''
         
@@ -94,179 +244,529 @@ class YouTubePlatform(Platform):
         """
         Extract channel information from YouTube video or channel URL using YouTube Data API v3.
         
+        Thin wrapper over get_channels_info_bulk().
+        
         Args:
             url: URL of a YouTube video or channel
             
         Returns:
             Dictionary with harmonized channel information (snake_case)
         """
-        try:
-            # Check if API key is available
-            if not self.global_config.YOUTUBE_API_KEY:
-                logger.error("YOUTUBE_API_KEY not set in .env, cannot extract channel info")
-                return None
-            
-            # Step 1: Get channel ID from URL
-            channel_id = self._get_channel_id_from_url(url)
-            
-            if not channel_id:
-                logger.error(f"Could not extract channel ID from URL: {url}")
-                return None
-            
-            logger.debug(f"Getting channel info for channel ID: {channel_id}")
-            
-            # Step 2: Make direct API call to get full channel info including thumbnails
-            api_url = "https://www.googleapis.com/youtube/v3/channels"
-            params = {
-                'part': 'snippet,statistics,contentDetails,brandingSettings',
-                'id': channel_id,
-                'key': self.global_config.YOUTUBE_API_KEY
-            }
-            
-            response = requests.get(api_url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if not data.get('items'):
-                logger.warning(f"No channel data returned for channel ID: {channel_id}")
-                return None
+        return self.get_channels_info_bulk([url]).get(url)
+    
+    def get_channels_info_bulk(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract channel information for several video/channel URLs.
+        
+        Video IDs are resolved to channel IDs with one /videos call per 50 IDs,
+        and all distinct channels are fetched with one /channels call per 50 IDs.
+        
+        Args:
+            urls: URLs of YouTube videos or channels
             
-            # Extract channel info from first item
-            channel = data['items'][0]
-            snippet = channel.get('snippet', {})
-            statistics = channel.get('statistics', {})
-            content_details = channel.get('contentDetails', {})
-            branding = channel.get('brandingSettings', {}).get('channel', {})
+        Returns:
+            Dictionary {url: harmonized channel info}; URLs that could not be
+            resolved are omitted
+        """
+        # Check if API key is available
+        if not self.global_config.YOUTUBE_API_KEY:
+            logger.error("YOUTUBE_API_KEY not set in .env, cannot extract channel info")
+            return {}
+        
+        try:
+            # Step 1: Get channel ID for every URL
+            channel_ids = self._get_channel_ids_from_urls(urls)
+            if not channel_ids:
+                logger.error(f"Could not extract channel ID from URLs: {urls}")
+                return {}
             
-            # Get thumbnails (avatar)
-            thumbnails = snippet.get('thumbnails', {})
-            avatar_url = (
-                thumbnails.get('high', {}).get('url') or
-                thumbnails.get('medium', {}).get('url') or
-                thumbnails.get('default', {}).get('url')
-            )
+            # Step 2: Get full channel info (including thumbnails) for distinct channels
+            unique_ids = list(dict.fromkeys(channel_ids.values()))
+            logger.debug(f"Getting channel info for channel IDs: {unique_ids}")
             
-            # Get username (customUrl or handle)
-            username = snippet.get('customUrl', '')
+            channels, stale, missing = self._partition_cached_channels(unique_ids)
+            for channel_id, entry in stale:
+                try:
+                    ok = self._revalidate_channel(channel_id, entry)
+                except Exception as e:
+                    ok = self._revalidation_failed(channel_id, e)
+                if ok:
+                    channels[channel_id] = entry['data']
+                else:
+                    missing.append(channel_id)
             
-            # Parse creation date (ISO 8601 to Unix timestamp)
-            published_at = snippet.get('publishedAt', '')
-            channel_created = 0
-            if published_at:
-                from datetime import datetime
+            # A failed batch only loses its own channels
+            for batch in _chunks(missing, self.API_BATCH_SIZE):
                 try:
-                    dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                    channel_created = int(dt.timestamp())
+                    data = self._api_get('channels', self._channels_params(batch))
                 except Exception as e:
-                    logger.debug(f"Error parsing publishedAt date: {e}")
+                    self._channel_batch_failed(batch, e)
+                    continue
+                self._store_channel_batch(batch, data, channels)
             
-            # Step 3: Harmonize to snake_case format (matching base Platform format)
-            result = {
-                'channel': snippet.get('title', ''),
-                'channel_id': channel_id,
-                'channel_url': f"https://www.youtube.com/channel/{channel_id}",
-                'channel_follower_count': int(statistics.get('subscriberCount', 0)),
-                'uploader': snippet.get('title', ''),
-                'uploader_id': channel_id,
-                'uploader_url': f"https://www.youtube.com/{username}",
-                'location': snippet.get('country', ''),
-                'channel_created': channel_created,
-                'avatar': avatar_url,
-                'description': snippet.get('description', ''),
-            }
+            # Step 3: Map results back to the original URLs
+            return self._map_channel_results(channel_ids, channels)
             
-            # Add YouTube-specific fields
-            result['username'] = username  # @username
-            result['view_count'] = int(statistics.get('viewCount', 0))
-            result['video_count'] = int(statistics.get('videoCount', 0))
-            result['playlist_id_uploads'] = content_details.get('relatedPlaylists', {}).get('uploads', '')
-            result['playlist_id_likes'] = content_details.get('relatedPlaylists', {}).get('likes', '')
-            result['keywords'] = branding.get('keywords', '')
-            result['avatar_high'] = thumbnails.get('high', {}).get('url', '')
-            result['avatar_medium'] = thumbnails.get('medium', {}).get('url', '')
-            result['avatar_default'] = thumbnails.get('default', {}).get('url', '')
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error making YouTube API request: {e}", exc_info=True)
+            return {}
+        except QuotaExceededError as e:
+            logger.error(str(e))
+            return {}
+        except Exception as e:
+            logger.error(f"Error extracting YouTube channel info from {urls}: {e}", exc_info=True)
+            return {}
+    
+    async def aget_channel_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_channel_info()."""
+        return (await self.aget_channels_info_bulk([url])).get(url)
+    
+    async def aget_channels_info_bulk(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Async variant of get_channels_info_bulk().
+        
+        The /videos and /channels batches, etag revalidations and yt-dlp
+        channel-URL resolutions of each step run concurrently.
+        """
+        if not self.global_config.YOUTUBE_API_KEY:
+            logger.error("YOUTUBE_API_KEY not set in .env, cannot extract channel info")
+            return {}
+        
+        try:
+            async with httpx.AsyncClient(
+                timeout=httpx.Timeout(self.API_TIMEOUT[1], connect=self.API_TIMEOUT[0]),
+                limits=httpx.Limits(max_connections=50),
+            ) as client:
+                # Step 1: Get channel ID for every URL
+                channel_ids = await self._aget_channel_ids_from_urls(client, urls)
+                if not channel_ids:
+                    logger.error(f"Could not extract channel ID from URLs: {urls}")
+                    return {}
+                
+                # Step 2: Get full channel info for distinct channels
+                unique_ids = list(dict.fromkeys(channel_ids.values()))
+                channels, stale, missing = self._partition_cached_channels(unique_ids)
+                revalidated = await asyncio.gather(*(
+                    self._arevalidate_channel(client, channel_id, entry) for channel_id, entry in stale
+                ), return_exceptions=True)
+                for (channel_id, entry), ok in zip(stale, revalidated):
+                    if isinstance(ok, Exception):
+                        ok = self._revalidation_failed(channel_id, ok)
+                    if ok:
+                        channels[channel_id] = entry['data']
+                    else:
+                        missing.append(channel_id)
+                
+                batches = list(_chunks(missing, self.API_BATCH_SIZE))
+                responses = await asyncio.gather(*(
+                    self._aapi_get(client, 'channels', self._channels_params(batch)) for batch in batches
+                ), return_exceptions=True)
+                for batch, data in zip(batches, responses):
+                    if isinstance(data, Exception):
+                        self._channel_batch_failed(batch, data)
+                        continue
+                    self._store_channel_batch(batch, data, channels)
             
-            print(result)
-            logger.info(f"Successfully extracted channel info for: {result.get('channel', 'Unknown')} (@{username})")
-            return result
+            # Step 3: Map results back to the original URLs
+            return self._map_channel_results(channel_ids, channels)
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Error making YouTube API request: {e}", exc_info=True)
-            return None
+            return {}
+        except QuotaExceededError as e:
+            logger.error(str(e))
+            return {}
         except Exception as e:
-            logger.error(f"Error extracting YouTube channel info from {url}: {e}", exc_info=True)
+            logger.error(f"Error extracting YouTube channel info from {urls}: {e}", exc_info=True)
+            return {}
+    
+    def _channels_params(self, channel_ids: List[str]) -> Dict[str, Any]:
+        """Query parameters for a /channels request."""
+        return {
+            'part': self.CHANNEL_PARTS,
+            'id': ','.join(channel_ids),
+            'maxResults': self.API_BATCH_SIZE,
+        }
+    
+    def _partition_cached_channels(self, channel_ids: List[str]):
+        """
+        Split channel IDs by cache state.
+        
+        Returns:
+            (fresh {id: data}, stale [(id, entry)] with an etag, missing [id])
+        """
+        cache = self._api_cache()
+        channels: Dict[str, Dict[str, Any]] = {}
+        stale = []
+        missing = []
+        now = time.time()
+        for channel_id in channel_ids:
+            entry = cache.get(('channel', channel_id))
+            if entry is None:
+                missing.append(channel_id)
+            elif now - entry['fetched'] < self.CHANNEL_CACHE_TTL:
+                channels[channel_id] = entry['data']
+            elif entry['etag']:
+                stale.append((channel_id, entry))
+            else:
+                missing.append(channel_id)
+        return channels, stale, missing
+    
+    @staticmethod
+    def _revalidation_failed(channel_id: str, error: Exception) -> bool:
+        """Log a failed etag revalidation; the stale cached data is still served."""
+        logger.warning(f"Could not revalidate channel {channel_id}, using cached data: {error}")
+        return True
+    
+    @staticmethod
+    def _channel_batch_failed(batch: List[str], error: Exception) -> None:
+        """Log a /channels batch that failed; its channels are left out of the result."""
+        if isinstance(error, QuotaExceededError):
+            logger.error(str(error))
+        else:
+            logger.error(f"Error getting channel info for {batch}: {error}")
+    
+    def _store_channel_batch(
+        self,
+        batch: List[str],
+        data: Dict[str, Any],
+        channels: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Harmonize and cache the items of a /channels response."""
+        # The response etag only validates a request for this exact id
+        etag = data.get('etag') if len(batch) == 1 else None
+        for item in data.get('items', []):
+            result = channels[item['id']] = self._harmonize_channel(item)
+            self._cache_channel(item['id'], result, etag)
+    
+    @staticmethod
+    def _map_channel_results(
+        channel_ids: Dict[str, str],
+        channels: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Map channel info back to the original URLs."""
+        results = {}
+        for url, channel_id in channel_ids.items():
+            result = channels.get(channel_id)
+            if result is None:
+                logger.warning(f"No channel data returned for channel ID: {channel_id}")
+                continue
+            results[url] = result
+        return results
+    
+    def _cache_channel(self, channel_id: str, result: Dict[str, Any], etag: Optional[str]) -> None:
+        """
+        Store harmonized channel info with its etag.
+        
+        Entries outlive CHANNEL_CACHE_TTL so stale ones can still be
+        revalidated with If-None-Match instead of being refetched.
+        """
+        self._api_cache().set(
+            ('channel', channel_id),
+            {'etag': etag, 'data': result, 'fetched': time.time()},
+            expire=self.CHANNEL_ETAG_TTL,
+            tag='channel'
+        )
+    
+    def _revalidate_channel(self, channel_id: str, entry: Dict[str, Any]) -> bool:
+        """
+        Conditionally refetch a stale channel using its stored etag.
+        
+        Returns:
+            True if the cached entry is still valid (304) or was refreshed
+        """
+        data = self._api_get('channels', {'part': self.CHANNEL_PARTS, 'id': channel_id}, etag=entry['etag'])
+        return self._apply_revalidation(channel_id, entry, data)
+    
+    async def _arevalidate_channel(self, client: httpx.AsyncClient, channel_id: str, entry: Dict[str, Any]) -> bool:
+        """Async variant of _revalidate_channel()."""
+        data = await self._aapi_get(
+            client, 'channels', {'part': self.CHANNEL_PARTS, 'id': channel_id}, etag=entry['etag']
+        )
+        return self._apply_revalidation(channel_id, entry, data)
+    
+    def _apply_revalidation(self, channel_id: str, entry: Dict[str, Any], data: Optional[Dict[str, Any]]) -> bool:
+        """Update the cached entry from a conditional response (None = 304)."""
+        if data is None:
+            logger.debug(f"Channel {channel_id} not modified (304)")
+            self._cache_channel(channel_id, entry['data'], entry['etag'])
+            return True
+        if not data.get('items'):
+            return False
+        entry['data'] = self._harmonize_channel(data['items'][0])
+        self._cache_channel(channel_id, entry['data'], data.get('etag'))
+        return True
+    
+    def _api_get(self, endpoint: str, params: Dict[str, Any], etag: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        GET a YouTube Data API v3 endpoint and return the decoded JSON.
+        
+        With etag, sends If-None-Match and returns None on 304 Not Modified.
+        """
+        api_url = f"https://www.googleapis.com/youtube/v3/{endpoint}"
+        for attempt in range(self.API_MAX_RETRIES + 1):
+            self._quota.consume(1)
+            response = self._api_session().get(
+                api_url,
+                params={**params, 'key': self.global_config.YOUTUBE_API_KEY},
+                headers={'If-None-Match': etag} if etag else None,
+                timeout=self.API_TIMEOUT
+            )
+            if response.status_code != 429 or attempt == self.API_MAX_RETRIES:
+                break
+            time.sleep(self._backoff_delay(attempt))
+        if etag and response.status_code == 304:
             return None
+        response.raise_for_status()
+        return response.json()
     
-    def _get_channel_id_from_url(self, url: str) -> Optional[str]:
+    def _backoff_delay(self, attempt: int) -> float:
+        """Seconds to wait before retrying a 429 response (exponential backoff with jitter)."""
+        delay = self.API_BACKOFF_BASE * (2 ** attempt)
+        logger.warning(f"YouTube API rate limited (429), retrying in ~{delay:.0f}s")
+        return delay + random.uniform(0, self.API_BACKOFF_BASE)
+    
+    async def _aapi_get(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        params: Dict[str, Any],
+        etag: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Async variant of _api_get()."""
+        for attempt in range(self.API_MAX_RETRIES + 1):
+            await self._quota.aconsume(1)
+            response = await client.get(
+                f"https://www.googleapis.com/youtube/v3/{endpoint}",
+                params={**params, 'key': self.global_config.YOUTUBE_API_KEY},
+                headers={'If-None-Match': etag} if etag else None,
+            )
+            if response.status_code != 429 or attempt == self.API_MAX_RETRIES:
+                break
+            await asyncio.sleep(self._backoff_delay(attempt))
+        if etag and response.status_code == 304:
+            return None
+        response.raise_for_status()
+        return response.json()
+    
+    @staticmethod
+    def _harmonize_channel(channel: Dict[str, Any]) -> Dict[str, Any]:
+        """Harmonize a /channels API item to snake_case (matching base Platform format)."""
+        channel_id = channel.get('id', '')
+        snippet = channel.get('snippet', {})
+        statistics = channel.get('statistics', {})
+        related_playlists = channel.get('contentDetails', {}).get('relatedPlaylists', {})
+        branding = channel.get('brandingSettings', {}).get('channel', {})
+        title = snippet.get('title', '')
+        
+        # Get thumbnails (avatar): high, medium, default
+        thumbnails = snippet.get('thumbnails', {})
+        avatar_high, avatar_medium, avatar_default = (
+            thumbnails.get(size, {}).get('url', '') for size in ('high', 'medium', 'default')
+        )
+        
+        # Get username (customUrl or handle)
+        username = snippet.get('customUrl', '')
+        
+        # Parse creation date (ISO 8601 to Unix timestamp)
+        published_at = snippet.get('publishedAt', '')
+        channel_created = 0
+        if published_at:
+            try:
+                channel_created = _parse_published_at(published_at)
+            except ValueError as e:
+                logger.debug(f"Error parsing publishedAt date: {e}")
+        
+        result = {
+            'channel': title,
+            'channel_id': channel_id,
+            'channel_url': f"https://www.youtube.com/channel/{channel_id}",
+            'channel_follower_count': int(statistics.get('subscriberCount', 0)),
+            'uploader': title,
+            'uploader_id': channel_id,
+            'uploader_url': f"https://www.youtube.com/{username}",
+            'location': snippet.get('country', ''),
+            'channel_created': channel_created,
+            'avatar': avatar_high or avatar_medium or avatar_default or None,
+            'description': snippet.get('description', ''),
+            # YouTube-specific fields
+            'username': username,  # @username
+            'view_count': int(statistics.get('viewCount', 0)),
+            'video_count': int(statistics.get('videoCount', 0)),
+            'playlist_id_uploads': related_playlists.get('uploads', ''),
+            'playlist_id_likes': related_playlists.get('likes', ''),
+            'keywords': branding.get('keywords', ''),
+            'avatar_high': avatar_high,
+            'avatar_medium': avatar_medium,
+            'avatar_default': avatar_default,
+        }
+        
+        logger.info(f"Successfully extracted channel info for: {title} (@{username})")
+        return result
+    
+    def _get_channel_ids_from_urls(self, urls: List[str]) -> Dict[str, str]:
         """
-        Get channel ID from a video or channel URL.
+        Get channel IDs for several video or channel URLs.
         
-        Uses URLIDExtractor for video URLs and yt-dlp for channel URLs.
+        Video URLs are resolved in batches through the /videos API; /channel/
+        URLs carry the ID and @handle or /user/ URLs use a /channels lookup.
+        Anything still unresolved (/c/ URLs, videos the API didn't return)
+        falls back to yt-dlp.
         
         Args:
-            url: YouTube video or channel URL
+            urls: YouTube video or channel URLs
             
         Returns:
-            Channel ID or None if not found
+            Dictionary {url: channel_id} for the URLs that could be resolved
         """
-        # Try to extract video ID using URLIDExtractor (no HTTP request)
-        video_id = URLIDExtractor.extract_id(url)
+        channel_ids, urls = self._cached_channel_ids(urls)
+        lookups = {url: _channel_url_lookup(url) for url in urls}
         
-        if video_id:
-            # It's a video URL, need to get channel ID from video
-            logger.debug(f"Extracted video ID: {video_id}, getting channel ID from video...")
-            
+        # Try to extract video IDs using URLIDExtractor (no HTTP request)
+        video_ids = {url: URLIDExtractor.extract_id(url) for url in urls if lookups[url] is None}
+        pending = [vid for vid in dict.fromkeys(video_ids.values()) if vid]
+        
+        video_channels: Dict[str, str] = {}
+        for batch in _chunks(pending, self.API_BATCH_SIZE):
+            logger.debug(f"Getting channel IDs for videos: {batch}")
             try:
-                # Use YouTube API to get channel ID from video ID
-                api_url = "https://www.googleapis.com/youtube/v3/videos"
-                params = {
-                    'part': 'snippet',
-                    'id': video_id,
-                    'key': self.global_config.YOUTUBE_API_KEY
-                }
-                
-                response = requests.get(api_url, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                if data.get('items'):
-                    channel_id = data['items'][0].get('snippet', {}).get('channelId')
-                    if channel_id:
-                        logger.debug(f"Got channel ID from video: {channel_id}")
-                        return channel_id
-                
+                data = self._api_get('videos', self._videos_params(batch))
             except Exception as e:
                 logger.error(f"Error getting channel ID from video API: {e}")
-                return None
+                continue
+            _collect_video_channels(data, video_channels)
+        
+        for url in urls:
+            lookup = lookups[url]
+            if lookup is None:
+                channel_id = video_channels.get(video_ids[url])
+            else:
+                channel_id = lookup.get('id') or self._lookup_channel_id(lookup)
+            channel_id = channel_id or self._get_channel_id_from_channel_url(url)
+            self._remember_channel_id(url, channel_id, channel_ids)
+        return channel_ids
+    
+    async def _aget_channel_ids_from_urls(self, client: httpx.AsyncClient, urls: List[str]) -> Dict[str, str]:
+        """Async variant of _get_channel_ids_from_urls()."""
+        channel_ids, urls = self._cached_channel_ids(urls)
+        lookups = {url: _channel_url_lookup(url) for url in urls}
+        
+        video_ids = {url: URLIDExtractor.extract_id(url) for url in urls if lookups[url] is None}
+        pending = [vid for vid in dict.fromkeys(video_ids.values()) if vid]
+        
+        video_channels: Dict[str, str] = {}
+        responses = await asyncio.gather(*(
+            self._aapi_get(client, 'videos', self._videos_params(batch))
+            for batch in _chunks(pending, self.API_BATCH_SIZE)
+        ), return_exceptions=True)
+        for data in responses:
+            if isinstance(data, Exception):
+                logger.error(f"Error getting channel ID from video API: {data}")
+                continue
+            _collect_video_channels(data, video_channels)
+        
+        # @handle and /user/ URLs through /channels lookups
+        handle_urls = [url for url in urls if lookups[url] and 'id' not in lookups[url]]
+        handles = await asyncio.gather(*(
+            self._alookup_channel_id(client, lookups[url]) for url in handle_urls
+        ))
+        resolved = {url: lookup['id'] for url, lookup in lookups.items() if lookup and 'id' in lookup}
+        resolved.update((url, channel_id) for url, channel_id in zip(handle_urls, handles) if channel_id)
+        for url, video_id in video_ids.items():
+            if video_id in video_channels:
+                resolved[url] = video_channels[video_id]
+        
+        # Everything else (/c/ URLs, videos the API didn't return) goes through yt-dlp in threads
+        unresolved = [url for url in urls if url not in resolved]
+        fallback = await asyncio.gather(*(
+            asyncio.to_thread(self._get_channel_id_from_channel_url, url) for url in unresolved
+        ))
+        resolved.update(zip(unresolved, fallback))
+        
+        for url in urls:
+            self._remember_channel_id(url, resolved.get(url), channel_ids)
+        return channel_ids
+    
+    def _lookup_channel_id(self, lookup: Dict[str, str]) -> Optional[str]:
+        """Resolve a forHandle/forUsername lookup with one /channels call (None if not found)."""
+        if not lookup:
+            return None
+        try:
+            data = self._api_get('channels', {'part': 'id', **lookup})
+        except Exception as e:
+            logger.error(f"Error looking up channel {lookup}: {e}")
+            return None
+        items = data.get('items') or []
+        return items[0]['id'] if items else None
+    
+    async def _alookup_channel_id(self, client: httpx.AsyncClient, lookup: Dict[str, str]) -> Optional[str]:
+        """Async variant of _lookup_channel_id()."""
+        if not lookup:
+            return None
+        try:
+            data = await self._aapi_get(client, 'channels', {'part': 'id', **lookup})
+        except Exception as e:
+            logger.error(f"Error looking up channel {lookup}: {e}")
+            return None
+        items = data.get('items') or []
+        return items[0]['id'] if items else None
+    
+    def _videos_params(self, video_ids: List[str]) -> Dict[str, Any]:
+        """Query parameters for a /videos request."""
+        return {
+            'part': 'snippet',
+            'id': ','.join(video_ids),
+            'maxResults': self.API_BATCH_SIZE,
+        }
+    
+    def _cached_channel_ids(self, urls: List[str]):
+        """Return ({url: channel_id} found in the cache, urls still to resolve)."""
+        cache = self._api_cache()
+        channel_ids = {}
+        for url in urls:
+            cached = cache.get(('vid2chan', url))
+            if cached is not None:
+                channel_ids[url] = cached
+        return channel_ids, [url for url in urls if url not in channel_ids]
+    
+    def _remember_channel_id(self, url: str, channel_id: Optional[str], channel_ids: Dict[str, str]) -> None:
+        """Record a resolved URL -> channel ID mapping in the result and the cache."""
+        if channel_id:
+            channel_ids[url] = channel_id
+            self._api_cache().set(('vid2chan', url), channel_id, expire=self.VIDEO_CHANNEL_CACHE_TTL, tag='vid2chan')
+    
+    def _get_channel_id_from_url(self, url: str) -> Optional[str]:
+        """
+        Get channel ID from a video or channel URL.
         
+        Uses URLIDExtractor for video URLs and the URL itself or a /channels
+        lookup for channel URLs, with yt-dlp as the last resort.
+        
+        Args:
+            url: YouTube video or channel URL
+            
+        Returns:
+            Channel ID or None if not found
+        """
+        return self._get_channel_ids_from_urls([url]).get(url)
+    
+    def _get_channel_id_from_channel_url(self, url: str) -> Optional[str]:
+        """Resolve the channel ID of a channel URL (@username, /c/...) with yt-dlp."""
         # It's not a video URL, try to extract channel ID from channel URL
         logger.debug(f"Not a video URL, attempting to extract channel ID from channel URL: {url}")
         
         try:
             # Use yt-dlp to resolve channel ID from @username or /c/ URLs
-            ydl_opts = {
-                'quiet': True,
-                'extract_flat': True,
-                'skip_download': True,
-            }
-            
-            if self.cookies.exists():
-                ydl_opts['cookiefile'] = str(self.cookies)
+            info = self._get_flat_ydl().extract_info(url, download=False)
+            channel_id = info.get('channel_id') or info.get('uploader_id') or info.get('id')
             
-            with YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                channel_id = info.get('channel_id') or info.get('uploader_id') or info.get('id')
+            if channel_id:
+                logger.debug(f"Resolved channel ID via yt-dlp: {channel_id}")
+                return channel_id
+            else:
+                logger.warning(f"Could not resolve channel ID from: {url}")
+                return None
                 
-                if channel_id:
-                    logger.debug(f"Resolved channel ID via yt-dlp: {channel_id}")
-                    return channel_id
-                else:
-                    logger.warning(f"Could not resolve channel ID from: {url}")
-                    return None
-                    
         except Exception as e:
             logger.error(f"Error resolving channel ID from {url}: {e}")
             return None
-
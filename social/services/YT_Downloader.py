@@ -1,23 +1,66 @@
 from social.config import Config
 from social.logger import get_logger
-from social.platforms import load_platforms, DEFAULT_PLATFORM_CLASS
+from social.platforms import get_platforms, DEFAULT_PLATFORM_CLASS
 from social.platforms.base import Platform
+from social.core.thread_ydl import ThreadLocalYDL
+from social.services.url_id_extractor import get_extractor_classes
 from yt_dlp import YoutubeDL
-from yt_dlp.extractor import gen_extractor_classes
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+import asyncio
+import time
 
 logger = get_logger(__name__)
 
 class YT_Downloader:
-    def __init__(self, config: Config):
+    # Dominios frecuentes -> plataforma, para no recorrer los extractores de yt-dlp
+    _HOST_MAP = {
+        'youtube.com': 'youtube',
+        'youtu.be': 'youtube',
+        'youtube-nocookie.com': 'youtube',
+        'vk.com': 'vk',
+        'vkvideo.ru': 'vk',
+        'rutube.ru': 'rutube',
+        'tiktok.com': 'tiktok',
+    }
+    
+    def __init__(self, config: Config, platforms: Optional[Dict[str, Platform]] = None):
         """
         Inicializa el descargador YT con configuración.
         
         Args:
             config: Instancia de Config con configuraciones de plataformas
+            platforms: Plataformas ya cargadas (por defecto, las compartidas de config)
         """
         self.config = config
-        self.platforms = load_platforms(config)
+        self.platforms = platforms if platforms is not None else get_platforms(config)
+        # Plataforma ya resuelta para cada nombre de extractor
+        self._extractor_platforms: Dict[str, Platform] = {}
+        # YoutubeDL reutilizable por hilo y plataforma (no es thread-safe)
+        self._ydls = ThreadLocalYDL()
+    
+    @classmethod
+    def _extractors_cached(cls) -> Tuple[type, ...]:
+        """Devuelve las clases de extractores de yt-dlp (generadas una sola vez por proceso)."""
+        return get_extractor_classes()
+    
+    def _platform_from_host(self, url: str) -> Optional[Platform]:
+        """
+        Busca la plataforma por el dominio de la URL en _HOST_MAP.
+        
+        Prueba el host completo y luego sus dominios padre, de modo que
+        m.youtube.com o www.tiktok.com resuelven igual que el dominio base.
+        """
+        try:
+            host = urlsplit(url).hostname
+        except ValueError:
+            return None
+        while host:
+            key = self._HOST_MAP.get(host)
+            if key is not None:
+                return self.platforms.get(key)
+            host = host.partition('.')[2]
+        return None
     
     def _detect_platform_from_url(self, url: str) -> Platform:
         """
@@ -29,8 +72,14 @@ class YT_Downloader:
         Returns:
             Instancia de Platform correspondiente o Platform genérica por defecto
         """
-        # Obtener todas las clases de extractores y encontrar el que coincida con la URL
-        for ie_class in gen_extractor_classes():
+        # Dominios conocidos: búsqueda directa sin pasar por los extractores
+        platform = self._platform_from_host(url)
+        if platform is not None:
+            logger.debug(f"Platform detected from host: {platform.name}")
+            return platform
+        
+        # Recorrer las clases de extractores y encontrar la que coincida con la URL
+        for ie_class in self._extractors_cached():
             if ie_class.suitable(url):
                 # Usar ie_key() en minúsculas para mapear a la plataforma
                 extractor_key = ie_class.ie_key().lower()
@@ -53,6 +102,20 @@ class YT_Downloader:
             )
         return self.platforms['default']
     
+    def _get_ydl(self, platform: Platform, ydl_opts: Dict[str, Any]) -> YoutubeDL:
+        """
+        Obtiene el YoutubeDL del hilo actual para la plataforma.
+        
+        Se reutiliza entre descargas para no reconstruir el registro de
+        extractores ni el cookie jar en cada URL; si las opciones cambiaron
+        (cookies nuevas, auto-ajuste de concurrencia...) se crea otro.
+        """
+        return self._ydls.get(platform.name, ydl_opts)
+    
+    def close(self) -> None:
+        """Cierra los YoutubeDL reutilizados (guarda sus cookies)."""
+        self._ydls.close()
+    
     def _get_platform_for_extractor(self, extractor_name: str) -> Platform:
         """
         Obtiene la plataforma correspondiente a un extractor de yt-dlp.
@@ -63,22 +126,29 @@ class YT_Downloader:
         Returns:
             Instancia de Platform o Platform genérica por defecto
         """
+        platform = self._extractor_platforms.get(extractor_name)
+        if platform is not None:
+            return platform
+        
         # Limpiar el nombre del extractor (puede tener sufijos como '+plugin')
         base_extractor = extractor_name.split('+')[0].lower()
         
         # Buscar plataforma específica
         if base_extractor in self.platforms:
-            return self.platforms[base_extractor]
+            platform = self.platforms[base_extractor]
+        else:
+            # Usar plataforma genérica por defecto
+            logger.debug(f"No se encontró configuración específica para extractor '{extractor_name}', usando configuración genérica")
+            if 'default' not in self.platforms:
+                self.platforms['default'] = DEFAULT_PLATFORM_CLASS(
+                    name="default",
+                    config={},
+                    global_config=self.config
+                )
+            platform = self.platforms['default']
         
-        # Usar plataforma genérica por defecto
-        logger.debug(f"No se encontró configuración específica para extractor '{extractor_name}', usando configuración genérica")
-        if 'default' not in self.platforms:
-            self.platforms['default'] = DEFAULT_PLATFORM_CLASS(
-                name="default",
-                config={},
-                global_config=self.config
-            )
-        return self.platforms['default']
+        self._extractor_platforms[extractor_name] = platform
+        return platform
     
     def download(self, url: str, platform: Optional[Platform] = None, donwload=True):
         """
@@ -104,11 +174,46 @@ class YT_Downloader:
         logger.debug(f"Format: {platform.format}")
         
         logger.debug(f"YDL opts: {ydl_opts}, download: {donwload}, url: {url}")
+        start = time.monotonic()
+        ydl = self._get_ydl(platform, ydl_opts)
         try:
-            with YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=donwload)
-                logger.info(f"Descarga exitosa: {info.get('title', 'Unknown')}")
-                return info
+            info = ydl.extract_info(url, download=donwload)
+            logger.info(f"Descarga exitosa: {info.get('title', 'Unknown')}")
         except Exception as e:
             logger.error(f"Error descargando {url}: {e}")
-            raise
\ No newline at end of file
+            if donwload:
+                platform.record_download(None, time.monotonic() - start, error=e)
+            raise
+        finally:
+            # Como al cerrar un YoutubeDL, persistir las cookies actualizadas
+            ydl.save_cookies()
+        if donwload:
+            platform.record_download(info, time.monotonic() - start)
+        return info
+    
+    async def download_many(
+        self,
+        urls: List[str],
+        concurrency: int = 4
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Descarga varias URLs en paralelo, cada una en un hilo del pool por defecto.
+        
+        Se usan hilos (no procesos) porque las descargas están limitadas por red
+        y las instancias de YoutubeDL/Platform no son serializables.
+        
+        Args:
+            urls: URLs de los videos a descargar
+            concurrency: Máximo de descargas simultáneas
+            
+        Returns:
+            Lista en el mismo orden que urls con el info dict de cada descarga,
+            o la excepción producida si falló
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _download_one(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(self.download, url)
+        
+        return await asyncio.gather(*(_download_one(url) for url in urls), return_exceptions=True)
@@ -2,9 +2,11 @@
 Service for extracting channel information from video or channel URLs.
 This service delegates to platform-specific implementations.
 """
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
 from social.config import Config
-from social.platforms import load_platforms
+from social.platforms import get_platforms
+from social.platforms.base import Platform
 from social.services.url_id_extractor import URLIDExtractor
 from social.logger import get_logger
 
@@ -19,15 +21,33 @@ class ChannelInfoService:
     ensuring each platform handles its own channel info extraction logic.
     """
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, platforms: Optional[Dict[str, Platform]] = None):
         """
         Initialize the channel info service.
         
         Args:
             config: Config instance to load platforms
+            platforms: Pre-built platforms (defaults to the ones shared for config)
         """
         self.config = config
-        self.platforms = load_platforms(config)
+        self.platforms = platforms if platforms is not None else get_platforms(config)
+    
+    def _resolve_platform(self, url: str) -> Optional[Tuple[str, Platform]]:
+        """Detect the platform of a URL and return (platform_name, platform)."""
+        # Detect platform from URL
+        platform_name = URLIDExtractor.detect_platform(url)
+        if not platform_name:
+            logger.error(f"Could not detect platform from URL: {url}")
+            return None
+        
+        # Get platform instance
+        platform = self.platforms.get(platform_name.lower())
+        if not platform:
+            logger.warning(f"No platform implementation found for: {platform_name}")
+            return None
+        
+        logger.debug(f"Using platform: {platform_name} to extract channel info")
+        return platform_name, platform
     
     def get_channel_info(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -54,19 +74,10 @@ class ChannelInfoService:
             - description: Channel description
         """
         try:
-            # Detect platform from URL
-            platform_name = URLIDExtractor.detect_platform(url)
-            if not platform_name:
-                logger.error(f"Could not detect platform from URL: {url}")
+            resolved = self._resolve_platform(url)
+            if not resolved:
                 return None
-            
-            # Get platform instance
-            platform = self.platforms.get(platform_name.lower())
-            if not platform:
-                logger.warning(f"No platform implementation found for: {platform_name}")
-                return None
-            
-            logger.debug(f"Using platform: {platform_name} to extract channel info")
+            platform_name, platform = resolved
             
             # Delegate to platform's get_channel_info method
             channel_info = platform.get_channel_info(url)
@@ -83,4 +94,73 @@ class ChannelInfoService:
         except Exception as e:
             logger.error(f"Error extracting channel info from {url}: {e}")
             return None
+    
+    async def aget_channel_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Async variant of get_channel_info().
+        
+        Delegates to the platform's aget_channel_info(), so several URLs can
+        be resolved concurrently with asyncio.gather.
+        """
+        try:
+            resolved = self._resolve_platform(url)
+            if not resolved:
+                return None
+            platform_name, platform = resolved
+            
+            channel_info = await platform.aget_channel_info(url)
+            
+            if channel_info:
+                # Add platform name to the result
+                channel_info['platform'] = platform_name
+                logger.info(f"Successfully extracted channel info for: {channel_info.get('channel', 'Unknown')}")
+            else:
+                logger.warning(f"Platform {platform_name} returned no channel info")
+            
+            return channel_info
+            
+        except Exception as e:
+            logger.error(f"Error extracting channel info from {url}: {e}")
+            return None
 
+    async def aget_channel_infos_bulk(self, urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Extract channel information for several URLs.
+        
+        URLs are grouped by platform and each group goes through the
+        platform's aget_channels_info_bulk() (e.g. YouTube batches API
+        requests), with all platforms running concurrently.
+        
+        Args:
+            urls: URLs of videos or channels
+            
+        Returns:
+            Channel info (or None) for each URL, in the same order
+        """
+        groups: Dict[str, List[str]] = {}
+        resolved_platforms: Dict[str, Platform] = {}
+        for url in dict.fromkeys(urls):
+            resolved = self._resolve_platform(url)
+            if resolved:
+                platform_name, platform = resolved
+                groups.setdefault(platform_name, []).append(url)
+                resolved_platforms[platform_name] = platform
+        
+        async def _fetch(platform_name: str, group: List[str]) -> Dict[str, Dict[str, Any]]:
+            try:
+                infos = await resolved_platforms[platform_name].aget_channels_info_bulk(group)
+            except Exception as e:
+                logger.error(f"Error extracting channel info from {group}: {e}")
+                return {}
+            for channel_info in infos.values():
+                channel_info['platform'] = platform_name
+            return infos
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        for infos in await asyncio.gather(*(_fetch(name, group) for name, group in groups.items())):
+            results.update(infos)
+        
+        missing = [url for url in urls if url not in results]
+        if missing:
+            logger.warning(f"No channel info extracted for: {missing}")
+        return [results.get(url) for url in urls]
@@ -1,11 +1,13 @@
 """Facade service for channel-related operations."""
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Dict, Any, List, Optional, Union
 from telethon import TelegramClient
 
 from social.services.channel_info_service import ChannelInfoService
 from social.services.telegram_topic_service import TelegramTopicService
 from social.core.caption_builder import ChannelCaptionBuilder
 from social.config import Config
+from social.platforms.base import Platform
 from social.logger import get_logger
 
 logger = get_logger(__name__)
@@ -19,15 +21,24 @@ class ChannelOperationsService:
     and intro message sending.
     """
     
-    def __init__(self, config: Config, telegram_client: TelegramClient):
+    # Topics created at the same time by setup_channel_topics()
+    TOPIC_SETUP_CONCURRENCY = 5
+    
+    def __init__(
+        self,
+        config: Config,
+        telegram_client: TelegramClient,
+        platforms: Optional[Dict[str, Platform]] = None
+    ):
         """
         Initialize the channel operations service.
         
         Args:
             config: Config instance
             telegram_client: Connected Telegram client
+            platforms: Pre-built platforms to share with the inner services
         """
-        self.channel_info_service = ChannelInfoService(config)
+        self.channel_info_service = ChannelInfoService(config, platforms)
         self.topic_service = TelegramTopicService(telegram_client)
     
     async def setup_channel_topic(
@@ -56,8 +67,56 @@ class ChannelOperationsService:
         
         # Step 1: Extract channel info
         logger.debug("Step 1: Extracting channel info")
-        channel_info = self.channel_info_service.get_channel_info(url)
+        channel_info = await self.channel_info_service.aget_channel_info(url)
+        
+        return await self._setup_topic_from_info(url, channel_info, entity_id)
+    
+    async def setup_channel_topics(
+        self,
+        urls: List[str],
+        entity_id: int
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Setup topics for several channels.
+        
+        Channel info for all URLs is extracted in platform batches (e.g. one
+        YouTube API call per 50 videos/channels); topics are then created
+        concurrently, at most TOPIC_SETUP_CONCURRENCY at a time to stay
+        within Telegram's flood limits. A URL that fails does not stop the
+        others.
+        
+        Args:
+            urls: URLs to extract channel info from (video or channel URLs)
+            entity_id: Telegram group ID where to create the topics
+            
+        Returns:
+            List in the same order as urls with the setup_channel_topic()
+            result for each URL, or the exception it raised (ValueError if
+            its channel info could not be extracted)
+        """
+        infos = await self.channel_info_service.aget_channel_infos_bulk(urls)
+        
+        semaphore = asyncio.Semaphore(self.TOPIC_SETUP_CONCURRENCY)
+        
+        async def _setup_one(url: str, channel_info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._setup_topic_from_info(url, channel_info, entity_id)
         
+        results = await asyncio.gather(*(
+            _setup_one(url, channel_info) for url, channel_info in zip(urls, infos)
+        ), return_exceptions=True)
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Channel topic setup failed for {url}: {result}")
+        return results
+    
+    async def _setup_topic_from_info(
+        self,
+        url: str,
+        channel_info: Optional[Dict[str, Any]],
+        entity_id: int
+    ) -> Dict[str, Any]:
+        """Create the topic and send the intro message for extracted channel info."""
         if not channel_info:
             error_msg = f"Failed to extract channel info from URL: {url}"
             logger.error(error_msg)
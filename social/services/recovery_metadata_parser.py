@@ -1,16 +1,54 @@
 """Parser for recovery bot caption format."""
 import re
 from datetime import datetime
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Any, Pattern
 
 from social.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class CaptionFormat:
+    """Compiled patterns for one variant of the recovery bot caption."""
+    marker: str
+    channel_re: Pattern[str]
+    date_re: Pattern[str]
+
+
+# Compiled once at import; parse() runs them only on lines carrying the marker
+_DATE_RE = re.compile(r'📅\s*(\d{2})\.(\d{2})\.(\d{4})')
+
+# [👀 Channel: Name](URL) - markdown link format
+_V1 = CaptionFormat(
+    marker='[👀 Channel',
+    channel_re=re.compile(r'\[👀 Channel:\s*(.+?)\]\((https?://[^\)]+)\)'),
+    date_re=_DATE_RE,
+)
+# 👀 [Channel: Name] (URL) - plain text format
+_V2 = CaptionFormat(
+    marker='👀 [Channel',
+    channel_re=re.compile(r'👀\s*\[Channel:\s*(.+?)\]\s*\((https?://[^\)]+)\)'),
+    date_re=_DATE_RE,
+)
+_FORMATS = (_V1, _V2)
+_URL_RE = re.compile(r'(https?://[^\s]+)')
+_SPECIAL_TRANS = str.maketrans({'￼': '\0', '`': '\0'})
+_TITLE_STOP_RE = re.compile(r'^[a-zA-Z0-9_-]+\d+[a-zA-Z0-9]*$')
+
+
 class RecoveryMetadataParser:
     """Parse metadata from @Kyreth_hq_bot caption for VideoCaptionBuilder."""
     
+    @staticmethod
+    def detect_format(caption: str) -> CaptionFormat:
+        """Pick the caption variant by its channel marker (markdown link by default)."""
+        for fmt in _FORMATS:
+            if fmt.marker in caption:
+                return fmt
+        return _V1
+    
     @staticmethod
     def parse(caption: str) -> Dict[str, Any]:
         """Extract title, video_url, upload_date, channel_name, channel_url."""
@@ -26,52 +64,53 @@ class RecoveryMetadataParser:
         }
         
         lines = caption.strip().split('\n')
+        fmt = RecoveryMetadataParser.detect_format(caption)
         
         # Title: extract from # until video ID or resolution (e.g. abc123, 720p)
         if lines:
             first_line = lines[0].strip()
             
-            # Split by special chars (￼, backtick)
-            before_special = re.split(r'[￼`]', first_line)[0].strip()
-            
-            # Split by spaces and build title until ID/resolution
-            words = before_special.split()
+            # Cut at the first special char (￼, backtick), then split by spaces
+            # and build title until ID/resolution
+            words = first_line.translate(_SPECIAL_TRANS).partition('\0')[0].split()
             title_words = []
             for word in words:
                 # Stop at IDs (abc123) or resolutions (720p, 1080p)
-                if re.match(r'^[a-zA-Z0-9_-]+\d+[a-zA-Z0-9]*$', word):
+                if _TITLE_STOP_RE.match(word):
                     break
                 title_words.append(word)
             
             if title_words:
                 metadata['title'] = ' '.join(title_words)
         
-        # Channel: [👀 Channel: Name](URL) - markdown link format
-        for line in lines:
-            channel_match = re.search(r'\[👀 Channel:\s*(.+?)\]\((https?://[^\)]+)\)', line)
-            if channel_match:
-                metadata['channel_name'] = channel_match.group(1).strip()
-                metadata['channel_url'] = channel_match.group(2).strip()
-                break
-        
-        # Date: 📅 DD.MM.YYYY
+        # Single pass for channel, date (📅 DD.MM.YYYY) and video URL (last
+        # URL); cheap substring checks decide whether each regex runs at all
+        channel_found = date_found = False
         for line in lines:
-            date_match = re.search(r'📅\s*(\d{2})\.(\d{2})\.(\d{4})', line)
-            if date_match:
-                try:
-                    metadata['upload_date'] = datetime(
-                        int(date_match.group(3)),
-                        int(date_match.group(2)),
-                        int(date_match.group(1))
-                    )
-                except ValueError as e:
-                    logger.warning(f"Invalid date: {e}")
-                break
-        
-        # Video URL (last URL)
-        urls = re.findall(r'(https?://[^\s]+)', caption)
-        if urls:
-            metadata['video_url'] = urls[-1]
+            if 'http' in line:
+                urls = _URL_RE.findall(line)
+                if urls:
+                    metadata['video_url'] = urls[-1]
+            
+            if not channel_found and '👀' in line:
+                channel_match = fmt.channel_re.search(line)
+                if channel_match:
+                    metadata['channel_name'] = channel_match.group(1).strip()
+                    metadata['channel_url'] = channel_match.group(2).strip()
+                    channel_found = True
+            
+            if not date_found and '📅' in line:
+                date_match = fmt.date_re.search(line)
+                if date_match:
+                    date_found = True
+                    try:
+                        metadata['upload_date'] = datetime(
+                            int(date_match.group(3)),
+                            int(date_match.group(2)),
+                            int(date_match.group(1))
+                        )
+                    except ValueError as e:
+                        logger.warning(f"Invalid date: {e}")
         
         logger.info(f"Parsed: {metadata['title']} - {metadata['channel_name']}")
         return metadata
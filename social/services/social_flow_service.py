@@ -1,8 +1,13 @@
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from telethon import TelegramClient
 import asyncio
+import os
+import re
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from time import monotonic
 
 from social.config import Config
 from social.logger import get_logger
@@ -10,11 +15,45 @@ from social.services.YT_Downloader import YT_Downloader
 from social.services.telegram_uploader import TelegramUploderService, UploadOptions
 from social.services.video_recovery_service import VideoRecoveryService
 from social.services.video_database import VideoDatabaseService
+from social.services.url_id_extractor import URLIDExtractor
 from social.platforms.base import Platform
 from social.core.entity_resolver import EntityResolverFactory, ContentType
 
 logger = get_logger(__name__)
 
+# Extensiones de video que puede dejar yt-dlp (se ignoran .info.json, .part, etc.)
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mkv', '.webm', '.flv', '.avi', '.mov', '.ts'})
+
+# Short-form URLs in a single scan: YouTube shorts and TikTok (short), VK clips (clip)
+_SHORT_FORM_RE = re.compile(r'(?P<short>/shorts/|tiktok\.com)|(?P<clip>vk\.com.*?/clip)', re.IGNORECASE)
+
+
+@lru_cache(maxsize=16)
+def _scan_download_dir(dir_path: str, dir_mtime_ns: int) -> Dict[str, Tuple[str, int]]:
+    """
+    Index the video files of a download directory: {video_id: (path, mtime_ns)}.
+    
+    One os.scandir pass replaces a glob + is_file + stat per candidate. The
+    result is cached keyed by the directory mtime, so it is rebuilt only
+    when files are added, removed or renamed in the directory. Files are
+    indexed by the name up to the first dot (like a "{id}.*" glob) and up
+    to the extension (IDs containing dots); when several files share a key
+    the most recently modified one wins.
+    """
+    index: Dict[str, Tuple[str, int]] = {}
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            name = entry.name
+            first_dot, last_dot = name.find('.'), name.rfind('.')
+            if first_dot <= 0 or name[last_dot:] not in VIDEO_EXTENSIONS or not entry.is_file():
+                continue
+            mtime_ns = entry.stat().st_mtime_ns
+            for video_id in {name[:first_dot], name[:last_dot]}:
+                best = index.get(video_id)
+                if best is None or mtime_ns > best[1]:
+                    index[video_id] = (entry.path, mtime_ns)
+    return index
+
 
 class SocialFlowService:
     """
@@ -24,6 +63,13 @@ class SocialFlowService:
     3. Upload to Telegram with the caption
     """
     
+    # Seconds a resolved (entity_id, topic_id) is reused before re-checking entities.json
+    RESOLVE_TTL = 30.0
+    # Hard cap on parallel downloads; also the size of the download thread pool
+    MAX_DOWNLOAD_WORKERS = 5
+    # Downloaded videos waiting for an uploader; keeps disk usage bounded
+    UPLOAD_QUEUE_SIZE = 2
+    
     def __init__(self, config: Config, telegram_client: Optional[TelegramClient] = None, db_service: Optional[VideoDatabaseService] = None):
         """
         Initialize the social flow service.
@@ -35,10 +81,15 @@ class SocialFlowService:
         """
         self.config = config
         self.downloader = YT_Downloader(config)
-        config.load_entities()
         
-        # Initialize entity resolver factory
-        self.entity_resolver_factory = EntityResolverFactory(config.ENTITIES_FILE)
+        # Entity resolver factory shared across instances: entities.json is
+        # parsed once and only re-read when it changes on disk
+        self.entity_resolver_factory = EntityResolverFactory.shared(config.ENTITIES_FILE)
+        # (platform_name, content_type) -> (resolved_at, entity_id, topic_id)
+        self._resolve_cache: Dict[Tuple[str, ContentType], Tuple[float, Optional[int], Optional[int]]] = {}
+        # Threads dedicated to yt-dlp (created on first download), so downloads
+        # don't compete with other users of the loop's default executor
+        self._dl_executor: Optional[ThreadPoolExecutor] = None
         
         # Initialize recovery service if telegram client provided
         self.recovery_service = VideoRecoveryService(config, telegram_client) if telegram_client else None
@@ -46,6 +97,25 @@ class SocialFlowService:
         # Database service for duplicate checking
         self.db_service = db_service
     
+    def _resolve_cached(self, platform_name: str, content_type: ContentType) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Resolve entity and topic for a platform/content type, memoized for RESOLVE_TTL seconds.
+        
+        When an entry expires entities.json is re-checked, so edits to it
+        take effect without restarting the service.
+        """
+        key = (platform_name, content_type)
+        now = monotonic()
+        hit = self._resolve_cache.get(key)
+        if hit is not None and now - hit[0] < self.RESOLVE_TTL:
+            return hit[1], hit[2]
+        
+        if hit is not None:
+            self.entity_resolver_factory.reload_if_changed()
+        entity_id, topic_id = self.entity_resolver_factory.get_resolver(platform_name).resolve(content_type)
+        self._resolve_cache[key] = (now, entity_id, topic_id)
+        return entity_id, topic_id
+    
     def _get_downloaded_file_path(self, info_dict: Dict[str, Any], platform: Platform) -> Optional[Path]:
         """
         Get the path of the downloaded file from info_dict.
@@ -57,44 +127,43 @@ class SocialFlowService:
         Returns:
             Path to the downloaded file or None if not found
         """
-        # Try to get filepath from info_dict (yt-dlp sets this after download)
+        # yt-dlp sets filepath to the final file once the download (and any
+        # merge/post-processing) finished, so it is trusted without a stat
         filepath = info_dict.get('filepath')
-        
         if filepath:
-            file_path = Path(filepath)
-            if file_path.exists():
-                return file_path
+            return Path(filepath)
         
-        # Try requested_downloads (for merged formats)
-        requested_downloads = info_dict.get('requested_downloads', [])
-        if requested_downloads:
-            filepath = requested_downloads[0].get('filepath')
-            if filepath:
-                file_path = Path(filepath)
-                if file_path.exists():
-                    return file_path
+        # Try requested_downloads (for merged formats): first video file listed
+        for download in info_dict.get('requested_downloads') or ():
+            filepath = download.get('filepath')
+            if filepath and os.path.splitext(filepath)[1].lower() in VIDEO_EXTENSIONS:
+                return Path(filepath)
         
         # If filepath not in info_dict, construct it from id and ext
+        # (filesystem probes use os.path; a Path is only built for the result)
         # yt-dlp uses pattern: %(id)s.%(ext)s by default
         video_id = info_dict.get('id') or info_dict.get('display_id')
         
         if video_id:
-            download_dir = platform.get_download_dir()
-            # First, try to find any file with the video id (handles different extensions)
-            matching_files = list(download_dir.glob(f"{video_id}.*"))
-            # Filter out info.json and other metadata files, keep only video files
-            video_files = [f for f in matching_files if f.is_file() and f.suffix in ['.mp4', '.mkv', '.webm', '.flv', '.avi', '.mov', '.ts']]
-            if video_files:
-                # Return the most recently modified file (likely the downloaded video)
-                return max(video_files, key=lambda p: p.stat().st_mtime)
+            download_dir = os.fspath(platform.get_download_dir())
+            # First, look the video id up in the (cached) index of the directory,
+            # which handles different extensions and skips metadata files
+            try:
+                index = _scan_download_dir(download_dir, os.stat(download_dir).st_mtime_ns)
+            except OSError:
+                index = {}
+            found = index.get(str(video_id))
+            if found:
+                # Most recently modified file (likely the downloaded video)
+                return Path(found[0])
             
             # Fallback: try with expected extension from info_dict
             ext = info_dict.get('ext') or 'mp4'
-            file_path = download_dir / f"{video_id}.{ext}"
-            if file_path.exists():
-                return file_path
+            candidate = os.path.join(download_dir, f"{video_id}.{ext}")
+            if os.path.exists(candidate):
+                return Path(candidate)
         
-        logger.warning(f"Could not find downloaded file for video ID: {video_id}")
+        logger.warning("Could not find downloaded file for video ID: %s", video_id)
         return None
     
     def _determine_content_type(self, url: str, info_dict: Dict[str, Any], platform: Platform) -> ContentType:
@@ -109,35 +178,51 @@ class SocialFlowService:
         Returns:
             ContentType enum value
         """
-        # Check for shorts/clips indicators
-        url_lower = url.lower()
-        
-        # YouTube shorts
-        if '/shorts/' in url_lower:
-            return ContentType.SHORT
-        
-        # VK clips
-        if 'vk.com' in url_lower and '/clip' in url_lower:
-            return ContentType.CLIP
-        
-        # TikTok is always short-form
-        if 'tiktok.com' in url_lower:
-            return ContentType.SHORT
+        # Check for shorts/clips indicators (YouTube shorts, VK clips, TikTok
+        # is always short-form)
+        match = _SHORT_FORM_RE.search(url)
+        if match:
+            return ContentType.SHORT if match.lastgroup == 'short' else ContentType.CLIP
         
         # Platform-specific short detection
-        if hasattr(platform, '_is_short') and platform._is_short(info_dict):
+        is_short = getattr(platform, '_is_short', None)
+        if is_short is not None and is_short(info_dict):
             return ContentType.SHORT
         
         return ContentType.VIDEO
     
+    @staticmethod
+    def _duplicate_result(url: str) -> Dict[str, Any]:
+        """Result dict for a URL skipped because it is already in the database."""
+        video_id = URLIDExtractor.extract_id(url)
+        logger.info("Duplicate detected: %s, skipping download", video_id)
+        return {
+            'success': False,
+            'url': url,
+            'error': 'Duplicate video',
+            'message': f"Video {video_id} already exists in database",
+            'duplicate': True
+        }
+    
     async def _download_video_async(self, url: str, platform: Optional[Platform] = None) -> Dict[str, Any]:
         """Download video asynchronously without blocking the event loop."""
-        loop = asyncio.get_event_loop()
-        info_dict = await loop.run_in_executor(
-            None,
+        if self._dl_executor is None:
+            self._dl_executor = ThreadPoolExecutor(
+                max_workers=self.MAX_DOWNLOAD_WORKERS,
+                thread_name_prefix='ytdl'
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._dl_executor,
             lambda: self.downloader.download(url, platform=platform, donwload=True)
         )
-        return info_dict
+    
+    def close(self) -> None:
+        """Release the download threads and the downloader's YoutubeDL instances."""
+        if self._dl_executor is not None:
+            self._dl_executor.shutdown(wait=False)
+            self._dl_executor = None
+        self.downloader.close()
 
     async def process_video(
         self,
@@ -174,19 +259,10 @@ class SocialFlowService:
         try:
             # Check for duplicates before downloading
             if self.db_service and self.db_service.is_duplicate(url):
-                from social.services.url_id_extractor import URLIDExtractor
-                video_id = URLIDExtractor.extract_id(url)
-                logger.info(f"Duplicate detected: {video_id}, skipping download")
-                return {
-                    'success': False,
-                    'url': url,
-                    'error': 'Duplicate video',
-                    'message': f"Video {video_id} already exists in database",
-                    'duplicate': True
-                }
+                return self._duplicate_result(url)
             
             # Step 1: Download video
-            logger.info(f"Starting download process for: {url}")
+            logger.info("Starting download process for: %s", url)
             info_dict = await self._download_video_async(url, platform=platform)
             
             # Get platform (either provided or detected)
@@ -195,31 +271,28 @@ class SocialFlowService:
                 platform = self.downloader._get_platform_for_extractor(extractor)
             
             platform_name = platform.name
-            logger.info(f"Using platform: {platform_name}")
+            logger.info("Using platform: %s", platform_name)
             
-            # Step 2: Get downloaded file path
-            video_path = self._get_downloaded_file_path(info_dict, platform)
+            # Step 2: Get downloaded file path (filesystem probes run in a worker
+            # thread so other downloads keep going)
+            video_path = await asyncio.to_thread(self._get_downloaded_file_path, info_dict, platform)
             if not video_path:
                 raise FileNotFoundError(f"Downloaded video file not found for {url}")
             
-            logger.info(f"Downloaded video: {video_path}")
+            logger.info("Downloaded video: %s", video_path)
             
             # Step 3: Create caption using platform-specific logic
             caption_builder = platform.create_caption(info_dict)
             caption = caption_builder.build_caption()
-            logger.info(f"Generated caption: {caption[:100]}...")
+            logger.info("Generated caption: %.100s...", caption)
             
             # Step 4: Resolve entity and topic using entity resolver
+            content_type = self._determine_content_type(url, info_dict, platform)
             if entity_id is None or topic_id is None:
-                # Determine content type
-                content_type = self._determine_content_type(url, info_dict, platform)
-                logger.debug(f"Determined content type: {content_type.value}")
+                logger.debug("Determined content type: %s", content_type.name.lower())
                 
-                # Get resolver for platform
-                resolver = self.entity_resolver_factory.get_resolver(platform_name)
-                
-                # Resolve entity and topic
-                resolved_entity_id, resolved_topic_id = resolver.resolve(content_type)
+                # Resolve entity and topic (memoized per platform/content type)
+                resolved_entity_id, resolved_topic_id = self._resolve_cached(platform_name, content_type)
                 
                 if entity_id is None:
                     entity_id = resolved_entity_id
@@ -228,7 +301,7 @@ class SocialFlowService:
             
             # Step 5: Upload to Telegram (if clients provided)
             if telegram_client and bot_client and entity_id:
-                logger.info(f"Uploading to Telegram: entity={entity_id}, topic={topic_id}")
+                logger.info("Uploading to Telegram: entity=%s, topic=%s", entity_id, topic_id)
                 upload_options: UploadOptions = {
                     'video': str(video_path),
                     'entity': entity_id,
@@ -247,21 +320,27 @@ class SocialFlowService:
                 'video_path': video_path,
                 'caption': caption,
                 'platform_name': platform_name,
+                'entity_id': entity_id,
+                'topic_id': topic_id,
+                'content_type': content_type,
                 'message': f"Video processed successfully: {video_path.name}",
                 'recovered': recovered
             }
             
         except Exception as e:
-            logger.error(f"Error processing video {url}: {e}", exc_info=True)
+            # Failures are common in batches (deleted/geo-blocked videos):
+            # capture the traceback only when debug logging is enabled
+            logger.error("Error processing video %s: %s", url, e)
+            logger.debug("Traceback for %s", url, exc_info=True)
             
             # Try recovery if enabled and available
             if enable_recovery and self.recovery_service:
-                logger.info(f"Download failed, attempting recovery for: {url}")
+                logger.info("Download failed, attempting recovery for: %s", url)
                 try:
                     recovery_result = await self.recovery_service.recover_video(url, error_message=str(e))
                     
                     if recovery_result['success']:
-                        logger.info(f"Video recovered successfully: {url}")
+                        logger.info("Video recovered successfully: %s", url)
                         recovered = True
                         video_path = recovery_result['video_path']
                         caption = recovery_result['caption']
@@ -270,25 +349,23 @@ class SocialFlowService:
                         if entity_id is None or topic_id is None:
                             # Assume it's a short/clip since it was deleted
                             content_type = ContentType.SHORT
-                            logger.debug(f"Recovered video assumed as: {content_type.value}")
+                            logger.debug("Recovered video assumed as: %s", content_type.name.lower())
                             
                             # Detect platform from URL
-                            from social.services.url_id_extractor import URLIDExtractor
                             platform_name = URLIDExtractor.detect_platform(url) or 'youtube'
                             
-                            resolver = self.entity_resolver_factory.get_resolver(platform_name)
-                            resolved_entity_id, resolved_topic_id = resolver.resolve(content_type)
+                            resolved_entity_id, resolved_topic_id = self._resolve_cached(platform_name, content_type)
                             
                             if entity_id is None:
                                 entity_id = resolved_entity_id
                             if topic_id is None:
                                 topic_id = resolved_topic_id
                             
-                            logger.info(f"Resolved upload target: entity={entity_id}, topic={topic_id}")
+                            logger.info("Resolved upload target: entity=%s, topic=%s", entity_id, topic_id)
                         
                         # Upload recovered video if clients provided
                         if telegram_client and bot_client and entity_id:
-                            logger.info(f"Uploading recovered video to Telegram")
+                            logger.info("Uploading recovered video to Telegram")
                             upload_options: UploadOptions = {
                                 'video': str(video_path),
                                 'entity': entity_id,
@@ -309,10 +386,11 @@ class SocialFlowService:
                             'recovered': True
                         }
                     else:
-                        logger.warning(f"Recovery failed: {recovery_result.get('error')}")
+                        logger.warning("Recovery failed: %s", recovery_result.get('error'))
                 
                 except Exception as recovery_error:
-                    logger.error(f"Recovery attempt failed: {recovery_error}", exc_info=True)
+                    logger.error("Recovery attempt failed: %s", recovery_error)
+                    logger.debug("Recovery traceback for %s", url, exc_info=True)
             
             return {
                 'success': False,
@@ -330,7 +408,7 @@ class SocialFlowService:
     ) -> Dict[str, Any]:
         """Download video and prepare metadata without uploading."""
         try:
-            logger.info(f"Starting download: {url}")
+            logger.info("Starting download: %s", url)
             info_dict = await self._download_video_async(url, platform=platform)
             
             if platform is None:
@@ -338,7 +416,7 @@ class SocialFlowService:
                 platform = self.downloader._get_platform_for_extractor(extractor)
             
             platform_name = platform.name
-            video_path = self._get_downloaded_file_path(info_dict, platform)
+            video_path = await asyncio.to_thread(self._get_downloaded_file_path, info_dict, platform)
             
             if not video_path:
                 raise FileNotFoundError(f"Downloaded video file not found for {url}")
@@ -346,17 +424,16 @@ class SocialFlowService:
             caption_builder = platform.create_caption(info_dict)
             caption = caption_builder.build_caption()
             
+            content_type = self._determine_content_type(url, info_dict, platform)
             if entity_id is None or topic_id is None:
-                content_type = self._determine_content_type(url, info_dict, platform)
-                resolver = self.entity_resolver_factory.get_resolver(platform_name)
-                resolved_entity_id, resolved_topic_id = resolver.resolve(content_type)
+                resolved_entity_id, resolved_topic_id = self._resolve_cached(platform_name, content_type)
                 
                 if entity_id is None:
                     entity_id = resolved_entity_id
                 if topic_id is None:
                     topic_id = resolved_topic_id
             
-            logger.info(f"Download completed: {url}")
+            logger.info("Download completed: %s", url)
             return {
                 'success': True,
                 'url': url,
@@ -365,10 +442,11 @@ class SocialFlowService:
                 'platform_name': platform_name,
                 'entity_id': entity_id,
                 'topic_id': topic_id,
-                'content_type': self._determine_content_type(url, info_dict, platform)
+                'content_type': content_type
             }
         except Exception as e:
-            logger.error(f"Download failed for {url}: {e}", exc_info=True)
+            logger.error("Download failed for %s: %s", url, e)
+            logger.debug("Download traceback for %s", url, exc_info=True)
             return {
                 'success': False,
                 'url': url,
@@ -383,77 +461,93 @@ class SocialFlowService:
         bot_client: Optional[TelegramClient] = None,
         entity_id: Optional[int] = None,
         topic_id: Optional[int] = None,
-        max_parallel: Optional[int] = None
+        max_parallel: Optional[int] = None,
+        max_parallel_uploads: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Process videos with pipeline: parallel downloads (max 5) + sequential uploads."""
+        """
+        Process videos with pipeline: parallel downloads (max 5) + bounded uploads.
+        
+        Uploads run one at a time unless max_parallel_uploads (or the
+        MAX_PARALLEL_UPLOADS setting) allows more concurrent Telegram uploads.
+        """
         if max_parallel is None:
             max_parallel = self.config.MAX_PARALLEL_DOWNLOADS
+        if max_parallel_uploads is None:
+            max_parallel_uploads = self.config.MAX_PARALLEL_UPLOADS
         
-        max_parallel = min(max_parallel, 5)
-        logger.info(f"Processing {len(urls)} videos with max {max_parallel} parallel downloads")
+        max_parallel = min(max_parallel, self.MAX_DOWNLOAD_WORKERS)
+        max_parallel_uploads = max(1, max_parallel_uploads)
+        logger.info(
+            "Processing %s videos with max %s parallel downloads and %s parallel uploads",
+            len(urls), max_parallel, max_parallel_uploads
+        )
         
         if not urls:
             return []
         
-        final_results = []
-        download_queue = deque(urls)
-        upload_queue = asyncio.Queue()
-        download_semaphore = asyncio.Semaphore(max_parallel)
-        download_tasks = set()
+        # One slot per URL, filled by position so results keep the input order
+        final_results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+        download_queue = deque(enumerate(urls))
         
-        async def _download_with_semaphore(url, semaphore, entity_id, topic_id, queue):
-            async with semaphore:
-                result = await self._download_and_prepare(url, None, entity_id, topic_id)
-                await queue.put(result)
+        # Check every URL for duplicates up front; only new ones are downloaded
+        if self.db_service:
+            duplicates = self.db_service.filter_duplicates(urls)
+            if duplicates:
+                download_queue = deque()
+                for index, url in enumerate(urls):
+                    if url in duplicates:
+                        final_results[index] = self._duplicate_result(url)
+                    else:
+                        download_queue.append((index, url))
+        # Small bound so downloads wait for the uploaders instead of piling
+        # finished videos up on disk
+        upload_queue = asyncio.Queue(maxsize=max(self.UPLOAD_QUEUE_SIZE, max_parallel_uploads))
         
         async def download_worker():
-            """Download videos in parallel and add to upload queue."""
-            while download_queue or download_tasks:
-                if download_queue and len(download_tasks) < max_parallel:
-                    url = download_queue.popleft()
-                    task = asyncio.create_task(_download_with_semaphore(
-                        url, download_semaphore, entity_id, topic_id, upload_queue
-                    ))
-                    download_tasks.add(task)
-                    task.add_done_callback(download_tasks.discard)
-                else:
-                    if download_tasks:
-                        await asyncio.sleep(0.1)
-                    else:
-                        break
-            
-            if download_tasks:
-                await asyncio.gather(*download_tasks, return_exceptions=True)
-            
-            await upload_queue.put(None)
+            """Take URLs until none are left, handing each result to the uploader."""
+            while download_queue:
+                index, url = download_queue.popleft()
+                result = await self._download_and_prepare(url, None, entity_id, topic_id)
+                await upload_queue.put((index, result))
+        
+        async def download_supervisor():
+            """Run max_parallel download workers, then signal every uploader."""
+            async with asyncio.TaskGroup() as workers:
+                for _ in range(max_parallel):
+                    workers.create_task(download_worker())
+            for _ in range(max_parallel_uploads):
+                await upload_queue.put(None)
+        
+        upload_count = 0
         
         async def upload_worker():
-            """Upload videos sequentially from queue."""
-            upload_count = 0
+            """Upload videos from the queue, one at a time per worker."""
+            nonlocal upload_count
             while True:
-                result = await upload_queue.get()
+                item = await upload_queue.get()
                 
-                if result is None:
+                if item is None:
                     break
+                index, result = item
                 
                 if not result.get('success'):
-                    final_results.append(result)
+                    final_results[index] = result
                     continue
                 
                 if not telegram_client or not bot_client:
-                    final_results.append(result)
+                    final_results[index] = result
                     continue
                 
                 try:
                     video_path = result.get('video_path')
-                    if not video_path or not video_path.exists():
+                    if not video_path or not await asyncio.to_thread(video_path.exists):
                         result['upload_status'] = 'failed'
                         result['upload_error'] = 'Video file not found'
-                        final_results.append(result)
+                        final_results[index] = result
                         continue
                     
                     upload_count += 1
-                    logger.info(f"Uploading {upload_count}: {video_path.name}")
+                    logger.info("Uploading %s: %s", upload_count, video_path.name)
                     
                     upload_entity_id = result.get('entity_id', entity_id)
                     upload_topic_id = result.get('topic_id', topic_id)
@@ -469,17 +563,24 @@ class SocialFlowService:
                     await TelegramUploderService.upload(upload_options)
                     
                     result['upload_status'] = 'success'
-                    logger.info(f"Upload completed: {video_path.name}")
+                    logger.info("Upload completed: %s", video_path.name)
                     
                 except Exception as e:
-                    logger.error(f"Upload failed: {e}", exc_info=True)
+                    logger.error("Upload failed: %s", e)
+                    logger.debug("Upload traceback for %s", result.get('url'), exc_info=True)
                     result['upload_status'] = 'failed'
                     result['upload_error'] = str(e)
                 
-                final_results.append(result)
+                final_results[index] = result
         
-        await asyncio.gather(download_worker(), upload_worker())
+        # Uploads start as soon as the first download is ready; if either side
+        # fails unexpectedly the task group cancels the other instead of
+        # leaving it blocked on the queue
+        async with asyncio.TaskGroup() as pipeline:
+            pipeline.create_task(download_supervisor())
+            for _ in range(max_parallel_uploads):
+                pipeline.create_task(upload_worker())
         
-        logger.info(f"Batch processing completed: {len(final_results)} total results")
+        logger.info("Batch processing completed: %s total results", len(final_results))
         return final_results
 
@@ -2,12 +2,19 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 from telethon import TelegramClient
 from telethon.tl.types import Message
+import asyncio
 import re
 from social.logger import logger
 
+# Compiled once; literal scheme/host prefix so non-matching text fails fast
+_URL_RE = re.compile(r'https?://(?:www\.)?(?:youtube\.com|youtu\.be|tiktok\.com|vk\.com|rutube\.ru)\S+')
+
 
 class TelegramMessageScanner:
     
+    # Messages buffered between the fetcher and the URL extractor
+    PREFETCH_SIZE = 500
+    
     def __init__(self, client: TelegramClient):
         self.client = client
     
@@ -18,19 +25,39 @@ class TelegramMessageScanner:
         results = []
         try:
             entity = await self.client.get_entity(group_id)
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.PREFETCH_SIZE)
+            
+            async def fetch():
+                """Keep requesting pages while earlier messages are being parsed."""
+                # wait_time=0: no fixed 1 s pause per page on large scans;
+                # Telethon still sleeps on an actual FloodWaitError
+                async for message in self.client.iter_messages(entity, limit=limit, wait_time=0):
+                    if message:
+                        await queue.put(message)
+                await queue.put(None)
+            
+            async def extract():
+                while (message := await queue.get()) is not None:
+                    if not message.text:
+                        continue
+                    
+                    urls = self._extract_urls(message.text)
+                    if urls:
+                        results.append({
+                            'message_id': message.id,
+                            'date': message.date,
+                            'text': message.text,
+                            'urls': urls
+                        })
             
-            async for message in self.client.iter_messages(entity, limit=limit):
-                if not message or not message.text:
-                    continue
-                
-                urls = self._extract_urls(message.text)
-                if urls:
-                    results.append({
-                        'message_id': message.id,
-                        'date': message.date,
-                        'text': message.text,
-                        'urls': urls
-                    })
+            # Single extractor so results keep Telegram's message order
+            try:
+                async with asyncio.TaskGroup() as tasks:
+                    tasks.create_task(fetch())
+                    tasks.create_task(extract())
+            except ExceptionGroup as eg:
+                # Surface the original error (e.g. a Telethon RPC error) to callers
+                raise eg.exceptions[0]
             
             logger.info(f"Found {len(results)} messages with URLs")
             return results
@@ -41,6 +68,8 @@ class TelegramMessageScanner:
     
     def _extract_urls(self, text: str) -> List[str]:
         """Extract video URLs from text."""
-        pattern = r'https?://(?:www\.)?(?:youtube\.com|youtu\.be|tiktok\.com|vk\.com|rutube\.ru)[^\s]+'
-        return re.findall(pattern, text)
+        # Most messages carry no link at all: skip the regex for them
+        if not text or 'http' not in text:
+            return []
+        return _URL_RE.findall(text)
 
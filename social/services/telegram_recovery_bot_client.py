@@ -3,9 +3,10 @@ import asyncio
 from pathlib import Path
 from typing import Optional, Tuple
 from telethon import TelegramClient
-from telethon.tl.types import Message
+from telethon.tl.types import Message, TypeInputPeer
 
 from social.logger import get_logger
+from social.services.url_id_extractor import URLIDExtractor
 
 logger = get_logger(__name__)
 
@@ -15,14 +16,26 @@ class TelegramRecoveryBotClient:
     
     BOT_USERNAME = "@Kyreth_hq_bot"
     TIMEOUT_SECONDS = 60
+    # Largest chunk Telegram serves per request; fewer round-trips than
+    # Telethon's size-based default (128 KB for files up to 100 MB)
+    DOWNLOAD_REQUEST_SIZE = 512 * 1024
     
     def __init__(self, client: TelegramClient):
         self.client = client
+        # Bot peer resolved on first use, reused by every later recovery
+        self._bot_peer: Optional[TypeInputPeer] = None
+    
+    async def _get_bot_peer(self) -> TypeInputPeer:
+        """Resolve the bot's input peer once per client."""
+        if self._bot_peer is None:
+            self._bot_peer = await self.client.get_input_entity(self.BOT_USERNAME)
+        return self._bot_peer
     
     async def recover_video(self, video_url: str, download_path: Optional[Path] = None) -> Tuple[Optional[Path], Optional[str]]:
         """Send URL to bot, download video. Returns (video_path, caption)."""
         try:
-            async with self.client.conversation(self.BOT_USERNAME, timeout=self.TIMEOUT_SECONDS) as conv:
+            peer = await self._get_bot_peer()
+            async with self.client.conversation(peer, timeout=self.TIMEOUT_SECONDS) as conv:
                 await conv.send_message(video_url)
                 
                 response1: Message = await conv.get_response()
@@ -43,25 +56,20 @@ class TelegramRecoveryBotClient:
                 if download_path is None:
                     download_path = Path.cwd() / "downloads" / "recovery"
                 
-                download_path.mkdir(parents=True, exist_ok=True)
-                
-                file_path = await response2.download_media(file=str(download_path))
-                
-                if file_path is None:
-                    raise ValueError("Failed to download video")
-                
-                original_file = Path(file_path)
+                await asyncio.to_thread(download_path.mkdir, parents=True, exist_ok=True)
                 
-                # Rename to video_id.extension
-                from social.services.url_id_extractor import URLIDExtractor
+                # Save as video_id.extension (the media name if there is no ID)
+                media = response2.file
+                ext = media.ext or '.mp4'
                 video_id = URLIDExtractor.extract_id(video_url)
                 if video_id:
-                    new_name = f"{video_id}{original_file.suffix}"
-                    video_file = original_file.parent / new_name
-                    original_file.rename(video_file)
-                    logger.info(f"Renamed to: {video_file.name}")
+                    file_name = f"{video_id}{ext}"
                 else:
-                    video_file = original_file
+                    file_name = media.name or f"video_{response2.id}{ext}"
+                video_file = download_path / file_name
+                
+                await self._download_to(response2, media.size, video_file)
+                logger.info(f"Downloaded to: {video_file.name}")
                 
                 return video_file, caption
                 
@@ -71,10 +79,39 @@ class TelegramRecoveryBotClient:
             logger.error(f"Recovery error: {e}", exc_info=True)
             raise
     
+    async def _download_to(self, message: Message, file_size: Optional[int], video_file: Path) -> None:
+        """
+        Stream the message media into video_file in DOWNLOAD_REQUEST_SIZE chunks.
+        
+        Data goes to a .part file that is renamed once complete, so a partial
+        download never looks like a finished video. Disk writes run in a
+        worker thread to keep the event loop free.
+        """
+        part_file = video_file.with_name(video_file.name + '.part')
+        written = 0
+        f = await asyncio.to_thread(open, part_file, 'wb')
+        try:
+            try:
+                async for chunk in self.client.iter_download(
+                    message.media,
+                    request_size=self.DOWNLOAD_REQUEST_SIZE,
+                    file_size=file_size
+                ):
+                    await asyncio.to_thread(f.write, chunk)
+                    written += len(chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+            if not written:
+                raise ValueError("Failed to download video")
+            await asyncio.to_thread(part_file.replace, video_file)
+        except BaseException:
+            part_file.unlink(missing_ok=True)
+            raise
+    
     async def check_bot_available(self) -> bool:
-        """Check if bot is available."""
+        """Check if bot is available (resolves and caches its peer)."""
         try:
-            await self.client.get_entity(self.BOT_USERNAME)
+            await self._get_bot_peer()
             return True
         except Exception:
             return False
@@ -3,7 +3,8 @@
 This module extracts video IDs from various platform URLs using yt-dlp's extractors,
 avoiding the need to make HTTP requests.
 """
-from typing import Optional
+from functools import cache, lru_cache
+from typing import Optional, Tuple
 from yt_dlp.extractor import gen_extractor_classes
 
 from social.logger import get_logger
@@ -11,9 +12,76 @@ from social.logger import get_logger
 logger = get_logger(__name__)
 
 
+@cache
+def get_extractor_classes() -> Tuple[type, ...]:
+    """yt-dlp extractor classes in priority order, generated once per process."""
+    return tuple(gen_extractor_classes())
+
+
 class URLIDExtractor:
     """Extract video IDs from platform URLs using yt-dlp extractors."""
     
+    @staticmethod
+    def _match_id(ie_class: type, url: str) -> Optional[str]:
+        """Video ID from an extractor's URL match, or None if it has none."""
+        try:
+            # Use _match_valid_url to extract ID without HTTP request
+            match = ie_class._match_valid_url(url)
+        except Exception as e:
+            logger.debug(f"Could not extract ID using {ie_class.IE_NAME}: {e}")
+            return None
+        if not match:
+            return None
+        
+        groupdict = match.groupdict()
+        
+        # Try common ID group names
+        for id_key in ['id', 'videoid', 'video_id', 'v']:
+            if groupdict.get(id_key) is not None:
+                video_id = groupdict[id_key]
+                logger.debug(f"Extracted ID '{video_id}' using {ie_class.IE_NAME} (key: {id_key})")
+                return video_id
+        
+        # Fallback: get first non-None group
+        for group in match.groups():
+            if group is not None:
+                logger.debug(f"Extracted ID '{group}' from first non-None group using {ie_class.IE_NAME}")
+                return group
+        return None
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def extract(url: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Detect the platform and extract the video ID in a single pass over the extractors.
+        
+        Results are memoized per URL: the database sync and duplicate checks
+        look the same URLs up repeatedly.
+        
+        Args:
+            url: Video URL from any platform
+            
+        Returns:
+            Tuple of (platform name, video ID); either may be None
+        """
+        platform_name = None
+        try:
+            for ie_class in get_extractor_classes():
+                # Check if this extractor can handle the URL
+                if not ie_class.suitable(url):
+                    continue
+                if platform_name is None:
+                    platform_name = ie_class.IE_NAME.lower()
+                    logger.debug(f"Detected platform: {platform_name}")
+                video_id = URLIDExtractor._match_id(ie_class, url)
+                if video_id is not None:
+                    return platform_name, video_id
+            return platform_name, None
+        
+        except Exception as e:
+            logger.error(f"Error extracting ID from URL {url}: {e}")
+            return platform_name, None
+    
     @staticmethod
     def extract_id(url: str) -> Optional[str]:
         """
@@ -33,41 +101,10 @@ class URLIDExtractor:
             https://vk.com/video-123456_789012 -> -123456_789012
             https://www.tiktok.com/@user/video/1234567890 -> 1234567890
         """
-        try:
-            # Iterate through all yt-dlp extractors
-            for ie_class in gen_extractor_classes():
-                # Check if this extractor can handle the URL
-                if ie_class.suitable(url):
-                    try:
-                        # Use _match_valid_url to extract ID without HTTP request
-                        match = ie_class._match_valid_url(url)
-                        if match:
-                            groupdict = match.groupdict()
-                            
-                            # Try common ID group names
-                            for id_key in ['id', 'videoid', 'video_id', 'v']:
-                                if id_key in groupdict and groupdict[id_key] is not None:
-                                    video_id = groupdict[id_key]
-                                    logger.debug(f"Extracted ID '{video_id}' using {ie_class.IE_NAME} (key: {id_key})")
-                                    return video_id
-                            
-                            # Fallback: get first non-None group
-                            groups = match.groups()
-                            for group in groups:
-                                if group is not None:
-                                    video_id = group
-                                    logger.debug(f"Extracted ID '{video_id}' from first non-None group using {ie_class.IE_NAME}")
-                                    return video_id
-                    except Exception as e:
-                        logger.debug(f"Could not extract ID using {ie_class.IE_NAME}: {e}")
-                        continue
-            
+        video_id = URLIDExtractor.extract(url)[1]
+        if video_id is None:
             logger.warning(f"Could not extract ID from URL: {url}")
-            return None
-        
-        except Exception as e:
-            logger.error(f"Error extracting ID from URL {url}: {e}")
-            return None
+        return video_id
     
     @staticmethod
     def detect_platform(url: str) -> Optional[str]:
@@ -80,15 +117,4 @@ class URLIDExtractor:
         Returns:
             Platform name (extractor IE_NAME) or None
         """
-        try:
-            for ie_class in gen_extractor_classes():
-                if ie_class.suitable(url):
-                    platform_name = ie_class.IE_NAME.lower()
-                    logger.debug(f"Detected platform: {platform_name}")
-                    return platform_name
-            
-            return None
-        except Exception as e:
-            logger.error(f"Error detecting platform from URL {url}: {e}")
-            return None
-
+        return URLIDExtractor.extract(url)[0]
@@ -6,7 +6,7 @@ This service manages a text-based database stored entirely in Telegram:
 """
 import re
 import tempfile
-from typing import Set, Optional, Dict, Any
+from typing import List, Set, Optional, Dict, Any
 from pathlib import Path
 from telethon import TelegramClient
 from telethon.tl.types import Message
@@ -381,6 +381,25 @@ class VideoDatabaseService:
         
         return is_dup
     
+    def filter_duplicates(self, urls: List[str]) -> Set[str]:
+        """
+        Check several URLs at once.
+        
+        Args:
+            urls: Video URLs to check
+            
+        Returns:
+            The subset of urls already processed
+        """
+        duplicates = set()
+        for url in urls:
+            video_id = URLIDExtractor.extract_id(url)
+            if video_id and video_id in self.video_ids:
+                duplicates.add(url)
+        if duplicates:
+            logger.info(f"Duplicates detected: {len(duplicates)} of {len(urls)}")
+        return duplicates
+    
     def add_id(self, video_id: str):
         """
         Add a video ID to the database.
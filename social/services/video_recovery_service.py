@@ -1,8 +1,11 @@
 """Video Recovery Service."""
+import asyncio
+import random
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 from telethon import TelegramClient
+from telethon.errors import FloodWaitError
 
 from social.logger import get_logger
 from social.config import Config
@@ -16,11 +19,30 @@ logger = get_logger(__name__)
 class VideoRecoveryService:
     """Recover deleted/unavailable videos using @Kyreth_hq_bot."""
     
+    # Attempts per video for transient errors (flood wait, network, bot timeout)
+    MAX_ATTEMPTS = 3
+    BACKOFF_CAP = 30.0
+    
     def __init__(self, config: Config, telegram_client: TelegramClient):
         self.config = config
         self.bot_client = TelegramRecoveryBotClient(telegram_client)
         self.parser = RecoveryMetadataParser()
     
+    async def _recover_with_retry(self, video_url: str, download_dir: Path) -> Tuple[Optional[Path], Optional[str]]:
+        """Ask the bot for the video, retrying transient errors with capped exponential backoff."""
+        for attempt in range(self.MAX_ATTEMPTS):
+            try:
+                return await self.bot_client.recover_video(video_url, download_dir)
+            except (FloodWaitError, ConnectionError, TimeoutError) as e:
+                if attempt == self.MAX_ATTEMPTS - 1:
+                    raise
+                if isinstance(e, FloodWaitError):
+                    delay = e.seconds
+                else:
+                    delay = min(self.BACKOFF_CAP, 2 ** attempt) + random.uniform(0, 1)
+                logger.warning(f"Recovery attempt {attempt + 1} failed ({e}), retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+    
     async def recover_video(self, video_url: str, download_dir: Optional[Path] = None, error_message: Optional[str] = None) -> Dict[str, Any]:
         """Recover video and rebuild caption."""
         logger.info(f"Recovering: {video_url}")
@@ -32,9 +54,9 @@ class VideoRecoveryService:
             if download_dir is None:
                 download_dir = self.config.DOWNLOADS_DIR / "recovery"
             
-            video_file, raw_caption = await self.bot_client.recover_video(video_url, download_dir)
+            video_file, raw_caption = await self._recover_with_retry(video_url, download_dir)
             
-            if not video_file or not video_file.exists():
+            if not video_file or not await asyncio.to_thread(video_file.exists):
                 raise ValueError("Download failed")
             
             try:
@@ -113,7 +135,6 @@ class VideoRecoveryService:
     async def recover_videos_batch(self, video_urls: list[str], download_dir: Optional[Path] = None) -> list[Dict[str, Any]]:
         """Recover multiple videos sequentially."""
         logger.info(f"Batch recovery: {len(video_urls)} videos")
-        import asyncio
         results = []
         for i, url in enumerate(video_urls, 1):
             result = await self.recover_video(url, download_dir)
@@ -35,6 +35,7 @@ def config(temp_dir, monkeypatch):
     config.CONFIG_DIR = temp_dir / 'config'
     config.COOKIES_DIR = temp_dir / 'cookies'
     config.DOWNLOADS_DIR = temp_dir / 'downloads'
+    config.STATE_DIR = temp_dir / 'state'
     config.ENTITIES_FILE = temp_dir / 'config' / 'entities.json'
     config.PLATFORMS_FILE = temp_dir / 'config' / 'platforms.json'
     
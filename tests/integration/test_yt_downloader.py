@@ -62,17 +62,15 @@ class TestYT_Downloader:
         """Test que download detecta automáticamente la plataforma."""
         from unittest.mock import MagicMock
         
-        # Mock de YoutubeDL con context manager
+        # Mock de YoutubeDL (instancia reutilizada por hilo)
         mock_ydl_instance = MagicMock()
         mock_ydl_instance.extract_info.side_effect = [
             {'extractor': 'youtube', 'title': 'Test Video'},  # Para detectar
             {'extractor': 'youtube', 'title': 'Test Video'},  # Para descargar
         ]
-        mock_ydl_class = MagicMock()
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl_instance
-        mock_ydl_class.return_value.__exit__.return_value = None
+        mock_ydl_class = MagicMock(return_value=mock_ydl_instance)
         
-        monkeypatch.setattr('social.services.YT_Downloader.YoutubeDL', mock_ydl_class)
+        monkeypatch.setattr('social.core.thread_ydl.YoutubeDL', mock_ydl_class)
         
         downloader = YT_Downloader(config)
         downloader.download('https://youtube.com/watch?v=test')
@@ -86,11 +84,9 @@ class TestYT_Downloader:
         
         mock_ydl_instance = MagicMock()
         mock_ydl_instance.extract_info.return_value = {'extractor': 'youtube', 'title': 'Test Video'}
-        mock_ydl_class = MagicMock()
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl_instance
-        mock_ydl_class.return_value.__exit__.return_value = None
+        mock_ydl_class = MagicMock(return_value=mock_ydl_instance)
         
-        monkeypatch.setattr('social.services.YT_Downloader.YoutubeDL', mock_ydl_class)
+        monkeypatch.setattr('social.core.thread_ydl.YoutubeDL', mock_ydl_class)
         
         downloader = YT_Downloader(config)
         platform = downloader.platforms['youtube']
@@ -109,11 +105,9 @@ class TestYT_Downloader:
             {'extractor': 'youtube', 'title': 'Test Video'},  # Para detección
             {'extractor': 'youtube', 'title': 'Test Video'},  # Para descarga
         ]
-        mock_ydl_class = MagicMock()
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl_instance
-        mock_ydl_class.return_value.__exit__.return_value = None
+        mock_ydl_class = MagicMock(return_value=mock_ydl_instance)
         
-        monkeypatch.setattr('social.services.YT_Downloader.YoutubeDL', mock_ydl_class)
+        monkeypatch.setattr('social.core.thread_ydl.YoutubeDL', mock_ydl_class)
         
         downloader = YT_Downloader(config)
         downloader.download('https://youtube.com/watch?v=test')
@@ -130,11 +124,9 @@ class TestYT_Downloader:
         
         mock_ydl_instance = MagicMock()
         mock_ydl_instance.extract_info.side_effect = Exception("Extraction failed")
-        mock_ydl_class = MagicMock()
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl_instance
-        mock_ydl_class.return_value.__exit__.return_value = None
+        mock_ydl_class = MagicMock(return_value=mock_ydl_instance)
         
-        monkeypatch.setattr('social.services.YT_Downloader.YoutubeDL', mock_ydl_class)
+        monkeypatch.setattr('social.core.thread_ydl.YoutubeDL', mock_ydl_class)
         
         downloader = YT_Downloader(config)
         
@@ -150,12 +142,10 @@ class TestYT_Downloader:
             {'extractor': 'youtube', 'title': 'Test Video'},  # Para detección
             {'extractor': 'youtube', 'title': 'Test Video'},  # Para descarga
         ]
-        mock_ydl_class = MagicMock()
-        mock_ydl_class.return_value.__enter__.return_value = mock_ydl_instance
-        mock_ydl_class.return_value.__exit__.return_value = None
+        mock_ydl_class = MagicMock(return_value=mock_ydl_instance)
         
         mock_logger = MagicMock()
-        monkeypatch.setattr('social.services.YT_Downloader.YoutubeDL', mock_ydl_class)
+        monkeypatch.setattr('social.core.thread_ydl.YoutubeDL', mock_ydl_class)
         monkeypatch.setattr('social.services.YT_Downloader.logger', mock_logger)
         
         downloader = YT_Downloader(config)
@@ -0,0 +1,22 @@
+"""Tests for the bot BatchHandler."""
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from social.bot.handlers.batch_handler import BatchHandler
+
+
+@pytest.mark.asyncio
+async def test_existing_profile_lists_configured_entities(config):
+    """Test that "Use existing profile" offers the topics from entities.json."""
+    config.ENTITIES_FILE.write_text(json.dumps({"youtube": {"group_id": -100, "topics": {"videos": 5}}}))
+    handler = BatchHandler(config, MagicMock(), MagicMock())
+    event = MagicMock()
+    event.edit = AsyncMock()
+    
+    await handler._handle_existing_profile(event, ["https://youtu.be/jNQXAC9IVRw"])
+    
+    text = event.edit.await_args.args[0]
+    buttons = event.edit.await_args.kwargs['buttons']
+    assert text == "Select profile:"
+    assert buttons[0][0].text == "📁 youtube/videos"
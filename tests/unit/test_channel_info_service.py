@@ -0,0 +1,32 @@
+"""Unit tests for ChannelInfoService."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from social.services.channel_info_service import ChannelInfoService
+
+
+class TestChannelInfoService:
+    """Tests for ChannelInfoService class."""
+
+    @pytest.mark.asyncio
+    async def test_aget_channel_infos_bulk_groups_by_platform(self, config):
+        """Test that URLs of one platform are resolved with a single bulk call, in order."""
+        youtube = MagicMock()
+        youtube.aget_channels_info_bulk = AsyncMock(side_effect=lambda urls: {
+            url: {'channel': url[-1]} for url in urls if not url.endswith('c')
+        })
+        service = ChannelInfoService(config, platforms={'youtube': youtube})
+        urls = [
+            'https://www.youtube.com/watch?v=aaaaaaaaaaa',
+            'https://www.youtube.com/watch?v=bbbbbbbbbbb',
+            'https://www.youtube.com/watch?v=ccccccccccc',
+        ]
+
+        results = await service.aget_channel_infos_bulk(urls)
+
+        youtube.aget_channels_info_bulk.assert_awaited_once_with(urls)
+        assert results == [
+            {'channel': 'a', 'platform': 'youtube'},
+            {'channel': 'b', 'platform': 'youtube'},
+            None,
+        ]
@@ -0,0 +1,42 @@
+"""Unit tests for ChannelOperationsService."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from social.services.channel_operations_service import ChannelOperationsService
+
+
+class TestChannelOperationsService:
+    """Tests for ChannelOperationsService class."""
+
+    @pytest.mark.asyncio
+    async def test_setup_channel_topics_returns_per_url_results(self, config):
+        """Test that one failing URL doesn't stop the topics of the others."""
+        youtube = MagicMock()
+        youtube.aget_channels_info_bulk = AsyncMock(return_value={
+            'https://www.youtube.com/watch?v=aaaaaaaaaaa': {'channel': 'A'},
+            'https://www.youtube.com/watch?v=bbbbbbbbbbb': {'channel': 'B'},
+        })
+        urls = [
+            'https://www.youtube.com/watch?v=aaaaaaaaaaa',
+            'https://www.youtube.com/watch?v=bbbbbbbbbbb',
+            'https://www.youtube.com/watch?v=ccccccccccc',
+        ]
+
+        async def create_topic(entity_id, topic_name):
+            if topic_name == 'B':
+                raise RuntimeError('flood wait')
+            return 10
+
+        with patch('social.services.channel_operations_service.TelegramTopicService') as topic_service_cls:
+            topic_service = topic_service_cls.return_value
+            topic_service.create_topic = AsyncMock(side_effect=create_topic)
+            topic_service.send_intro_message = AsyncMock()
+            service = ChannelOperationsService(config, MagicMock(), platforms={'youtube': youtube})
+
+            results = await service.setup_channel_topics(urls, -100123)
+
+        assert results[0]['topic_id'] == 10
+        assert results[0]['platform'] == 'youtube'
+        assert isinstance(results[1], RuntimeError)
+        assert isinstance(results[2], ValueError)
+        topic_service.send_intro_message.assert_awaited_once()
@@ -0,0 +1,45 @@
+"""Unit tests for ConcurrencyTuner."""
+from social.core.concurrency_tuner import ConcurrencyTuner
+
+
+class TestConcurrencyTuner:
+    """Tests for ConcurrencyTuner class."""
+
+    def test_suggest_without_history_returns_start(self):
+        """Test that an unknown platform starts at the low default."""
+        tuner = ConcurrencyTuner()
+
+        assert tuner.suggest("rutube") == ConcurrencyTuner.START_CONCURRENCY
+
+    def test_suggest_grows_while_throughput_grows(self):
+        """Test that concurrency increases while throughput keeps improving."""
+        tuner = ConcurrencyTuner()
+
+        first = tuner.suggest("rutube", 10.0)
+        second = tuner.suggest("rutube", 20.0)
+
+        assert second > first > ConcurrencyTuner.START_CONCURRENCY
+
+    def test_suggest_backs_off_on_errors(self):
+        """Test that errors halve the concurrency."""
+        tuner = ConcurrencyTuner()
+        tuner.suggest("rutube", 10.0)
+        tuner.suggest("rutube", 20.0)
+
+        assert tuner.suggest("rutube", None, last_errors=1) == (ConcurrencyTuner.START_CONCURRENCY + 2 * ConcurrencyTuner.STEP) // 2
+
+    def test_state_is_persisted(self, temp_dir):
+        """Test that the tuned value survives a new tuner instance."""
+        state_file = temp_dir / "state" / "concurrency.json"
+        value = ConcurrencyTuner(state_file).suggest("rutube", 10.0)
+
+        assert ConcurrencyTuner(state_file).suggest("rutube") == value
+
+    def test_state_write_leaves_no_temp_files(self, temp_dir):
+        """Test that the state file is replaced atomically, without leftovers."""
+        state_file = temp_dir / "concurrency.json"
+        tuner = ConcurrencyTuner(state_file)
+        tuner.suggest("rutube", 10.0)
+        tuner.suggest("rutube", 20.0)
+
+        assert [p.name for p in temp_dir.iterdir()] == ["concurrency.json"]
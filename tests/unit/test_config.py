@@ -66,6 +66,14 @@ class TestConfig:
         
         assert platforms_config == {}
     
+    def test_load_platforms_config_unreadable(self, config):
+        """Test que load_platforms_config retorna {} si el archivo no se puede leer."""
+        config.PLATFORMS_FILE.mkdir(parents=True)
+        
+        platforms_config = config.load_platforms_config()
+        
+        assert platforms_config == {}
+    
     def test_load_entities_file_exists(self, config, temp_dir):
         """Test que load_entities carga el archivo si existe."""
         entities_data = {'entity1': {'name': 'test'}}
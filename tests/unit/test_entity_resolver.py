@@ -1,6 +1,7 @@
 """Unit tests for Entity Resolver."""
 import pytest
 import json
+import os
 import tempfile
 from pathlib import Path
 
@@ -55,6 +56,10 @@ class TestEntityConfig:
         topic_id = config.get_topic_id(ContentType.SHORT)
         assert topic_id is None
 
+    def test_content_type_is_int_indexed(self):
+        """Test that content types are contiguous integer indexes."""
+        assert [int(ct) for ct in ContentType] == [0, 1, 2]
+
 
 class TestEntityResolver:
     """Tests for EntityResolver class."""
@@ -130,6 +135,16 @@ class TestEntityResolverFactory:
         finally:
             temp_file.unlink()
     
+    def test_load_configs_unreadable_file(self):
+        """Test that an unreadable entities file leaves the factory empty."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # A directory can't be read as a file (IsADirectoryError)
+            factory = EntityResolverFactory(Path(temp_dir))
+            
+            entity_id, topic_id = factory.get_resolver("youtube").resolve(ContentType.VIDEO)
+            assert entity_id is None
+            assert topic_id is None
+    
     def test_get_resolver_for_unconfigured_platform(self):
         """Test getting resolver for platform without configuration."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
@@ -161,4 +176,34 @@ class TestEntityResolverFactory:
         entity_id, topic_id = resolver.resolve(ContentType.VIDEO)
         assert entity_id is None
         assert topic_id is None
-
+    
+    def test_get_resolver_is_reused_until_reload(self):
+        """Test that resolvers are built once per platform and rebuilt after reload."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"youtube": {"group_id": -1001234567890, "topics": {"videos": 5}}}, f)
+            temp_file = Path(f.name)
+        
+        try:
+            factory = EntityResolverFactory(temp_file)
+            resolver = factory.get_resolver("youtube")
+            
+            assert factory.get_resolver("YouTube") is resolver
+            factory.reload()
+            assert factory.get_resolver("youtube") is not resolver
+        
+        finally:
+            temp_file.unlink()
+    
+    def test_shared_factory_reloads_only_when_file_changes(self, temp_dir):
+        """Test that shared() reuses one factory per file and picks up edits."""
+        entities_file = temp_dir / "entities.json"
+        entities_file.write_text(json.dumps({"youtube": {"group_id": -100, "topics": {"videos": 5}}}))
+        
+        factory = EntityResolverFactory.shared(entities_file)
+        assert EntityResolverFactory.shared(entities_file) is factory
+        
+        entities_file.write_text(json.dumps({"youtube": {"group_id": -200, "topics": {"videos": 5}}}))
+        os.utime(entities_file, ns=(0, factory._loaded_mtime_ns + 1))
+        
+        entity_id, _ = EntityResolverFactory.shared(entities_file).get_resolver("youtube").resolve(ContentType.VIDEO)
+        assert entity_id == -200
@@ -1,6 +1,14 @@
 """Tests para social.platforms."""
+import gc
+import weakref
 import pytest
 from pathlib import Path
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import httpx
+import requests
+from yt_dlp.utils import DownloadError, ExtractorError
 
 from social.platforms import (
     Platform,
@@ -8,10 +16,12 @@ from social.platforms import (
     VKPlatform,
     RutubePlatform,
     load_platforms,
+    get_platforms,
     EXTRACTOR_TO_PLATFORM,
     DEFAULT_PLATFORM_CLASS,
 )
 from social.config import Config
+from social.platforms.youtube import _parse_published_at
 
 
 class TestPlatform:
@@ -25,7 +35,6 @@ class TestPlatform:
         assert platform.format == Platform.DEFAULT_FORMAT
         assert platform.cookies == config.COOKIES_DIR / 'test.txt'
         assert platform.download_dir == config.DOWNLOADS_DIR / 'test'
-        assert platform.download_dir.exists()
         assert platform.extra_opts == {}
     
     def test_platform_init_with_config(self, config):
@@ -105,6 +114,15 @@ class TestPlatform:
         
         assert platform.get_download_dir() == platform.download_dir
         assert platform.get_download_dir() == config.DOWNLOADS_DIR / 'test'
+        assert platform.download_dir.exists()
+    
+    def test_platform_init_does_not_create_download_dir(self, config):
+        """Test que el directorio de descarga se crea en el primer uso, no en __init__."""
+        platform = Platform(name='test', global_config=config)
+        
+        assert not platform.download_dir.exists()
+        platform.get_ydl_opts()
+        assert platform.download_dir.exists()
     
     def test_platform_get_cookies_path(self, config):
         """Test que get_cookies_path retorna la ruta correcta."""
@@ -113,6 +131,29 @@ class TestPlatform:
         assert platform.get_cookies_path() == platform.cookies
         assert platform.get_cookies_path() == config.COOKIES_DIR / 'test.txt'
 
+    def test_platform_parse_creation_date_yyyymmdd(self, config):
+        """Test que _parse_creation_date parsea upload_date/release_date YYYYMMDD."""
+        platform = Platform(name='test', global_config=config)
+
+        assert platform._parse_creation_date({'upload_date': '20251106'}) == datetime(2025, 11, 6)
+        assert platform._parse_creation_date(
+            {'upload_date': '20251306', 'release_date': '20240101'}
+        ) == datetime(2024, 1, 1)
+        assert platform._parse_creation_date(
+            {'timestamp': 'bad', 'upload_date': '20230229', 'release_date': '20240229'}
+        ) == datetime(2024, 2, 29)
+        assert platform._parse_creation_date(
+            {'upload_date': '2024010²', 'release_date': '20240102'}
+        ) == datetime(2024, 1, 2)
+
+    def test_platform_parse_creation_date_timestamp(self, config):
+        """Test que _parse_creation_date acepta timestamps posteriores a 2038 e ignora bool."""
+        platform = Platform(name='test', global_config=config)
+
+        assert platform._parse_creation_date({'timestamp': 1 << 31}) == datetime.fromtimestamp(1 << 31)
+        assert platform._parse_creation_date({'timestamp': True, 'upload_date': '20240101'}) == datetime(2024, 1, 1)
+        assert platform._parse_creation_date({'timestamp': 1e20, 'upload_date': '20240101'}) == datetime(2024, 1, 1)
+
 
 class TestYouTubePlatform:
     """Tests para YouTubePlatform."""
@@ -141,6 +182,202 @@ class TestYouTubePlatform:
         
         assert opts['format'] == YouTubePlatform.DEFAULT_FORMAT
         assert 'outtmpl' in opts
+    
+    def test_youtube_is_short_falls_back_to_webpage_url(self, config):
+        """Test que un Short se detecta por webpage_url si falta original_url."""
+        platform = YouTubePlatform(name='youtube', global_config=config)
+        
+        assert platform._is_short({'webpage_url': 'https://www.youtube.com/shorts/abc'})
+        assert not platform._is_short({'original_url': 'https://www.youtube.com/watch?v=abc'})
+        assert platform.create_caption({'original_url': 'https://youtube.com/shorts/abc',
+                                        'webpage_url': 'https://www.youtube.com/watch?v=abc'}).video_url \
+            == 'https://youtube.com/shorts/abc'
+    
+    def test_youtube_parse_published_at(self):
+        """Test que publishedAt se convierte a timestamp Unix (UTC)."""
+        assert _parse_published_at('2006-05-17T20:57:45Z') == 1147899465
+        assert _parse_published_at('2006-05-17T20:57:45.123Z') == 1147899465
+        assert _parse_published_at('2006-05-17T22:57:45+02:00') == 1147899465
+        with pytest.raises(ValueError):
+            _parse_published_at('not-a-date')
+    
+    def test_youtube_get_channels_info_bulk_batches_api_calls(self, config):
+        """Test que get_channels_info_bulk resuelve varias URLs con una llamada por endpoint."""
+        config.YOUTUBE_API_KEY = 'test-key'
+        platform = YouTubePlatform(name='youtube', global_config=config)
+        urls = [
+            'https://www.youtube.com/watch?v=aaaaaaaaaaa',
+            'https://www.youtube.com/watch?v=bbbbbbbbbbb',
+            'https://www.youtube.com/shorts/ccccccccccc',
+        ]
+        
+        def fake_api_get(endpoint, params):
+            if endpoint == 'videos':
+                owners = {'aaaaaaaaaaa': 'UC1', 'bbbbbbbbbbb': 'UC2', 'ccccccccccc': 'UC1'}
+                return {'items': [{'id': vid, 'snippet': {'channelId': owners[vid]}} for vid in params['id'].split(',')]}
+            return {'items': [{'id': cid, 'snippet': {'title': f'Channel {cid}'}} for cid in params['id'].split(',')]}
+        
+        with patch.object(YouTubePlatform, '_api_get', side_effect=fake_api_get) as api_get:
+            results = platform.get_channels_info_bulk(urls)
+        
+        assert api_get.call_count == 2
+        assert [results[url]['channel_id'] for url in urls] == ['UC1', 'UC2', 'UC1']
+        assert results[urls[1]]['channel'] == 'Channel UC2'
+        
+        # Segunda llamada: todo sale de la caché local, sin llamadas a la API
+        with patch.object(YouTubePlatform, '_api_get', side_effect=fake_api_get) as api_get:
+            assert platform.get_channels_info_bulk(urls) == results
+        api_get.assert_not_called()
+        platform.close()
+    
+    def test_youtube_get_channels_info_bulk_keeps_partial_results(self, config):
+        """Test que un lote de /channels que falla no descarta los demás."""
+        config.YOUTUBE_API_KEY = 'test-key'
+        platform = YouTubePlatform(name='youtube', global_config=config)
+        urls = ['https://www.youtube.com/watch?v=aaaaaaaaaaa', 'https://www.youtube.com/watch?v=bbbbbbbbbbb']
+        
+        def fake_api_get(endpoint, params):
+            if endpoint == 'videos':
+                return {'items': [{'id': params['id'], 'snippet': {'channelId': f'UC-{params["id"][0]}'}}]}
+            if params['id'] == 'UC-b':
+                raise requests.exceptions.HTTPError('500 Server Error')
+            return {'items': [{'id': 'UC-a', 'snippet': {'title': 'Channel a'}}]}
+        
+        with patch.object(YouTubePlatform, 'API_BATCH_SIZE', 1), \
+                patch.object(YouTubePlatform, '_api_get', side_effect=fake_api_get):
+            results = platform.get_channels_info_bulk(urls)
+        
+        assert list(results) == [urls[0]]
+        assert results[urls[0]]['channel'] == 'Channel a'
+        platform.close()
+    
+    def test_youtube_cache_without_config_uses_state_dir(self, temp_dir, monkeypatch):
+        """Test que sin global_config la caché va al directorio de estado, no al directorio actual."""
+        monkeypatch.setenv('STATE_DIR', str(temp_dir / 'state'))
+        monkeypatch.chdir(temp_dir)
+        platform = YouTubePlatform(name='youtube')
+        
+        platform._api_cache()
+        platform.close()
+        
+        assert (temp_dir / 'state' / 'yt_channel').is_dir()
+        assert not (temp_dir / '.cache').exists()
+    
+    def test_youtube_stale_channel_revalidated_with_etag(self, config):
+        """Test que un canal caducado se revalida con If-None-Match y reutiliza la caché en 304."""
+        config.YOUTUBE_API_KEY = 'test-key'
+        platform = YouTubePlatform(name='youtube', global_config=config)
+        url = 'https://www.youtube.com/watch?v=aaaaaaaaaaa'
+        calls = []
+        
+        def fake_api_get(endpoint, params, etag=None):
+            calls.append((endpoint, etag))
+            if endpoint == 'videos':
+                return {'items': [{'id': 'aaaaaaaaaaa', 'snippet': {'channelId': 'UC1'}}]}
+            if etag == 'etag-1':
+                return None  # 304 Not Modified
+            return {'etag': 'etag-1', 'items': [{'id': 'UC1', 'snippet': {'title': 'Channel'}}]}
+        
+        with patch.object(YouTubePlatform, 'CHANNEL_CACHE_TTL', 0), \
+                patch.object(YouTubePlatform, '_api_get', side_effect=fake_api_get):
+            first = platform.get_channel_info(url)
+            second = platform.get_channel_info(url)
+        
+        assert first == second
+        assert calls == [('videos', None), ('channels', None), ('channels', 'etag-1')]
+        platform.close()
+    
+    @pytest.mark.asyncio
+    async def test_youtube_aget_channels_info_bulk(self, config):
+        """Test que aget_channels_info_bulk resuelve varias URLs con peticiones asíncronas."""
+        config.YOUTUBE_API_KEY = 'test-key'
+        platform = YouTubePlatform(name='youtube', global_config=config)
+        urls = [
+            'https://www.youtube.com/watch?v=aaaaaaaaaaa',
+            'https://www.youtube.com/watch?v=bbbbbbbbbbb',
+        ]
+        
+        async def fake_aapi_get(client, endpoint, params, etag=None):
+            ids = params['id'].split(',')
+            if endpoint == 'videos':
+                return {'items': [{'id': vid, 'snippet': {'channelId': f'UC-{vid[0]}'}} for vid in ids]}
+            return {'items': [{'id': cid, 'snippet': {'title': cid}} for cid in ids]}
+        
+        with patch.object(YouTubePlatform, '_aapi_get', side_effect=fake_aapi_get) as aapi_get:
+            results = await platform.aget_channels_info_bulk(urls)
+        
+        assert aapi_get.call_count == 2
+        assert [results[url]['channel'] for url in urls] == ['UC-a', 'UC-b']
+        platform.close()
+    
+    @pytest.mark.asyncio
+    async def test_youtube_aget_channels_info_bulk_keeps_partial_results(self, config):
+        """Test que aget_channels_info_bulk devuelve los lotes que no fallaron."""
+        config.YOUTUBE_API_KEY = 'test-key'
+        platform = YouTubePlatform(name='youtube', global_config=config)
+        urls = ['https://www.youtube.com/watch?v=aaaaaaaaaaa', 'https://www.youtube.com/watch?v=bbbbbbbbbbb']
+        
+        async def fake_aapi_get(client, endpoint, params, etag=None):
+            if endpoint == 'videos':
+                return {'items': [{'id': params['id'], 'snippet': {'channelId': f'UC-{params["id"][0]}'}}]}
+            if params['id'] == 'UC-b':
+                raise httpx.ConnectError('connection refused')
+            return {'items': [{'id': 'UC-a', 'snippet': {'title': 'Channel a'}}]}
+        
+        with patch.object(YouTubePlatform, 'API_BATCH_SIZE', 1), \
+                patch.object(YouTubePlatform, '_aapi_get', side_effect=fake_aapi_get):
+            results = await platform.aget_channels_info_bulk(urls)
+        
+        assert list(results) == [urls[0]]
+        platform.close()
+    
+    def test_youtube_api_get_retries_on_429(self, config):
+        """Test que _api_get reintenta con backoff ante 429 y consume cuota por intento."""
+        config.YOUTUBE_API_KEY = 'test-key'
+        platform = YouTubePlatform(name='youtube', global_config=config)
+        limited, ok = MagicMock(status_code=429), MagicMock(status_code=200)
+        ok.json.return_value = {'items': []}
+        session = MagicMock()
+        session.get.side_effect = [limited, ok]
+        
+        with patch.object(YouTubePlatform, '_api_session', return_value=session), \
+                patch('social.platforms.youtube.time.sleep') as sleep:
+            assert platform._api_get('channels', {'id': 'UC1'}) == {'items': []}
+        
+        assert session.get.call_count == 2
+        sleep.assert_called_once()
+        assert platform._quota.remaining == config.YOUTUBE_DAILY_QUOTA - 2
+        platform.close()
+    
+    def test_youtube_channel_urls_resolved_without_ydl(self, config):
+        """Test que /channel/ y @handle se resuelven sin yt-dlp; /c/ usa yt-dlp."""
+        config.YOUTUBE_API_KEY = 'test-key'
+        platform = YouTubePlatform(name='youtube', global_config=config)
+        channel_url = 'https://www.youtube.com/channel/UC' + 'x' * 22
+        handle_url = 'https://www.youtube.com/@some.handle'
+        custom_url = 'https://www.youtube.com/c/custom'
+        
+        with patch.object(YouTubePlatform, '_api_get', return_value={'items': [{'id': 'UC-handle'}]}) as api_get, \
+                patch.object(YouTubePlatform, '_get_channel_id_from_channel_url', return_value='UC-custom') as ydl:
+            result = platform._get_channel_ids_from_urls([channel_url, handle_url, custom_url])
+        
+        assert result == {channel_url: 'UC' + 'x' * 22, handle_url: 'UC-handle', custom_url: 'UC-custom'}
+        api_get.assert_called_once_with('channels', {'part': 'id', 'forHandle': '@some.handle'})
+        ydl.assert_called_once_with(custom_url)
+        platform.close()
+    
+    def test_youtube_channel_url_resolution_reuses_ydl(self, config):
+        """Test que las URLs de canal se resuelven con un único YoutubeDL reutilizado."""
+        platform = YouTubePlatform(name='youtube', global_config=config)
+        
+        with patch('social.core.thread_ydl.YoutubeDL') as ydl_class:
+            ydl_class.return_value.extract_info.return_value = {'channel_id': 'UC1'}
+            assert platform._get_channel_id_from_channel_url('https://www.youtube.com/@a') == 'UC1'
+            assert platform._get_channel_id_from_channel_url('https://www.youtube.com/@b') == 'UC1'
+            platform.close()
+        
+        ydl_class.assert_called_once()
+        ydl_class.return_value.close.assert_called_once()
 
 
 class TestVKPlatform:
@@ -161,6 +398,27 @@ class TestVKPlatform:
         
         assert 'format' in opts
         assert 'outtmpl' in opts
+    
+    def test_vk_platform_aria2c_opt_in(self, config):
+        """Test que VKPlatform usa aria2c solo si se activa en la configuración."""
+        assert 'external_downloader' not in VKPlatform(name='vk', global_config=config).get_ydl_opts()
+        
+        platform = VKPlatform(name='vk', config={'aria2c': True}, global_config=config)
+        opts = platform.get_ydl_opts()
+        
+        assert opts['external_downloader'] == 'aria2c'
+        assert opts['external_downloader_args'] == {'aria2c': Platform.ARIA2C_ARGS}
+
+    
+    def test_vk_create_caption_channel_url(self, config):
+        """Test que VKPlatform construye la URL de club o usuario desde uploader_id."""
+        platform = VKPlatform(name='vk', global_config=config)
+        
+        club = platform.create_caption({'id': '-232630765_456239063', 'title': 't'})
+        user = platform.create_caption({'uploader_id': 12345, 'title': 't'})
+        
+        assert club.channel_url == 'https://vk.com/club232630765'
+        assert user.channel_url == 'https://vk.com/id12345'
 
 
 class TestRutubePlatform:
@@ -182,6 +440,38 @@ class TestRutubePlatform:
         assert 'format' in opts
         assert 'outtmpl' in opts
 
+    
+    def test_rutube_create_caption_builds_channel_url(self, config):
+        """Test que RutubePlatform construye la URL del canal desde uploader_id."""
+        platform = RutubePlatform(name='rutube', global_config=config)
+        
+        caption = platform.create_caption({'title': 't', 'uploader': 'u', 'uploader_id': '42', 'upload_date': '20250101'})
+        
+        assert caption.channel_url == 'https://rutube.ru/channel/42/'
+        assert caption.channel_name == 'u'
+        assert caption.creation_date == datetime(2025, 1, 1)
+    
+    def test_rutube_extractor_error_keeps_concurrency(self, config):
+        """Test que un vídeo privado/eliminado no reduce la concurrencia."""
+        platform = RutubePlatform(name='rutube', global_config=config)
+        before = platform.extra_opts['concurrent_fragment_downloads']
+        cause = ExtractorError('Video is private', expected=True)
+        error = DownloadError(f'ERROR: {cause}', exc_info=(type(cause), cause, None))
+        
+        platform.record_download(None, 1.0, error=error)
+        
+        assert platform.extra_opts['concurrent_fragment_downloads'] == before
+    
+    def test_rutube_fragment_failure_backs_off(self, config):
+        """Test que un fallo de fragmentos reduce la concurrencia."""
+        platform = RutubePlatform(name='rutube', global_config=config)
+        before = platform.extra_opts['concurrent_fragment_downloads']
+        error = DownloadError('ERROR: fragment 3 not found, unable to continue')
+        
+        platform.record_download(None, 1.0, error=error)
+        
+        assert platform.extra_opts['concurrent_fragment_downloads'] < before
+
 
 class TestLoadPlatforms:
     """Tests para la función load_platforms."""
@@ -235,3 +525,21 @@ class TestLoadPlatforms:
         # Al menos debería tener las otras plataformas
         assert len(platforms) >= 0  # Puede que falle todas o ninguna
 
+    def test_get_platforms_shared_per_config(self, config):
+        """Test que get_platforms reutiliza las mismas instancias para una Config."""
+        first = get_platforms(config)
+        
+        assert get_platforms(config) is first
+        assert get_platforms(Config()) is not first
+
+    def test_get_platforms_released_with_config(self, config):
+        """Test que una Config descartada se libera junto con sus plataformas."""
+        other = Config()
+        platforms = get_platforms(other)
+        config_ref = weakref.ref(other)
+        youtube_id = id(platforms['youtube'])
+        del other, platforms
+        gc.collect()
+        
+        assert config_ref() is None
+        assert all(id(obj) != youtube_id for obj in gc.get_objects() if isinstance(obj, YouTubePlatform))
@@ -0,0 +1,40 @@
+"""Unit tests for QuotaBucket."""
+import pytest
+from unittest.mock import patch
+
+from social.core.quota_bucket import QuotaBucket, QuotaExceededError
+
+
+class TestQuotaBucket:
+    """Tests for QuotaBucket class."""
+
+    def test_consume_raises_when_daily_quota_exhausted(self):
+        """Test that consuming past the daily quota fails before the request."""
+        bucket = QuotaBucket(daily=2)
+        bucket.consume()
+        bucket.consume()
+
+        with pytest.raises(QuotaExceededError):
+            bucket.consume()
+        assert bucket.remaining == 0
+
+    def test_consume_sleeps_once_burst_is_spent(self):
+        """Test that calls beyond the burst wait for the bucket to refill."""
+        bucket = QuotaBucket(rate=10.0, burst=2)
+
+        with patch('social.core.quota_bucket.time.sleep') as sleep:
+            bucket.consume()
+            bucket.consume()
+            sleep.assert_not_called()
+            bucket.consume()
+
+        assert sleep.call_args[0][0] == pytest.approx(0.1, abs=0.01)
+
+    def test_quota_resets_after_reset_time(self):
+        """Test that the daily quota is restored once the reset time passes."""
+        bucket = QuotaBucket(daily=1)
+        bucket.consume()
+        bucket.reset_at = 0
+
+        bucket.consume()
+        assert bucket.remaining == 0
@@ -78,4 +78,16 @@ https://test.com/abc123"""
         
         metadata = RecoveryMetadataParser.parse(caption)
         assert metadata['title'] == '#Im block this is my block'
+    
+    def test_parse_plain_channel_format(self):
+        caption = """#Plain abc123 720p
+
+👀 [Channel: Plain Channel] (https://www.youtube.com/channel/UCplain)
+📅 01.02.2025
 
+https://www.youtube.com/watch?v=abc123"""
+        
+        metadata = RecoveryMetadataParser.parse(caption)
+        assert metadata['channel_name'] == 'Plain Channel'
+        assert metadata['channel_url'] == 'https://www.youtube.com/channel/UCplain'
+        assert metadata['upload_date'] == datetime(2025, 2, 1)
@@ -183,3 +183,117 @@ async def test_pipeline_uploads_sequential(config, mocker):
     assert len(upload_times) == 3
     assert len([r for r in results if r.get('upload_status') == 'success']) == 3
 
+
+@pytest.mark.asyncio
+async def test_pipeline_parallel_uploads_bounded(config, mocker):
+    """Test that max_parallel_uploads allows concurrent uploads up to the limit."""
+    service = SocialFlowService(config)
+    
+    active_uploads = [0]
+    max_active = [0]
+    
+    async def mock_download(url, platform=None):
+        await asyncio.sleep(0.01)
+        return {'id': f'video_{url}', 'extractor': 'youtube', 'ext': 'mp4'}
+    
+    async def mock_upload(options):
+        active_uploads[0] += 1
+        max_active[0] = max(max_active[0], active_uploads[0])
+        await asyncio.sleep(0.05)
+        active_uploads[0] -= 1
+    
+    test_path_mock = mocker.MagicMock()
+    test_path_mock.exists.return_value = True
+    test_path_mock.name = 'test.mp4'
+    
+    mocker.patch.object(service, '_download_video_async', side_effect=mock_download)
+    mocker.patch('social.services.social_flow_service.TelegramUploderService.upload', side_effect=mock_upload)
+    mocker.patch.object(service, '_get_downloaded_file_path', return_value=test_path_mock)
+    mocker.patch.object(service, '_determine_content_type', return_value=None)
+    
+    resolver_mock = mocker.MagicMock()
+    resolver_mock.resolve.return_value = (123, 456)
+    mocker.patch.object(service.entity_resolver_factory, 'get_resolver', return_value=resolver_mock)
+    
+    platform_mock = mocker.MagicMock()
+    platform_mock.name = 'youtube'
+    platform_mock.create_caption.return_value.build_caption.return_value = 'Test caption'
+    mocker.patch.object(service.downloader, '_get_platform_for_extractor', return_value=platform_mock)
+    
+    results = await service.process_videos_batch(
+        urls=[f'url_{i}' for i in range(6)],
+        telegram_client=mocker.AsyncMock(),
+        bot_client=mocker.AsyncMock(),
+        max_parallel=5,
+        max_parallel_uploads=2
+    )
+    
+    assert len([r for r in results if r.get('upload_status') == 'success']) == 6
+    assert max_active[0] == 2
+
+
+@pytest.mark.asyncio
+async def test_pipeline_results_keep_input_order(config, mocker):
+    """Test that results follow the URL order even when downloads finish out of order."""
+    service = SocialFlowService(config)
+    urls = [f'url_{i}' for i in range(4)]
+    
+    async def mock_download_and_prepare(url, platform, entity_id, topic_id):
+        await asyncio.sleep(0.01 * (len(urls) - urls.index(url)))
+        return {'success': url != 'url_1', 'url': url}
+    
+    mocker.patch.object(service, '_download_and_prepare', side_effect=mock_download_and_prepare)
+    
+    results = await service.process_videos_batch(urls=urls, max_parallel=4)
+    
+    assert [r['url'] for r in results] == urls
+
+
+def test_downloaded_file_path_prefers_info_dict(config, mocker):
+    """Test that yt-dlp's reported paths are used without touching the filesystem."""
+    service = SocialFlowService(config)
+    platform = mocker.MagicMock()
+    
+    assert service._get_downloaded_file_path({'filepath': '/d/a.mp4'}, platform) == Path('/d/a.mp4')
+    info_dict = {'requested_downloads': [{'filepath': '/d/a.f140.m4a'}, {'filepath': '/d/a.webm'}]}
+    assert service._get_downloaded_file_path(info_dict, platform) == Path('/d/a.webm')
+    platform.get_download_dir.assert_not_called()
+
+
+def test_resolve_cached_reuses_result_until_ttl(config, mocker):
+    """Test that entity/topic resolution is memoized per platform and content type."""
+    from social.core.entity_resolver import ContentType
+    
+    service = SocialFlowService(config)
+    resolver_mock = mocker.MagicMock()
+    resolver_mock.resolve.return_value = (123, 456)
+    get_resolver = mocker.patch.object(service.entity_resolver_factory, 'get_resolver', return_value=resolver_mock)
+    
+    assert service._resolve_cached('youtube', ContentType.SHORT) == (123, 456)
+    assert service._resolve_cached('youtube', ContentType.SHORT) == (123, 456)
+    assert get_resolver.call_count == 1
+    
+    mocker.patch.object(SocialFlowService, 'RESOLVE_TTL', 0.0)
+    service._resolve_cached('youtube', ContentType.SHORT)
+    assert get_resolver.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_pipeline_skips_duplicates_before_downloading(config, mocker):
+    """Test that duplicate URLs are filtered in one call and never downloaded."""
+    db_service = mocker.MagicMock()
+    db_service.filter_duplicates.return_value = {'https://youtu.be/dQw4w9WgXcQ'}
+    service = SocialFlowService(config, db_service=db_service)
+    urls = ['https://youtu.be/jNQXAC9IVRw', 'https://youtu.be/dQw4w9WgXcQ']
+    
+    async def mock_download_and_prepare(url, *args):
+        return {'success': False, 'url': url}
+    
+    prepare = mocker.patch.object(service, '_download_and_prepare', side_effect=mock_download_and_prepare)
+    
+    results = await service.process_videos_batch(urls=urls, max_parallel=2)
+    
+    db_service.filter_duplicates.assert_called_once_with(urls)
+    prepare.assert_called_once()
+    assert results[1]['duplicate'] is True
+    assert results[0]['url'] == urls[0]
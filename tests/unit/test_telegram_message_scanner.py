@@ -72,3 +72,19 @@ class TestTelegramMessageScanner:
         urls = scanner._extract_urls(text)
         assert len(urls) == 0
 
+    
+    @pytest.mark.asyncio
+    async def test_scan_group_propagates_fetch_error(self, scanner, mock_client):
+        mock_client.get_entity = AsyncMock(return_value=MagicMock())
+        
+        async def failing_iter():
+            msg = MagicMock()
+            msg.id = 1
+            msg.text = "https://youtu.be/abc"
+            yield msg
+            raise ConnectionError("lost")
+        
+        mock_client.iter_messages = MagicMock(return_value=failing_iter())
+        
+        with pytest.raises(ConnectionError):
+            await scanner.scan_group(123, limit=10)
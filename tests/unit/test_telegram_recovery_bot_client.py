@@ -5,6 +5,14 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from social.services.telegram_recovery_bot_client import TelegramRecoveryBotClient
 
 
+def _iter_download(*chunks):
+    """Build an iter_download replacement yielding the given chunks."""
+    async def iter_download(media, **kwargs):
+        for chunk in chunks:
+            yield chunk
+    return MagicMock(side_effect=iter_download)
+
+
 class TestTelegramRecoveryBotClient:
     """Test suite for TelegramRecoveryBotClient."""
     
@@ -12,6 +20,7 @@ class TestTelegramRecoveryBotClient:
     def mock_telegram_client(self):
         """Create a mock TelegramClient."""
         client = MagicMock()
+        client.get_input_entity = AsyncMock(return_value=MagicMock())
         return client
     
     @pytest.fixture
@@ -38,9 +47,9 @@ class TestTelegramRecoveryBotClient:
         mock_response2.message = mock_response2.text
         
         # Mock download
-        video_file = tmp_path / "test_video.mp4"
-        video_file.write_text("fake video content")
-        mock_response2.download_media = AsyncMock(return_value=str(video_file))
+        mock_response2.file.ext = '.mp4'
+        mock_response2.file.size = 18
+        mock_telegram_client.iter_download = _iter_download(b"fake video ", b"content")
         
         # Setup conversation mock
         mock_conv.send_message = AsyncMock()
@@ -58,7 +67,8 @@ class TestTelegramRecoveryBotClient:
         expected_path = tmp_path / "abc123.mp4"
         assert result_path == expected_path
         assert caption == mock_response2.text
-        assert expected_path.exists()
+        assert expected_path.read_bytes() == b"fake video content"
+        assert not (tmp_path / "abc123.mp4.part").exists()
     
     @pytest.mark.asyncio
     async def test_recover_video_not_found(self, bot_client, mock_telegram_client):
@@ -110,7 +120,8 @@ class TestTelegramRecoveryBotClient:
         mock_response2.document = None
         mock_response2.text = "Caption"
         mock_response2.message = "Caption"
-        mock_response2.download_media = AsyncMock(return_value=None)
+        mock_response2.file.ext = '.mp4'
+        mock_telegram_client.iter_download = _iter_download()
         
         mock_conv.send_message = AsyncMock()
         mock_conv.get_response = AsyncMock(side_effect=[mock_response1, mock_response2])
@@ -119,22 +130,21 @@ class TestTelegramRecoveryBotClient:
         
         with pytest.raises(ValueError):
             await bot_client.recover_video("https://youtube.com/watch?v=abc123", download_path=tmp_path)
+        assert list(tmp_path.iterdir()) == []
     
     @pytest.mark.asyncio
     async def test_check_bot_available_success(self, bot_client, mock_telegram_client):
         """Test checking bot availability when bot is available."""
-        mock_entity = MagicMock()
-        mock_entity.username = "Kyreth_hq_bot"
-        mock_telegram_client.get_entity = AsyncMock(return_value=mock_entity)
-        
-        result = await bot_client.check_bot_available()
+        assert await bot_client.check_bot_available() is True
+        assert await bot_client.check_bot_available() is True
         
-        assert result is True
+        # Peer resolved once and reused
+        mock_telegram_client.get_input_entity.assert_awaited_once_with(bot_client.BOT_USERNAME)
     
     @pytest.mark.asyncio
     async def test_check_bot_available_failure(self, bot_client, mock_telegram_client):
         """Test checking bot availability when bot is not available."""
-        mock_telegram_client.get_entity = AsyncMock(side_effect=Exception("Bot not found"))
+        mock_telegram_client.get_input_entity = AsyncMock(side_effect=Exception("Bot not found"))
         
         result = await bot_client.check_bot_available()
         
@@ -156,9 +166,8 @@ class TestTelegramRecoveryBotClient:
         mock_response2.text = "Caption"
         mock_response2.message = "Caption"
         
-        video_file = tmp_path / "test_video.mp4"
-        video_file.write_text("fake content")
-        mock_response2.download_media = AsyncMock(return_value=str(video_file))
+        mock_response2.file.ext = '.mp4'
+        mock_telegram_client.iter_download = _iter_download(b"fake content")
         
         mock_conv.send_message = AsyncMock()
         mock_conv.get_response = AsyncMock(side_effect=[mock_response1, mock_response2])
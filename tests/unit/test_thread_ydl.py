@@ -0,0 +1,53 @@
+"""Unit tests for ThreadLocalYDL."""
+import gc
+import threading
+from unittest.mock import MagicMock, patch
+
+from social.core.thread_ydl import ThreadLocalYDL
+
+
+class TestThreadLocalYDL:
+    """Tests for ThreadLocalYDL."""
+
+    def test_each_thread_gets_its_own_instance(self):
+        """Test that a thread never reuses another thread's YoutubeDL."""
+        ydls = ThreadLocalYDL()
+        seen = []
+
+        with patch('social.core.thread_ydl.YoutubeDL', side_effect=lambda opts: MagicMock()):
+            main = ydls.get('k', {'quiet': True})
+            assert ydls.get('k', {'quiet': True}) is main
+
+            thread = threading.Thread(target=lambda: seen.append(ydls.get('k', {'quiet': True})))
+            thread.start()
+            thread.join()
+
+        assert seen[0] is not main
+
+    def test_instances_closed_when_thread_ends(self):
+        """Test that a finished thread's YoutubeDL is closed and dropped."""
+        ydls = ThreadLocalYDL()
+
+        with patch('social.core.thread_ydl.YoutubeDL') as ydl_class:
+            thread = threading.Thread(target=lambda: ydls.get('k', {}))
+            thread.start()
+            thread.join()
+            del thread
+            gc.collect()
+
+            ydl_class.return_value.close.assert_called_once()
+            ydls.close()
+            ydl_class.return_value.close.assert_called_once()
+
+    def test_close_closes_every_thread(self):
+        """Test that close() reaches instances of live threads and the next get rebuilds."""
+        ydls = ThreadLocalYDL()
+
+        with patch('social.core.thread_ydl.YoutubeDL') as ydl_class:
+            ydls.get('a', {})
+            ydls.get('b', {})
+            ydls.close()
+            assert ydl_class.return_value.close.call_count == 2
+
+            ydls.get('a', {})
+            assert ydl_class.call_count == 3
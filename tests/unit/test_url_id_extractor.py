@@ -0,0 +1,29 @@
+"""Unit tests for URLIDExtractor."""
+from unittest.mock import patch
+
+from social.services import url_id_extractor
+from social.services.url_id_extractor import URLIDExtractor
+
+
+class TestURLIDExtractor:
+    """Tests for URLIDExtractor."""
+
+    def test_extract_id_known_platforms(self):
+        """Test that IDs are extracted from supported URLs without requests."""
+        assert URLIDExtractor.extract_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert URLIDExtractor.extract_id("https://www.tiktok.com/@user/video/1234567890") == "1234567890"
+
+    def test_extract_id_is_memoized(self):
+        """Test that a repeated URL does not walk the extractors again."""
+        url = "https://youtu.be/jNQXAC9IVRw"
+        assert URLIDExtractor.extract_id(url) == "jNQXAC9IVRw"
+
+        with patch.object(url_id_extractor, 'get_extractor_classes') as extractors:
+            assert URLIDExtractor.extract_id(url) == "jNQXAC9IVRw"
+
+        extractors.assert_not_called()
+
+    def test_extract_returns_platform_and_id(self):
+        """Test that platform and ID come from the same pass."""
+        assert URLIDExtractor.extract("https://vk.com/video-123456_789012") == ("vk", "-123456_789012")
+        assert URLIDExtractor.extract("https://example.org/video.mp4") == ("generic", None)
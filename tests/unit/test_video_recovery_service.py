@@ -208,3 +208,30 @@ https://www.youtube.com/watch?v=abc123"""
         assert result['success'] is True
         assert result['video_path'] == video_file
 
+    
+    @pytest.mark.asyncio
+    async def test_recover_video_retries_transient_errors(self, recovery_service, tmp_path):
+        video_file = tmp_path / "recovered_video.mp4"
+        video_file.write_text("fake video")
+        
+        recovery_service.bot_client.check_bot_available = AsyncMock(return_value=True)
+        recovery_service.bot_client.recover_video = AsyncMock(
+            side_effect=[ConnectionError("reset"), (video_file, "Caption")]
+        )
+        
+        with patch('social.services.video_recovery_service.asyncio.sleep', new=AsyncMock()) as sleep:
+            result = await recovery_service.recover_video("https://www.youtube.com/watch?v=abc123")
+        
+        assert result['success'] is True
+        assert recovery_service.bot_client.recover_video.await_count == 2
+        sleep.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_recover_video_does_not_retry_other_errors(self, recovery_service):
+        recovery_service.bot_client.check_bot_available = AsyncMock(return_value=True)
+        recovery_service.bot_client.recover_video = AsyncMock(side_effect=ValueError("Video not found"))
+        
+        result = await recovery_service.recover_video("https://www.youtube.com/watch?v=abc123")
+        
+        assert result['success'] is False
+        assert recovery_service.bot_client.recover_video.await_count == 1
@@ -0,0 +1,88 @@
+"""Unit tests for YT_Downloader."""
+import pytest
+from unittest.mock import patch
+
+from social.services.YT_Downloader import YT_Downloader
+
+
+class TestDetectPlatform:
+    """Tests for YT_Downloader._detect_platform_from_url."""
+
+    def test_known_hosts_skip_extractor_scan(self, config):
+        """Test that known domains resolve without scanning yt-dlp extractors."""
+        downloader = YT_Downloader(config)
+
+        with patch.object(YT_Downloader, '_extractors_cached') as extractors:
+            assert downloader._detect_platform_from_url("https://youtu.be/abc").name == 'youtube'
+            assert downloader._detect_platform_from_url("https://m.youtube.com/watch?v=abc").name == 'youtube'
+            assert downloader._detect_platform_from_url("https://www.tiktok.com/@u/video/1").name == 'tiktok'
+            assert downloader._detect_platform_from_url("https://vk.com/video-1_2").name == 'vk'
+
+        extractors.assert_not_called()
+
+    def test_unknown_host_falls_back_to_default(self, config):
+        """Test that unknown domains go through the extractors and end in the default platform."""
+        downloader = YT_Downloader(config)
+
+        with patch.object(YT_Downloader, '_extractors_cached', return_value=()):
+            platform = downloader._detect_platform_from_url("https://example.org/video.mp4")
+
+        assert platform.name == 'default'
+
+
+class TestDownloadMany:
+    """Tests for YT_Downloader.download_many."""
+
+    @pytest.mark.asyncio
+    async def test_download_many_keeps_order_and_errors(self, config):
+        """Test that results follow the URL order and failures are returned, not raised."""
+        downloader = YT_Downloader(config)
+
+        def fake_download(url):
+            if url == 'bad':
+                raise RuntimeError('boom')
+            return {'id': url}
+
+        with patch.object(YT_Downloader, 'download', side_effect=fake_download):
+            results = await downloader.download_many(['a', 'bad', 'b'], concurrency=2)
+
+        assert results[0] == {'id': 'a'}
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == {'id': 'b'}
+
+
+class TestPlatformForExtractor:
+    """Tests for YT_Downloader._get_platform_for_extractor."""
+
+    def test_extractor_lookup_is_cached(self, config):
+        """Test that each extractor name is resolved once and then served from the cache."""
+        downloader = YT_Downloader(config)
+
+        youtube = downloader._get_platform_for_extractor('youtube+plugin')
+        generic = downloader._get_platform_for_extractor('generic')
+
+        assert youtube.name == 'youtube'
+        assert generic.name == 'default'
+        assert downloader._extractor_platforms == {'youtube+plugin': youtube, 'generic': generic}
+        assert downloader._get_platform_for_extractor('youtube+plugin') is youtube
+
+
+class TestDownload:
+    """Tests for YT_Downloader.download."""
+
+    def test_download_reuses_ydl_until_options_change(self, config):
+        """Test that one YoutubeDL serves several downloads and is rebuilt when options change."""
+        downloader = YT_Downloader(config)
+        platform = downloader.platforms['youtube']
+
+        with patch('social.core.thread_ydl.YoutubeDL') as ydl_class:
+            ydl_class.return_value.extract_info.return_value = {'id': 'x'}
+            downloader.download("https://youtu.be/a", platform=platform, donwload=False)
+            downloader.download("https://youtu.be/b", platform=platform, donwload=False)
+            assert ydl_class.call_count == 1
+
+            with patch.dict(platform.extra_opts, {'concurrent_fragment_downloads': 8}):
+                downloader.download("https://youtu.be/c", platform=platform, donwload=False)
+
+        assert ydl_class.call_count == 2
+        ydl_class.return_value.close.assert_called_once()